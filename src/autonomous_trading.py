@@ -16,6 +16,7 @@ from rich.table import Table
 
 from .core.settings import get_settings
 from .core.types import TradingMode
+from .core.utils import install_event_loop
 from .data.ingestion import DataIngestionService
 from .streaming.binance_ws import BinanceWebSocket
 from .streaming.data_buffer import DataBuffer
@@ -405,6 +406,7 @@ def start(
     )
     
     # Run the bot
+    install_event_loop()
     try:
         asyncio.run(bot.start())
     except KeyboardInterrupt:
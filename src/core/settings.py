@@ -42,11 +42,20 @@ class LLMSettings(BaseSettings):
     gemini_model: str = Field(default="gemini-pro", description="Gemini model to use")
     gemini_max_tokens: int = Field(default=1000, description="Maximum tokens for Gemini")
     gemini_temperature: float = Field(default=0.1, description="Gemini temperature")
+    gemini_max_concurrent_requests: int = Field(default=8, description="Maximum concurrent Gemini requests per client")
     
     # Rate limiting
     max_requests_per_minute: int = Field(default=60, description="Maximum requests per minute")
     max_tokens_per_minute: int = Field(default=100000, description="Maximum tokens per minute")
     timeout_seconds: int = Field(default=30, description="Request timeout in seconds")
+    max_concurrent_requests: int = Field(default=16, description="Maximum concurrent requests per batch")
+    
+    # Response caching
+    response_cache_enabled: bool = Field(
+        default=False, description="Cache LLM responses on disk and replay them for identical prompts"
+    )
+    response_cache_ttl_seconds: int = Field(default=86400, description="LLM response cache TTL in seconds")
+    response_cache_max_temperature: float = Field(default=0.3, description="Highest temperature whose responses are cached")
     
     # Telegram integration
     telegram_bot_token: Optional[str] = Field(default=None, description="Telegram bot token")
@@ -96,6 +105,9 @@ class BinanceSettings(BaseSettings):
     # Rate limiting
     requests_per_minute: int = Field(default=1200, description="API requests per minute limit")
     orders_per_second: int = Field(default=10, description="Orders per second limit")
+    rate_limit_max_attempts: int = Field(default=5, description="Order attempts when throttled (HTTP 429)")
+    circuit_breaker_fail_max: int = Field(default=5, description="Consecutive rate-limit failures before failing fast")
+    circuit_breaker_reset_timeout: int = Field(default=60, description="Seconds to fail fast once the circuit opens")
     
     @validator("mode")
     def validate_mode(cls, v: str) -> str:
@@ -3,7 +3,7 @@
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional, Protocol, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Protocol, Union
 
 from pydantic import BaseModel, Field
 
@@ -66,6 +66,34 @@ class OHLCVData(BaseModel):
     symbol: str = Field(..., description="Trading symbol (e.g., BTCUSDT)")
 
 
+class FastOHLCV(NamedTuple):
+    """Float OHLCV data point for streaming consumers that do not need Decimals."""
+    
+    timestamp: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    symbol: str
+    
+    def to_ohlcv(self) -> OHLCVData:
+        """Convert to a validated OHLCVData with Decimal prices.
+        
+        Returns:
+            OHLCV data point
+        """
+        return OHLCVData(
+            timestamp=self.timestamp,
+            open=Decimal(str(self.open)),
+            high=Decimal(str(self.high)),
+            low=Decimal(str(self.low)),
+            close=Decimal(str(self.close)),
+            volume=Decimal(str(self.volume)),
+            symbol=self.symbol,
+        )
+
+
 class TechnicalIndicators(BaseModel):
     """Technical indicators calculated from OHLCV data."""
     
@@ -1,16 +1,40 @@
 """Utility functions and helpers."""
 
 import hashlib
+import json
 import secrets
 import time
+from collections import deque
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Deque, Dict, List, Optional, Union
 
 import structlog
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is an optional speedup
+    uvloop = None
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - h2 is an optional speedup
+    HTTP2_AVAILABLE = False
+
 logger = structlog.get_logger(__name__)
 
+# Fixed-point representation for monetary hot paths (satoshi-style, 1e-8 units)
+FIXED_POINT_DIGITS = 8
+FIXED_POINT_SCALE = 10 ** FIXED_POINT_DIGITS
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
 
 def generate_correlation_id() -> str:
     """Generate a unique correlation ID for request tracking.
@@ -23,6 +47,50 @@ def generate_correlation_id() -> str:
     return f"{timestamp}_{random_part}"
 
 
+class RandomTokenPool:
+    """Pool of random hex tokens generated in batches.
+    
+    Drawing a token is an O(1) ``popleft``; the CSPRNG is only called once
+    per ``batch_size`` tokens instead of once per token.
+    """
+    
+    def __init__(self, nbytes: int = 4, batch_size: int = 1024):
+        """Initialize the token pool.
+        
+        Args:
+            nbytes: Number of random bytes per token
+            batch_size: Number of tokens generated per refill
+        """
+        self.nbytes = nbytes
+        self.batch_size = batch_size
+        self._tokens: Deque[str] = deque()
+    
+    def __len__(self) -> int:
+        """Return the number of tokens left before the next refill."""
+        return len(self._tokens)
+    
+    def pop(self) -> str:
+        """Take the next random token, refilling the pool when empty.
+        
+        Returns:
+            Random hex token of ``2 * nbytes`` characters
+        """
+        try:
+            return self._tokens.popleft()
+        except IndexError:
+            self.refill()
+            return self._tokens.popleft()
+    
+    def refill(self) -> None:
+        """Generate a new batch of tokens with a single CSPRNG call."""
+        width = 2 * self.nbytes
+        blob = secrets.token_hex(self.nbytes * self.batch_size)
+        self._tokens.extend(blob[i:i + width] for i in range(0, len(blob), width))
+
+
+_client_order_id_tokens = RandomTokenPool(nbytes=4)
+
+
 def generate_client_order_id(symbol: str, side: str) -> str:
     """Generate a unique client order ID.
     
@@ -34,10 +102,93 @@ def generate_client_order_id(symbol: str, side: str) -> str:
         Unique client order ID
     """
     timestamp = int(time.time() * 1000)
-    random_part = secrets.token_hex(4)
+    random_part = _client_order_id_tokens.pop()
     return f"{symbol}_{side}_{timestamp}_{random_part}"
 
 
+def install_event_loop() -> bool:
+    """Use the uvloop event loop for ``asyncio.run`` when it is installed.
+    
+    Must be called before the event loop is created.
+    
+    Returns:
+        True if uvloop was installed
+    """
+    if uvloop is None:
+        return False
+    uvloop.install()
+    return True
+
+
+def json_loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Deserialize JSON, using orjson when it is installed.
+    
+    Args:
+        data: JSON document as text or bytes
+        
+    Returns:
+        Deserialized Python object
+        
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize types JSON does not support natively.
+    
+    Datetimes match orjson's ``OPT_UTC_Z | OPT_NAIVE_UTC`` output, so both
+    encoders produce the same document.
+    """
+    if isinstance(obj, datetime):
+        if obj.tzinfo is None:
+            obj = obj.replace(tzinfo=timezone.utc)
+        text = obj.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed.
+    
+    Datetimes are written as ISO 8601 (naive ones as UTC, UTC as ``Z``) and
+    decimals as strings.
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC)
+    return json.dumps(obj, default=_json_default, separators=(",", ":")).encode("utf-8")
+
+
+def is_log_enabled(bound_logger: Any, level: int) -> bool:
+    """Check whether a structlog logger would emit events at a level.
+    
+    Used to skip building expensive log keyword arguments (e.g. ``str(Decimal)``)
+    on hot paths when the level is filtered out.
+    
+    Args:
+        bound_logger: structlog logger (stdlib-backed or native)
+        level: Standard library logging level (e.g. ``logging.INFO``)
+        
+    Returns:
+        True if events at ``level`` are emitted (or the logger cannot tell)
+    """
+    is_enabled_for = getattr(bound_logger, "is_enabled_for", None) or getattr(bound_logger, "isEnabledFor", None)
+    if is_enabled_for is None:
+        return True
+    return bool(is_enabled_for(level))
+
+
 def mask_sensitive_data(data: Dict[str, Any], sensitive_keys: Optional[List[str]] = None) -> Dict[str, Any]:
     """Mask sensitive data in a dictionary.
     
@@ -66,6 +217,33 @@ def mask_sensitive_data(data: Dict[str, Any], sensitive_keys: Optional[List[str]
     return masked_data
 
 
+def to_fixed_point(value: Union[Decimal, float, int]) -> int:
+    """Convert a value to integer fixed-point units of ``1 / FIXED_POINT_SCALE``.
+    
+    Args:
+        value: Value to convert
+        
+    Returns:
+        Value scaled by ``FIXED_POINT_SCALE`` and rounded (half to even) to an integer
+    """
+    if isinstance(value, int):
+        return value * FIXED_POINT_SCALE
+    # round() of a Decimal or float product returns an int directly
+    return round(value * FIXED_POINT_SCALE)
+
+
+def from_fixed_point(units: int) -> Decimal:
+    """Convert integer fixed-point units back to a Decimal.
+    
+    Args:
+        units: Value in units of ``1 / FIXED_POINT_SCALE``
+        
+    Returns:
+        Decimal value
+    """
+    return Decimal(units) / FIXED_POINT_SCALE
+
+
 def calculate_percentage_change(old_value: Union[float, Decimal], new_value: Union[float, Decimal]) -> float:
     """Calculate percentage change between two values.
     
@@ -201,6 +379,23 @@ def parse_timestamp(timestamp: Union[str, int, float, datetime]) -> datetime:
     raise ValueError(f"Unsupported timestamp type: {type(timestamp)}")
 
 
+def epoch_ns(timestamp: datetime) -> int:
+    """Convert a datetime to integer nanoseconds since the epoch.
+    
+    Exact integer arithmetic, unlike ``timestamp() * 1e9``.
+    
+    Args:
+        timestamp: Datetime (naive values are taken as UTC)
+        
+    Returns:
+        Epoch nanoseconds
+    """
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    delta = timestamp - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1000
+
+
 def create_data_hash(data: Any) -> str:
     """Create a hash of data for caching and deduplication.
     
@@ -280,6 +475,23 @@ def clamp(value: Union[float, Decimal], min_value: Union[float, Decimal], max_va
     return value
 
 
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given in seconds.
+    
+    Args:
+        value: Header value
+        
+    Returns:
+        Seconds to wait, or None if missing or not numeric
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
 def retry_with_backoff(
     func,
     max_attempts: int = 3,
@@ -337,6 +549,63 @@ def retry_with_backoff(
     raise last_exception
 
 
+class CircuitBreaker:
+    """Minimal circuit breaker for calls to external services.
+    
+    After ``fail_max`` consecutive failures the circuit opens and callers
+    should fail fast until ``reset_timeout`` seconds have passed. The next
+    call is then let through as a trial: success closes the circuit, another
+    failure re-opens it immediately.
+    """
+    
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 60.0):
+        """Initialize the circuit breaker.
+        
+        Args:
+            fail_max: Consecutive failures before the circuit opens
+            reset_timeout: Seconds to keep the circuit open
+        """
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failure_count = 0
+        self._open_until = 0.0
+    
+    @property
+    def is_open(self) -> bool:
+        """Whether calls should currently fail fast."""
+        return time.monotonic() < self._open_until
+    
+    @property
+    def remaining_open_time(self) -> float:
+        """Seconds until the circuit allows a trial call."""
+        return max(0.0, self._open_until - time.monotonic())
+    
+    def record_success(self) -> None:
+        """Record a successful call and close the circuit."""
+        self.failure_count = 0
+        self._open_until = 0.0
+    
+    def record_failure(self, open_for: Optional[float] = None) -> None:
+        """Record a failed call.
+        
+        Args:
+            open_for: Force the circuit open for at least this many seconds
+                (e.g. a server-provided ``Retry-After``)
+        """
+        self.failure_count += 1
+        if open_for is not None or self.failure_count >= self.fail_max:
+            self.open(max(open_for or 0.0, self.reset_timeout))
+    
+    def open(self, duration: float) -> None:
+        """Open the circuit.
+        
+        Args:
+            duration: Seconds to keep the circuit open
+        """
+        self._open_until = max(self._open_until, time.monotonic() + duration)
+        logger.warning("Circuit breaker opened", failure_count=self.failure_count, open_seconds=duration)
+
+
 class PerformanceTimer:
     """Context manager for measuring execution time."""
     
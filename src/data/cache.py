@@ -15,6 +15,9 @@ from ..core.utils import create_data_hash
 
 logger = structlog.get_logger(__name__)
 
+# Bump when the layout of cached exchange info changes
+EXCHANGE_INFO_CACHE_VERSION = 1
+
 
 class CacheError(Exception):
     """Exception raised during cache operations."""
@@ -219,6 +222,64 @@ class DataCache:
             logger.error("Failed to cache market signals", error=str(e), cache_file=str(cache_file))
             raise CacheError(f"Failed to cache market signals: {e}")
     
+    def get_exchange_info(self, exchange_key: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Get cached exchange symbol information.
+        
+        Args:
+            exchange_key: Exchange environment key (e.g., testnet/live)
+            
+        Returns:
+            Cached ``{symbol: info}`` index or None if not found/expired
+        """
+        cache_file = self.cache_dir / f"exchange_info_{exchange_key}.pkl"
+        
+        if not cache_file.exists():
+            return None
+        
+        try:
+            with open(cache_file, "rb") as f:
+                cache_data = pickle.load(f)
+            
+            # Check cache format version and expiry
+            if cache_data.get("version") != EXCHANGE_INFO_CACHE_VERSION or self._is_cache_expired(cache_data.get("timestamp")):
+                self._remove_cache_file(cache_file)
+                return None
+            
+            logger.debug("Cache hit for exchange info", exchange_key=exchange_key)
+            return cache_data["symbols"]
+        
+        except Exception as e:
+            logger.warning("Failed to load cached exchange info", error=str(e), cache_file=str(cache_file))
+            self._remove_cache_file(cache_file)
+            return None
+    
+    def set_exchange_info(self, exchange_key: str, symbols: Dict[str, Dict[str, Any]]) -> None:
+        """Cache exchange symbol information.
+        
+        Args:
+            exchange_key: Exchange environment key (e.g., testnet/live)
+            symbols: ``{symbol: info}`` index built from the exchange info response
+        """
+        cache_file = self.cache_dir / f"exchange_info_{exchange_key}.pkl"
+        
+        try:
+            cache_data = {
+                "version": EXCHANGE_INFO_CACHE_VERSION,
+                "timestamp": datetime.now(timezone.utc),
+                "exchange_key": exchange_key,
+                "symbols": symbols,
+                "symbol_count": len(symbols),
+            }
+            
+            with open(cache_file, "wb") as f:
+                pickle.dump(cache_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            
+            logger.debug("Cached exchange info", exchange_key=exchange_key, symbol_count=len(symbols))
+        
+        except Exception as e:
+            logger.error("Failed to cache exchange info", error=str(e), cache_file=str(cache_file))
+            raise CacheError(f"Failed to cache exchange info: {e}")
+    
     def clear_expired_cache(self) -> int:
         """Clear expired cache files.
         
@@ -1,25 +1,111 @@
 """Binance API client for trade execution."""
 
+import logging
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type
 
 import structlog
-from binance.client import Client
-from binance.exceptions import BinanceAPIException, BinanceOrderException
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
 
 from ..core.settings import get_settings
 from ..core.types import OrderRequest, OrderResponse, OrderStatus, OrderSide, OrderType, TradingMode
-from ..core.utils import generate_client_order_id, mask_sensitive_data
+from ..core.utils import (
+    CircuitBreaker,
+    generate_client_order_id,
+    is_log_enabled,
+    json_loads,
+    mask_sensitive_data,
+    parse_retry_after,
+)
+from ..data.cache import CacheError, DataCache
+from .binance_rest import BinanceRESTClient, BinanceRESTError
+
+if TYPE_CHECKING:
+    from binance.client import Client
 
 logger = structlog.get_logger(__name__)
 
 
+# HTTP statuses Binance uses for request-weight throttling and IP bans
+RATE_LIMIT_STATUS = 429
+IP_BAN_STATUS = 418
+
+# Longest a retried order waits in-line; longer Retry-After values open the circuit instead
+MAX_RETRY_WAIT = 30.0
+
+_exponential_wait = wait_exponential(multiplier=0.5, max=MAX_RETRY_WAIT)
+
+
 class BinanceClientError(Exception):
     """Exception raised during Binance operations."""
     pass
 
 
+class BinanceRateLimitError(BinanceClientError):
+    """Exception raised when Binance throttles (429) or bans (418) the client."""
+    
+    def __init__(self, message: str, status_code: Optional[int] = None, retry_after: Optional[float] = None):
+        """Initialize the error.
+        
+        Args:
+            message: Error message
+            status_code: HTTP status code (429/418), None if raised by the open circuit
+            retry_after: Seconds Binance asked us to wait, if provided
+        """
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def _rate_limit_wait(retry_state: RetryCallState) -> float:
+    """Wait for ``Retry-After`` when Binance provides it, else back off exponentially.
+    
+    Either way the wait is capped at ``MAX_RETRY_WAIT``.
+    """
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(error, BinanceRateLimitError) and error.retry_after is not None:
+        return min(error.retry_after, MAX_RETRY_WAIT)
+    return _exponential_wait(retry_state)
+
+
+@lru_cache(maxsize=None)
+def _fast_json_client_class() -> Type["Client"]:
+    """Build the python-binance client class on first non-paper use.
+    
+    python-binance (and its requests/websocket/crypto dependencies) is only
+    imported here, so paper trading never pays for it.
+    
+    Returns:
+        Client subclass that decodes REST responses with orjson when available
+    """
+    from binance.client import Client
+    from binance.exceptions import BinanceAPIException, BinanceRequestException
+    
+    class _FastJSONClient(Client):
+        """python-binance client that decodes REST responses with orjson when available."""
+        
+        @staticmethod
+        def _handle_response(response):
+            """Raise on HTTP errors and decode the JSON body of a response."""
+            if not (200 <= response.status_code < 300):
+                raise BinanceAPIException(response, response.status_code, response.text)
+            try:
+                return json_loads(response.content)
+            except ValueError:
+                raise BinanceRequestException(f"Invalid Response: {response.text}")
+    
+    return _FastJSONClient
+
+
 class BinanceClient:
     """Binance API client for trade execution."""
     
@@ -31,7 +117,16 @@ class BinanceClient:
         """
         self.settings = get_settings()
         self.mode = mode
-        self.client: Optional[Client] = None
+        self.client: Optional["Client"] = None
+        self.rest_client: Optional[BinanceRESTClient] = None
+        self._symbol_index: Optional[Dict[str, Dict]] = None
+        self.circuit_breaker = CircuitBreaker(
+            fail_max=self.settings.binance.circuit_breaker_fail_max,
+            reset_timeout=self.settings.binance.circuit_breaker_reset_timeout,
+        )
+        
+        # Hot-path INFO logs are skipped entirely when INFO is filtered out
+        self._info_enabled = is_log_enabled(logger, logging.INFO)
         self._initialize_client()
     
     def _initialize_client(self) -> None:
@@ -49,9 +144,11 @@ class BinanceClient:
             raise BinanceClientError("Binance API credentials are required for non-paper trading")
         
         try:
+            client_class = _fast_json_client_class()
+            
             if self.mode == TradingMode.TESTNET:
                 # Testnet mode
-                self.client = Client(
+                self.client = client_class(
                     api_key=api_key,
                     api_secret=secret_key,
                     testnet=True
@@ -59,11 +156,14 @@ class BinanceClient:
                 logger.info("Initialized Binance testnet client")
             elif self.mode == TradingMode.LIVE:
                 # Live trading mode
-                self.client = Client(
+                self.client = client_class(
                     api_key=api_key,
                     api_secret=secret_key
                 )
                 logger.info("Initialized Binance live client")
+            
+            # HTTP/2 client for concurrent order placement
+            self.rest_client = BinanceRESTClient(api_key, secret_key, self.mode)
         except Exception as e:
             logger.error("Failed to initialize Binance client", error=str(e))
             raise BinanceClientError(f"Failed to initialize Binance client: {e}")
@@ -83,49 +183,21 @@ class BinanceClient:
         if not self.client:
             raise BinanceClientError("Binance client not initialized")
         
+        from binance.exceptions import BinanceAPIException, BinanceOrderException
+        
+        self._check_circuit()
+        
         try:
-            # Generate client order ID if not provided
-            if not order_request.client_order_id:
-                order_request.client_order_id = generate_client_order_id(
-                    order_request.symbol,
-                    order_request.side.value
-                )
+            order_params = self._build_order_params(order_request)
             
-            # Prepare order parameters
-            order_params = {
-                "symbol": order_request.symbol,
-                "side": order_request.side.value,
-                "type": order_request.order_type.value,
-                "quantity": str(order_request.quantity),
-                "timeInForce": order_request.time_in_force,
-            }
-            
-            # Add price for limit orders
-            if order_request.price:
-                order_params["price"] = str(order_request.price)
-            
-            # Add stop price for stop orders
-            if order_request.stop_price:
-                order_params["stopPrice"] = str(order_request.stop_price)
-            
-            # Add client order ID
-            order_params["newClientOrderId"] = order_request.client_order_id
-            
-            # Place order
-            logger.info(
-                "Placing order",
-                symbol=order_request.symbol,
-                side=order_request.side.value,
-                type=order_request.order_type.value,
-                quantity=str(order_request.quantity),
-                client_order_id=order_request.client_order_id,
-            )
-            
-            response = self.client.create_order(**order_params)
+            # Place order, backing off while Binance throttles us
+            response = self._order_retrying()(self._create_order, order_params)
             
             # Convert response to our format
             return self._convert_order_response(response)
         
+        except BinanceRateLimitError:
+            raise
         except BinanceAPIException as e:
             logger.error("Binance API error", error=str(e), code=e.code)
             raise BinanceClientError(f"Binance API error: {e}")
@@ -136,6 +208,44 @@ class BinanceClient:
             logger.error("Unexpected error placing order", error=str(e))
             raise BinanceClientError(f"Unexpected error: {e}")
     
+    async def place_order_async(self, order_request: OrderRequest) -> OrderResponse:
+        """Place an order on Binance without blocking the event loop.
+        
+        Orders placed concurrently share one HTTP/2 connection.
+        
+        Args:
+            order_request: Order request details
+            
+        Returns:
+            Order response from Binance
+        """
+        if self.mode == TradingMode.PAPER:
+            return self._simulate_order(order_request)
+        
+        if not self.rest_client:
+            raise BinanceClientError("Binance client not initialized")
+        
+        self._check_circuit()
+        
+        try:
+            order_params = self._build_order_params(order_request)
+            response = await self._order_retrying(asynchronous=True)(self._create_order_async, order_params)
+            return self._convert_order_response(response)
+        
+        except BinanceRateLimitError:
+            raise
+        except BinanceRESTError as e:
+            logger.error("Binance API error", error=str(e), code=e.code, status_code=e.status_code)
+            raise BinanceClientError(f"Binance API error: {e}")
+        except Exception as e:
+            logger.error("Unexpected error placing order", error=str(e))
+            raise BinanceClientError(f"Unexpected error: {e}")
+    
+    async def close(self) -> None:
+        """Close network connections held by the client."""
+        if self.rest_client:
+            await self.rest_client.aclose()
+    
     def get_order_status(self, symbol: str, order_id: str) -> OrderResponse:
         """Get order status from Binance.
         
@@ -249,14 +359,197 @@ class BinanceClient:
             raise BinanceClientError("Binance client not initialized")
         
         try:
-            exchange_info = self.client.get_exchange_info()
-            for symbol_info in exchange_info["symbols"]:
-                if symbol_info["symbol"] == symbol:
-                    return symbol_info
-            raise BinanceClientError(f"Symbol {symbol} not found")
+            symbol_info = self._get_symbol_index().get(symbol)
         except Exception as e:
             logger.error("Failed to get symbol info", error=str(e))
             raise BinanceClientError(f"Failed to get symbol info: {e}")
+        
+        if symbol_info is None:
+            raise BinanceClientError(f"Symbol {symbol} not found")
+        return symbol_info
+    
+    def _get_symbol_index(self) -> Dict[str, Dict]:
+        """Get exchange symbol information indexed by symbol.
+        
+        The index is kept in memory and persisted through the data cache so
+        that restarts within the cache TTL skip the exchange info download.
+        
+        Returns:
+            Dictionary mapping symbols to their exchange information
+        """
+        if self._symbol_index is not None:
+            return self._symbol_index
+        
+        cache = DataCache()
+        symbol_index = cache.get_exchange_info(self.mode.value)
+        
+        if symbol_index is None:
+            exchange_info = self.client.get_exchange_info()
+            symbol_index = {info["symbol"]: info for info in exchange_info["symbols"]}
+            try:
+                cache.set_exchange_info(self.mode.value, symbol_index)
+            except CacheError as e:
+                logger.warning("Failed to persist exchange info", error=str(e))
+        
+        self._symbol_index = symbol_index
+        return symbol_index
+    
+    def _create_order(self, order_params: Dict[str, str]) -> Dict[str, Any]:
+        """Send one order request through python-binance.
+        
+        Args:
+            order_params: Binance order parameters
+            
+        Returns:
+            Raw Binance order response
+        """
+        from binance.exceptions import BinanceAPIException
+        
+        try:
+            response = self.client.create_order(**order_params)
+        except BinanceAPIException as e:
+            if e.status_code in (RATE_LIMIT_STATUS, IP_BAN_STATUS):
+                headers = getattr(e.response, "headers", None) or {}
+                self._on_rate_limited(e.status_code, parse_retry_after(headers.get("Retry-After")), e)
+            raise
+        
+        self.circuit_breaker.record_success()
+        return response
+    
+    async def _create_order_async(self, order_params: Dict[str, str]) -> Dict[str, Any]:
+        """Send one order request through the HTTP/2 REST client.
+        
+        Args:
+            order_params: Binance order parameters
+            
+        Returns:
+            Raw Binance order response
+        """
+        try:
+            response = await self.rest_client.create_order(order_params)
+        except BinanceRESTError as e:
+            if e.status_code in (RATE_LIMIT_STATUS, IP_BAN_STATUS):
+                self._on_rate_limited(e.status_code, e.retry_after, e)
+            raise
+        
+        self.circuit_breaker.record_success()
+        return response
+    
+    def _on_rate_limited(self, status_code: int, retry_after: Optional[float], error: Exception) -> None:
+        """Record a throttled response and raise it as a rate-limit error.
+        
+        An IP ban (418), or throttling (429) with a ``Retry-After`` longer
+        than ``MAX_RETRY_WAIT``, opens the circuit straight away for the
+        advertised duration, so the order fails fast instead of sleeping in
+        the retry. Other throttling counts towards the breaker threshold.
+        
+        Args:
+            status_code: HTTP status code (429/418)
+            retry_after: Seconds from the ``Retry-After`` header, if present
+            error: Original exception
+            
+        Raises:
+            BinanceRateLimitError: Always
+        """
+        logger.warning("Binance rate limit hit", status_code=status_code, retry_after=retry_after)
+        long_wait = retry_after is not None and retry_after > MAX_RETRY_WAIT
+        self.circuit_breaker.record_failure(
+            open_for=retry_after if status_code == IP_BAN_STATUS or long_wait else None
+        )
+        raise BinanceRateLimitError(
+            f"Binance rate limit (HTTP {status_code}): {error}",
+            status_code=status_code,
+            retry_after=retry_after,
+        ) from error
+    
+    def _check_circuit(self) -> None:
+        """Fail fast while the rate-limit circuit breaker is open.
+        
+        Raises:
+            BinanceRateLimitError: If the circuit is open
+        """
+        if self.circuit_breaker.is_open:
+            raise BinanceRateLimitError(
+                "Binance circuit breaker is open after repeated rate limiting",
+                retry_after=self.circuit_breaker.remaining_open_time,
+            )
+    
+    def _order_retrying(self, asynchronous: bool = False) -> Callable:
+        """Build the retry policy for order placement.
+        
+        Only throttling (429) is retried, waiting for ``Retry-After`` when
+        given and backing off exponentially otherwise, for at most
+        ``MAX_RETRY_WAIT`` seconds. IP bans and an open circuit are not
+        retried.
+        
+        Args:
+            asynchronous: Build an ``AsyncRetrying`` instead of ``Retrying``
+            
+        Returns:
+            Tenacity retrying object, called with the function and its arguments
+        """
+        def should_retry(error: BaseException) -> bool:
+            return (
+                isinstance(error, BinanceRateLimitError)
+                and error.status_code == RATE_LIMIT_STATUS
+                and not self.circuit_breaker.is_open
+            )
+        
+        retrying_class = AsyncRetrying if asynchronous else Retrying
+        return retrying_class(
+            retry=retry_if_exception(should_retry),
+            wait=_rate_limit_wait,
+            stop=stop_after_attempt(self.settings.binance.rate_limit_max_attempts),
+            reraise=True,
+        )
+    
+    def _build_order_params(self, order_request: OrderRequest) -> Dict[str, str]:
+        """Build Binance order parameters from an order request.
+        
+        Args:
+            order_request: Order request details
+            
+        Returns:
+            Binance order parameters
+        """
+        # Generate client order ID if not provided
+        if not order_request.client_order_id:
+            order_request.client_order_id = generate_client_order_id(
+                order_request.symbol,
+                order_request.side.value
+            )
+        
+        # Prepare order parameters
+        order_params = {
+            "symbol": order_request.symbol,
+            "side": order_request.side.value,
+            "type": order_request.order_type.value,
+            "quantity": str(order_request.quantity),
+            "timeInForce": order_request.time_in_force,
+        }
+        
+        # Add price for limit orders
+        if order_request.price:
+            order_params["price"] = str(order_request.price)
+        
+        # Add stop price for stop orders
+        if order_request.stop_price:
+            order_params["stopPrice"] = str(order_request.stop_price)
+        
+        # Add client order ID
+        order_params["newClientOrderId"] = order_request.client_order_id
+        
+        if self._info_enabled:
+            logger.info(
+                "Placing order",
+                symbol=order_request.symbol,
+                side=order_request.side.value,
+                type=order_request.order_type.value,
+                quantity=str(order_request.quantity),
+                client_order_id=order_request.client_order_id,
+            )
+        
+        return order_params
     
     def _simulate_order(self, order_request: OrderRequest) -> OrderResponse:
         """Simulate order execution for paper trading.
@@ -267,13 +560,14 @@ class BinanceClient:
         Returns:
             Simulated order response
         """
-        logger.info(
-            "Simulating order",
-            symbol=order_request.symbol,
-            side=order_request.side.value,
-            type=order_request.order_type.value,
-            quantity=str(order_request.quantity),
-        )
+        if self._info_enabled:
+            logger.info(
+                "Simulating order",
+                symbol=order_request.symbol,
+                side=order_request.side.value,
+                type=order_request.order_type.value,
+                quantity=str(order_request.quantity),
+            )
         
         # Simulate immediate fill for paper trading
         return OrderResponse(
@@ -308,5 +602,5 @@ class BinanceClient:
             price=Decimal(str(response["price"])) if response["price"] != "0.00000000" else None,
             executed_quantity=Decimal(str(response["executedQty"])),
             executed_price=Decimal(str(response["cummulativeQuoteQty"])) / Decimal(str(response["executedQty"])) if response["executedQty"] != "0" else None,
-            timestamp=datetime.fromtimestamp(response["time"] / 1000, tz=timezone.utc),
+            timestamp=datetime.fromtimestamp(response.get("time", response.get("transactTime")) / 1000, tz=timezone.utc),
         )
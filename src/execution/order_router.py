@@ -1,19 +1,32 @@
 """Order router for managing trade execution with different modes."""
 
+import logging
+from collections import deque
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional
 
 import structlog
 
 from ..core.settings import get_settings
 from ..core.types import OrderRequest, OrderResponse, TradingDecision, TradingMode, TradingSession
-from ..core.utils import generate_correlation_id, generate_client_order_id
+from ..core.utils import (
+    FIXED_POINT_SCALE,
+    from_fixed_point,
+    generate_client_order_id,
+    generate_correlation_id,
+    is_log_enabled,
+    to_fixed_point,
+)
 from .binance_client import BinanceClient
+from .order_table import ActiveOrderTable
 from .risk_manager import RiskManager
 
 logger = structlog.get_logger(__name__)
 
+# Number of executed orders buffered before session counters are folded in
+STATS_FLUSH_BATCH_SIZE = 32
+
 
 class OrderRouterError(Exception):
     """Exception raised during order routing operations."""
@@ -34,7 +47,17 @@ class OrderRouter:
         self.binance_client = BinanceClient(mode)
         self.risk_manager = RiskManager(mode)
         self.session: Optional[TradingSession] = None
-        self.active_orders: Dict[str, OrderResponse] = {}
+        self.active_orders = ActiveOrderTable()
+        # Executed orders not yet counted in the session statistics
+        self._pending_stats: Deque[OrderResponse] = deque()
+        
+        # Session balances in fixed-point units, kept current per fill and
+        # copied to the session as Decimals once per flush
+        self._initial_balance_units = 0
+        self._balance_units = 0
+        
+        # Hot-path INFO logs are skipped entirely when INFO is filtered out
+        self._info_enabled = is_log_enabled(logger, logging.INFO)
     
     def start_session(self, strategy_name: str, initial_balance: Decimal) -> str:
         """Start a new trading session.
@@ -47,6 +70,9 @@ class OrderRouter:
             Session ID
         """
         session_id = generate_correlation_id()
+        self._pending_stats.clear()
+        self._initial_balance_units = to_fixed_point(initial_balance)
+        self._balance_units = self._initial_balance_units
         
         self.session = TradingSession(
             session_id=session_id,
@@ -76,6 +102,7 @@ class OrderRouter:
         if not self.session:
             return None
         
+        self._flush_session_stats()
         self.session.end_time = datetime.now(timezone.utc)
         
         logger.info(
@@ -133,8 +160,12 @@ class OrderRouter:
             order_response = self._execute_order(order_request)
             
             if order_response:
-                # Update session statistics
-                self._update_session_stats(order_response)
+                # The balance is updated now for the next risk check; session
+                # counters and Decimal fields are folded in batches
+                self._apply_fill(order_response, *self.active_orders.executed_units(order_response.order_id))
+                self._pending_stats.append(order_response)
+                if len(self._pending_stats) >= STATS_FLUSH_BATCH_SIZE:
+                    self._flush_session_stats()
                 
                 # Record trade for risk management
                 order_value = order_response.quantity * (order_response.executed_price or order_response.price or Decimal("0"))
@@ -155,8 +186,9 @@ class OrderRouter:
         Returns:
             Order response or None if not found
         """
-        if order_id in self.active_orders:
-            return self.active_orders[order_id]
+        active_order = self.active_orders.get(order_id)
+        if active_order is not None:
+            return active_order
         
         try:
             # Query from exchange
@@ -177,8 +209,8 @@ class OrderRouter:
         """
         try:
             success = self.binance_client.cancel_order("", order_id)  # Symbol not needed for order ID lookup
-            if success and order_id in self.active_orders:
-                del self.active_orders[order_id]
+            if success:
+                self.active_orders.cancel(order_id)
             return success
         except Exception as e:
             logger.error("Failed to cancel order", order_id=order_id, error=str(e))
@@ -193,6 +225,8 @@ class OrderRouter:
         if not self.session:
             return None
         
+        self._flush_session_stats()
+        
         return {
             "session_id": self.session.session_id,
             "strategy": self.session.strategy,
@@ -203,6 +237,7 @@ class OrderRouter:
             "current_balance": str(self.session.current_balance),
             "pnl": str(self.session.pnl),
             "active_orders": len(self.active_orders),
+            "active_notional": self.active_orders.notional(),
             "risk_status": self.risk_manager.get_risk_status(),
         }
     
@@ -220,16 +255,17 @@ class OrderRouter:
             order_response = self.binance_client.place_order(order_request)
             
             # Store in active orders
-            self.active_orders[order_response.order_id] = order_response
+            self.active_orders.add(order_response)
             
-            logger.info(
-                "Order executed successfully",
-                order_id=order_response.order_id,
-                symbol=order_response.symbol,
-                side=order_response.side.value,
-                quantity=str(order_response.quantity),
-                status=order_response.status.value,
-            )
+            if self._info_enabled:
+                logger.info(
+                    "Order executed successfully",
+                    order_id=order_response.order_id,
+                    symbol=order_response.symbol,
+                    side=order_response.side.value,
+                    quantity=str(order_response.quantity),
+                    status=order_response.status.value,
+                )
             
             return order_response
         
@@ -247,11 +283,24 @@ class OrderRouter:
             return Decimal("0")
         
         # In a real implementation, this would query the exchange
-        # For now, return the session's current balance
-        return self.session.current_balance
+        # For now, return the session balance, which already includes every fill
+        return from_fixed_point(self._balance_units)
+    
+    def _flush_session_stats(self) -> None:
+        """Fold all pending executed orders into the session statistics."""
+        if not self._pending_stats:
+            return
+        
+        while self._pending_stats:
+            self._update_session_stats(self._pending_stats.popleft())
+        
+        if self.session:
+            self.session.current_balance = from_fixed_point(self._balance_units)
+            # Calculate PnL (simplified)
+            self.session.pnl = from_fixed_point(self._balance_units - self._initial_balance_units)
     
     def _update_session_stats(self, order_response: OrderResponse) -> None:
-        """Update session statistics after order execution.
+        """Update session trade counters after order execution.
         
         Args:
             order_response: Executed order response
@@ -264,14 +313,20 @@ class OrderRouter:
         # Consider order successful if it's filled
         if order_response.status.value in ["FILLED", "PARTIALLY_FILLED"]:
             self.session.successful_trades += 1
+    
+    def _apply_fill(self, order_response: OrderResponse, quantity_units: int, price_units: int) -> None:
+        """Update the fixed-point session balance for an executed order.
         
+        Args:
+            order_response: Executed order response
+            quantity_units: Executed quantity in fixed-point units
+            price_units: Executed price in fixed-point units (0 if unknown)
+        """
         # Update balance (simplified - would need proper PnL calculation)
-        if order_response.executed_quantity > 0:
-            order_value = order_response.executed_quantity * (order_response.executed_price or Decimal("0"))
+        if quantity_units > 0 and price_units:
+            # Round half up on the unsigned value so BUY and SELL move the balance symmetrically
+            order_value = (quantity_units * price_units + FIXED_POINT_SCALE // 2) // FIXED_POINT_SCALE
             if order_response.side.value == "BUY":
-                self.session.current_balance -= order_value
+                self._balance_units -= order_value
             else:  # SELL
-                self.session.current_balance += order_value
-        
-        # Calculate PnL (simplified)
-        self.session.pnl = self.session.current_balance - self.session.initial_balance
+                self._balance_units += order_value
@@ -0,0 +1,209 @@
+"""Columnar storage for orders tracked by the order router."""
+
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..core.types import OrderResponse, OrderSide, OrderStatus
+from ..core.utils import to_fixed_point
+
+# Integer codes for the enum columns, in declaration order
+_STATUSES: List[OrderStatus] = list(OrderStatus)
+_SIDES: List[OrderSide] = list(OrderSide)
+_STATUS_CODES: Dict[OrderStatus, int] = {status: code for code, status in enumerate(_STATUSES)}
+_SIDE_CODES: Dict[OrderSide, int] = {side: code for code, side in enumerate(_SIDES)}
+_CANCELED = _STATUS_CODES[OrderStatus.CANCELED]
+
+
+def _to_float(value: Optional[Decimal]) -> float:
+    """Convert an optional Decimal to float, using NaN for missing values."""
+    return float("nan") if value is None else float(value)
+
+
+class ActiveOrderTable:
+    """Struct-of-arrays table of active orders.
+    
+    Numeric fields are copied into parallel NumPy arrays and looked up through
+    an ``order_id -> row`` index, so aggregate queries (notional exposure) are
+    single vectorized reductions instead of loops over ``OrderResponse``
+    objects. The float columns only feed those aggregates; the original
+    responses are kept per row so :meth:`get` returns the exchange's exact
+    Decimal values. Cancelled orders are marked in the status column rather
+    than removed; their rows are reclaimed by :meth:`compact` once they
+    outnumber the active ones. Executed quantity and price are also kept as
+    fixed-point integers for exact session accounting.
+    """
+    
+    def __init__(self, initial_capacity: int = 64):
+        """Initialize the order table.
+        
+        Args:
+            initial_capacity: Number of rows to preallocate
+        """
+        capacity = max(1, initial_capacity)
+        self.ids: List[str] = []
+        self.orders: List[OrderResponse] = []
+        self.idx: Dict[str, int] = {}
+        self._live = 0
+        # Object dtype: a fixed-width string dtype would silently truncate symbols
+        self.symbols = np.full(capacity, "", dtype=object)
+        self.side = np.zeros(capacity, dtype=np.uint8)
+        self.status = np.zeros(capacity, dtype=np.uint8)
+        self.qty = np.zeros(capacity, dtype=np.float64)
+        self.price = np.full(capacity, np.nan, dtype=np.float64)
+        self.executed_qty = np.zeros(capacity, dtype=np.float64)
+        self.executed_price = np.full(capacity, np.nan, dtype=np.float64)
+        self.executed_qty_units = np.zeros(capacity, dtype=np.int64)
+        self.executed_price_units = np.zeros(capacity, dtype=np.int64)
+        self.timestamp = np.zeros(capacity, dtype=np.float64)
+    
+    def __len__(self) -> int:
+        """Return the number of active (non-cancelled) orders."""
+        return self._live
+    
+    def __contains__(self, order_id: object) -> bool:
+        """Check whether an order is tracked and still active."""
+        row = self.idx.get(order_id)  # type: ignore[arg-type]
+        return row is not None and self.status[row] != _CANCELED
+    
+    @property
+    def capacity(self) -> int:
+        """Number of allocated rows."""
+        return len(self.qty)
+    
+    def add(self, order: OrderResponse) -> int:
+        """Insert or update an order.
+        
+        Args:
+            order: Order response to store
+            
+        Returns:
+            Row index of the order
+        """
+        row = self.idx.get(order.order_id)
+        if row is None:
+            row = len(self.ids)
+            if row == self.capacity:
+                self._grow()
+            self.ids.append(order.order_id)
+            self.orders.append(order)
+            self.idx[order.order_id] = row
+        else:
+            if self.status[row] != _CANCELED:
+                self._live -= 1
+            self.orders[row] = order
+        
+        status = _STATUS_CODES[order.status]
+        if status != _CANCELED:
+            self._live += 1
+        self.symbols[row] = order.symbol
+        self.side[row] = _SIDE_CODES[order.side]
+        self.status[row] = status
+        self.qty[row] = float(order.quantity)
+        self.price[row] = _to_float(order.price)
+        self.executed_qty[row] = float(order.executed_quantity)
+        self.executed_price[row] = _to_float(order.executed_price)
+        self.executed_qty_units[row] = to_fixed_point(order.executed_quantity)
+        self.executed_price_units[row] = 0 if order.executed_price is None else to_fixed_point(order.executed_price)
+        self.timestamp[row] = order.timestamp.timestamp()
+        return row
+    
+    def get(self, order_id: str) -> Optional[OrderResponse]:
+        """Get the order response for an active order.
+        
+        Args:
+            order_id: Order ID
+            
+        Returns:
+            Order response or None if not found or cancelled
+        """
+        if order_id not in self:
+            return None
+        return self.orders[self.idx[order_id]]
+    
+    def executed_units(self, order_id: str) -> Tuple[int, int]:
+        """Get the executed quantity and price of a tracked order in fixed-point units.
+        
+        Args:
+            order_id: Order ID
+            
+        Returns:
+            Tuple of (quantity units, price units); price is 0 when unknown
+        """
+        row = self.idx[order_id]
+        return int(self.executed_qty_units[row]), int(self.executed_price_units[row])
+    
+    def cancel(self, order_id: str) -> bool:
+        """Mark an order as cancelled.
+        
+        Args:
+            order_id: Order ID
+            
+        Returns:
+            True if an active order was cancelled
+        """
+        if order_id not in self:
+            return False
+        self.status[self.idx[order_id]] = _CANCELED
+        self._live -= 1
+        
+        # Reclaim rows once cancelled orders dominate the table
+        if 2 * self._live < len(self.ids):
+            self.compact()
+        return True
+    
+    def notional(self) -> float:
+        """Total executed notional value of active orders."""
+        n = len(self.ids)
+        mask = self._active_mask() & ~np.isnan(self.executed_price[:n])
+        return float((self.executed_qty[:n][mask] * self.executed_price[:n][mask]).sum())
+    
+    def compact(self) -> None:
+        """Drop cancelled rows and rebuild the index."""
+        keep = np.flatnonzero(self._active_mask())
+        self.ids = [self.ids[i] for i in keep]
+        self.orders = [self.orders[i] for i in keep]
+        self.idx = {order_id: row for row, order_id in enumerate(self.ids)}
+        for column in self._columns():
+            column[: len(keep)] = column[keep]
+    
+    def _active_mask(self) -> np.ndarray:
+        """Boolean mask of active rows among the used rows."""
+        return self.status[: len(self.ids)] != _CANCELED
+    
+    def _columns(self) -> List[np.ndarray]:
+        """All NumPy columns of the table."""
+        return [
+            self.symbols,
+            self.side,
+            self.status,
+            self.qty,
+            self.price,
+            self.executed_qty,
+            self.executed_price,
+            self.executed_qty_units,
+            self.executed_price_units,
+            self.timestamp,
+        ]
+    
+    def _grow(self) -> None:
+        """Double the allocated capacity of every column."""
+        new_capacity = self.capacity * 2
+        self.symbols = self._resize(self.symbols, new_capacity, "")
+        self.side = self._resize(self.side, new_capacity, 0)
+        self.status = self._resize(self.status, new_capacity, 0)
+        self.qty = self._resize(self.qty, new_capacity, 0.0)
+        self.price = self._resize(self.price, new_capacity, np.nan)
+        self.executed_qty = self._resize(self.executed_qty, new_capacity, 0.0)
+        self.executed_price = self._resize(self.executed_price, new_capacity, np.nan)
+        self.executed_qty_units = self._resize(self.executed_qty_units, new_capacity, 0)
+        self.executed_price_units = self._resize(self.executed_price_units, new_capacity, 0)
+        self.timestamp = self._resize(self.timestamp, new_capacity, 0.0)
+    
+    @staticmethod
+    def _resize(column: np.ndarray, capacity: int, fill: object) -> np.ndarray:
+        """Return a copy of ``column`` extended to ``capacity`` rows."""
+        resized = np.full(capacity, fill, dtype=column.dtype)
+        resized[: len(column)] = column
+        return resized
@@ -0,0 +1,142 @@
+"""Numeric risk-check kernels, JIT-compiled with Numba when it is installed."""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba is an optional speedup
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function as plain Python."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Failure flags returned by the kernels (0 means every check passed)
+ORDER_TOO_SMALL = 1
+ORDER_TOO_LARGE = 2
+POSITION_TOO_LARGE = 4
+RISK_TOO_HIGH = 8
+
+
+@njit(cache=True)
+def evaluate_risk_flags(
+    order_value: float,
+    account_balance: float,
+    min_order_size: float,
+    max_order_size: float,
+    max_position_size_pct: float,
+    max_risk_per_trade_pct: float,
+    risk_estimate_factor: float,
+) -> int:
+    """Evaluate the value-based risk checks for one order.
+    
+    Args:
+        order_value: Order value (quantity * price)
+        account_balance: Current account balance
+        min_order_size: Minimum order value
+        max_order_size: Maximum order value
+        max_position_size_pct: Maximum position value as a fraction of balance
+        max_risk_per_trade_pct: Maximum risk per trade as a fraction of balance
+        risk_estimate_factor: Fraction of the order value assumed at risk
+        
+    Returns:
+        Bitmask of failed checks
+    """
+    flags = 0
+    if order_value < min_order_size:
+        flags |= ORDER_TOO_SMALL
+    if order_value > max_order_size:
+        flags |= ORDER_TOO_LARGE
+    if order_value > account_balance * max_position_size_pct:
+        flags |= POSITION_TOO_LARGE
+    if order_value * risk_estimate_factor > account_balance * max_risk_per_trade_pct:
+        flags |= RISK_TOO_HIGH
+    return flags
+
+
+def _evaluate_risk_flags_batch_parallel(
+    order_values: np.ndarray,
+    account_balance: float,
+    min_order_size: float,
+    max_order_size: float,
+    max_position_size_pct: float,
+    max_risk_per_trade_pct: float,
+    risk_estimate_factor: float,
+) -> np.ndarray:
+    """Evaluate the value-based risk checks for many orders in a prange loop.
+    
+    Only used compiled (``parallel=True``); as plain Python this is a
+    per-order loop, so :func:`_evaluate_risk_flags_batch_numpy` is used
+    without numba.
+    
+    Args:
+        order_values: Order values (quantity * price)
+        account_balance: Current account balance
+        min_order_size: Minimum order value
+        max_order_size: Maximum order value
+        max_position_size_pct: Maximum position value as a fraction of balance
+        max_risk_per_trade_pct: Maximum risk per trade as a fraction of balance
+        risk_estimate_factor: Fraction of the order value assumed at risk
+        
+    Returns:
+        Array of failed-check bitmasks, one per order
+    """
+    flags = np.zeros(order_values.shape[0], dtype=np.uint8)
+    for i in prange(order_values.shape[0]):
+        if not np.isnan(order_values[i]):
+            flags[i] = evaluate_risk_flags(
+                order_values[i],
+                account_balance,
+                min_order_size,
+                max_order_size,
+                max_position_size_pct,
+                max_risk_per_trade_pct,
+                risk_estimate_factor,
+            )
+    return flags
+
+
+def _evaluate_risk_flags_batch_numpy(
+    order_values: np.ndarray,
+    account_balance: float,
+    min_order_size: float,
+    max_order_size: float,
+    max_position_size_pct: float,
+    max_risk_per_trade_pct: float,
+    risk_estimate_factor: float,
+) -> np.ndarray:
+    """Evaluate the value-based risk checks for many orders as array comparisons.
+    
+    Args:
+        order_values: Order values (quantity * price)
+        account_balance: Current account balance
+        min_order_size: Minimum order value
+        max_order_size: Maximum order value
+        max_position_size_pct: Maximum position value as a fraction of balance
+        max_risk_per_trade_pct: Maximum risk per trade as a fraction of balance
+        risk_estimate_factor: Fraction of the order value assumed at risk
+        
+    Returns:
+        Array of failed-check bitmasks, one per order
+    """
+    # Comparisons with NaN are False, so unpriced orders get no flags
+    flags = np.zeros(order_values.shape[0], dtype=np.uint8)
+    flags[order_values < min_order_size] |= ORDER_TOO_SMALL
+    flags[order_values > max_order_size] |= ORDER_TOO_LARGE
+    flags[order_values > account_balance * max_position_size_pct] |= POSITION_TOO_LARGE
+    flags[order_values * risk_estimate_factor > account_balance * max_risk_per_trade_pct] |= RISK_TOO_HIGH
+    return flags
+
+
+# Evaluate the value-based risk checks for many orders. NaN order values
+# (orders without a price) pass every check. Arguments as for
+# evaluate_risk_flags, with an array of order values; returns a uint8
+# bitmask per order.
+if NUMBA_AVAILABLE:
+    evaluate_risk_flags_batch = njit(cache=True, parallel=True)(_evaluate_risk_flags_batch_parallel)
+else:
+    evaluate_risk_flags_batch = _evaluate_risk_flags_batch_numpy
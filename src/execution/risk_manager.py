@@ -1,13 +1,23 @@
 """Risk management module for trade execution."""
 
+import logging
 from decimal import Decimal
 from typing import Dict, List, Optional
 
+import numpy as np
 import structlog
 
 from ..core.settings import get_settings
 from ..core.types import OrderRequest, TradingDecision, TradingMode
-from ..core.utils import calculate_risk_amount, clamp
+from ..core.utils import clamp, is_log_enabled
+from .risk_kernel import (
+    ORDER_TOO_LARGE,
+    ORDER_TOO_SMALL,
+    POSITION_TOO_LARGE,
+    RISK_TOO_HIGH,
+    evaluate_risk_flags,
+    evaluate_risk_flags_batch,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -20,6 +30,26 @@ class RiskManagementError(Exception):
 class RiskManager:
     """Risk management system for trade execution."""
     
+    __slots__ = (
+        "settings",
+        "mode",
+        "daily_trades",
+        "daily_pnl",
+        "max_daily_loss",
+        "max_daily_trades",
+        "_min_daily_pnl",
+        "_min_order_size",
+        "_max_order_size",
+        "_max_position_size_pct",
+        "_max_risk_per_trade_pct",
+        "_risk_estimate_factor",
+        "_placeholder_price",
+        "_risk_limits",
+        "_info_enabled",
+        "_cached_status",
+        "_status_dirty",
+    )
+    
     def __init__(self, mode: TradingMode = TradingMode.PAPER):
         """Initialize the risk manager.
         
@@ -31,7 +61,31 @@ class RiskManager:
         self.daily_trades = 0
         self.daily_pnl = Decimal("0")
         self.max_daily_loss = Decimal(str(self.settings.binance.max_daily_loss))
+        self._min_daily_pnl = -self.max_daily_loss
         self.max_daily_trades = self.settings.binance.max_daily_trades
+        
+        # Risk gating only needs comparisons, so limits are kept as floats and
+        # Decimal is only rebuilt for adjusted order quantities
+        self._min_order_size = float(self.settings.binance.min_order_size)
+        self._max_order_size = float(self.settings.binance.max_order_size)
+        self._max_position_size_pct = float(self.settings.binance.max_position_size)
+        self._max_risk_per_trade_pct = float(self.settings.binance.max_risk_per_trade)
+        self._risk_estimate_factor = 0.02  # 2% risk estimate
+        self._placeholder_price = 50000.0  # Placeholder BTC price
+        self._risk_limits = (
+            self._min_order_size,
+            self._max_order_size,
+            self._max_position_size_pct,
+            self._max_risk_per_trade_pct,
+            self._risk_estimate_factor,
+        )
+        
+        # Hot-path INFO logs are skipped entirely when INFO is filtered out
+        self._info_enabled = is_log_enabled(logger, logging.INFO)
+        
+        # Status snapshot, rebuilt only after the daily counters change
+        self._cached_status: Dict = {}
+        self._status_dirty = True
     
     def validate_order(self, order_request: OrderRequest, account_balance: Decimal) -> bool:
         """Validate an order against risk management rules.
@@ -54,25 +108,67 @@ class RiskManager:
                 logger.warning("Daily loss limit exceeded", daily_pnl=self.daily_pnl, limit=self.max_daily_loss)
                 return False
             
-            # Check order size limits
-            if not self._check_order_size_limits(order_request, account_balance):
-                return False
-            
-            # Check position size limits
-            if not self._check_position_size_limits(order_request, account_balance):
-                return False
-            
-            # Check risk per trade
-            if not self._check_risk_per_trade(order_request, account_balance):
-                return False
+            # Market orders can't be valued without a current price, so the
+            # value-based checks only apply to priced orders
+            if order_request.price:
+                order_value = float(order_request.quantity) * float(order_request.price)
+                balance = float(account_balance)
+                
+                # Check order size, position size and risk per trade in one kernel call
+                flags = evaluate_risk_flags(order_value, balance, *self._risk_limits)
+                if flags:
+                    self._log_risk_failure(flags, order_value, balance)
+                    return False
             
-            logger.info("Order passed risk validation", symbol=order_request.symbol, side=order_request.side.value)
+            if self._info_enabled:
+                logger.info("Order passed risk validation", symbol=order_request.symbol, side=order_request.side.value)
             return True
         
         except Exception as e:
             logger.error("Risk validation failed", error=str(e))
             return False
     
+    def validate_orders_batch(self, order_requests: List[OrderRequest], account_balance: Decimal) -> np.ndarray:
+        """Validate many orders against risk management rules at once.
+        
+        Applies the same rules as :meth:`validate_order`, with the value-based
+        checks evaluated over the whole batch by the (parallel) risk kernel.
+        
+        Args:
+            order_requests: Order requests to validate
+            account_balance: Current account balance
+            
+        Returns:
+            Boolean array, True where the order passes risk validation
+        """
+        count = len(order_requests)
+        
+        # Daily limits apply to every order in the batch alike
+        if not self._check_daily_trade_limit() or not self._check_daily_loss_limit():
+            logger.warning(
+                "Daily risk limit exceeded",
+                daily_trades=self.daily_trades,
+                daily_pnl=str(self.daily_pnl),
+                batch_size=count,
+            )
+            return np.zeros(count, dtype=bool)
+        
+        quantities = np.fromiter((float(order.quantity) for order in order_requests), np.float64, count)
+        prices = np.fromiter(
+            (float(order.price) if order.price else np.nan for order in order_requests),
+            np.float64,
+            count,
+        )
+        
+        # Market orders can't be valued without a current price; their NaN
+        # values pass the kernel checks
+        flags = evaluate_risk_flags_batch(quantities * prices, float(account_balance), *self._risk_limits)
+        passed = flags == 0
+        
+        if self._info_enabled:
+            logger.info("Validated order batch", batch_size=count, passed=int(passed.sum()))
+        return passed
+    
     def validate_trading_decision(self, decision: TradingDecision, account_balance: Decimal) -> bool:
         """Validate a trading decision against risk management rules.
         
@@ -125,38 +221,36 @@ class RiskManager:
         """
         try:
             adjusted_request = order_request.model_copy()
+            quantity = float(order_request.quantity)
+            price = float(order_request.price) if order_request.price else None
             
             # Calculate maximum allowed quantity based on risk limits
-            max_risk_amount = calculate_risk_amount(account_balance, self.settings.binance.max_risk_per_trade)
+            max_risk_amount = float(account_balance) * self._max_risk_per_trade_pct
             
             # Estimate position value
-            if order_request.price:
-                position_value = order_request.quantity * order_request.price
-            else:
-                # For market orders, estimate using current price (would need market data in real implementation)
-                position_value = order_request.quantity * Decimal("50000")  # Placeholder BTC price
+            # For market orders, estimate using current price (would need market data in real implementation)
+            reference_price = price or self._placeholder_price
+            position_value = quantity * reference_price
             
             # Adjust quantity if position value exceeds risk limits
             if position_value > max_risk_amount:
-                max_quantity = max_risk_amount / (order_request.price or Decimal("50000"))
-                adjusted_request.quantity = max_quantity
-                logger.info(
-                    "Adjusted order quantity for risk management",
-                    original_quantity=str(order_request.quantity),
-                    adjusted_quantity=str(adjusted_request.quantity),
-                    max_risk_amount=str(max_risk_amount),
-                )
+                quantity = max_risk_amount / reference_price
+                adjusted_request.quantity = Decimal(repr(quantity))
+                if self._info_enabled:
+                    logger.info(
+                        "Adjusted order quantity for risk management",
+                        original_quantity=str(order_request.quantity),
+                        adjusted_quantity=str(adjusted_request.quantity),
+                        max_risk_amount=max_risk_amount,
+                    )
             
             # Apply minimum and maximum order size limits
-            min_order_size = Decimal(str(self.settings.binance.min_order_size))
-            max_order_size = Decimal(str(self.settings.binance.max_order_size))
-            
-            if order_request.price:
-                order_value = adjusted_request.quantity * order_request.price
-                if order_value < min_order_size:
-                    adjusted_request.quantity = min_order_size / order_request.price
-                elif order_value > max_order_size:
-                    adjusted_request.quantity = max_order_size / order_request.price
+            if price:
+                order_value = quantity * price
+                if order_value < self._min_order_size:
+                    adjusted_request.quantity = Decimal(repr(self._min_order_size / price))
+                elif order_value > self._max_order_size:
+                    adjusted_request.quantity = Decimal(repr(self._max_order_size / price))
             
             return adjusted_request
         
@@ -173,36 +267,45 @@ class RiskManager:
         """
         self.daily_trades += 1
         self.daily_pnl += pnl
+        self._status_dirty = True
         
-        logger.info(
-            "Recorded trade",
-            daily_trades=self.daily_trades,
-            daily_pnl=str(self.daily_pnl),
-            trade_pnl=str(pnl),
-        )
+        if self._info_enabled:
+            logger.info(
+                "Recorded trade",
+                daily_trades=self.daily_trades,
+                daily_pnl=str(self.daily_pnl),
+                trade_pnl=str(pnl),
+            )
     
     def reset_daily_counters(self) -> None:
         """Reset daily counters (typically called at start of new trading day)."""
         self.daily_trades = 0
         self.daily_pnl = Decimal("0")
+        self._status_dirty = True
         logger.info("Reset daily risk counters")
     
     def get_risk_status(self) -> Dict:
         """Get current risk management status.
         
+        The snapshot is cached and only rebuilt after :meth:`record_trade` or
+        :meth:`reset_daily_counters`; callers must treat it as read-only.
+        
         Returns:
             Dictionary with risk status information
         """
-        return {
-            "daily_trades": self.daily_trades,
-            "max_daily_trades": self.max_daily_trades,
-            "daily_pnl": str(self.daily_pnl),
-            "max_daily_loss": str(self.max_daily_loss),
-            "trades_remaining": max(0, self.max_daily_trades - self.daily_trades),
-            "loss_buffer": str(self.max_daily_loss - self.daily_pnl),
-            "risk_per_trade": self.settings.binance.max_risk_per_trade,
-            "max_position_size": self.settings.binance.max_position_size,
-        }
+        if self._status_dirty:
+            self._cached_status = {
+                "daily_trades": self.daily_trades,
+                "max_daily_trades": self.max_daily_trades,
+                "daily_pnl": str(self.daily_pnl),
+                "max_daily_loss": str(self.max_daily_loss),
+                "trades_remaining": max(0, self.max_daily_trades - self.daily_trades),
+                "loss_buffer": str(self.max_daily_loss - self.daily_pnl),
+                "risk_per_trade": self.settings.binance.max_risk_per_trade,
+                "max_position_size": self.settings.binance.max_position_size,
+            }
+            self._status_dirty = False
+        return self._cached_status
     
     def _check_daily_trade_limit(self) -> bool:
         """Check if daily trade limit is exceeded.
@@ -218,88 +321,32 @@ class RiskManager:
         Returns:
             True if within limits
         """
-        return self.daily_pnl > -self.max_daily_loss
-    
-    def _check_order_size_limits(self, order_request: OrderRequest, account_balance: Decimal) -> bool:
-        """Check if order size is within limits.
-        
-        Args:
-            order_request: Order request to check
-            account_balance: Current account balance
-            
-        Returns:
-            True if within limits
-        """
-        if not order_request.price:
-            return True  # Market orders - can't check value without current price
-        
-        order_value = order_request.quantity * order_request.price
-        min_order_size = Decimal(str(self.settings.binance.min_order_size))
-        max_order_size = Decimal(str(self.settings.binance.max_order_size))
-        
-        if order_value < min_order_size:
-            logger.warning("Order value below minimum", order_value=str(order_value), min_size=str(min_order_size))
-            return False
-        
-        if order_value > max_order_size:
-            logger.warning("Order value above maximum", order_value=str(order_value), max_size=str(max_order_size))
-            return False
-        
-        return True
+        return self.daily_pnl > self._min_daily_pnl
     
-    def _check_position_size_limits(self, order_request: OrderRequest, account_balance: Decimal) -> bool:
-        """Check if position size is within limits.
+    def _log_risk_failure(self, flags: int, order_value: float, account_balance: float) -> None:
+        """Log the first failed value-based risk check.
         
         Args:
-            order_request: Order request to check
+            flags: Failed-check bitmask from the risk kernel
+            order_value: Order value (quantity * price)
             account_balance: Current account balance
-            
-        Returns:
-            True if within limits
         """
-        if not order_request.price:
-            return True  # Market orders - can't check value without current price
-        
-        position_value = order_request.quantity * order_request.price
-        max_position_value = account_balance * Decimal(str(self.settings.binance.max_position_size))
-        
-        if position_value > max_position_value:
+        if flags & ORDER_TOO_SMALL:
+            logger.warning("Order value below minimum", order_value=order_value, min_size=self._min_order_size)
+        elif flags & ORDER_TOO_LARGE:
+            logger.warning("Order value above maximum", order_value=order_value, max_size=self._max_order_size)
+        elif flags & POSITION_TOO_LARGE:
             logger.warning(
                 "Position size exceeds limit",
-                position_value=str(position_value),
-                max_position_value=str(max_position_value),
+                position_value=order_value,
+                max_position_value=account_balance * self._max_position_size_pct,
                 max_position_pct=self.settings.binance.max_position_size,
             )
-            return False
-        
-        return True
-    
-    def _check_risk_per_trade(self, order_request: OrderRequest, account_balance: Decimal) -> bool:
-        """Check if trade risk is within limits.
-        
-        Args:
-            order_request: Order request to check
-            account_balance: Current account balance
-            
-        Returns:
-            True if within limits
-        """
-        # This is a simplified check - in reality, you'd need to calculate
-        # the actual risk based on stop loss and position size
-        max_risk_amount = calculate_risk_amount(account_balance, self.settings.binance.max_risk_per_trade)
-        
-        if not order_request.price:
-            return True  # Market orders - can't check risk without current price
-        
-        # Estimate risk as a percentage of position value
-        estimated_risk = order_request.quantity * order_request.price * Decimal("0.02")  # 2% risk estimate
-        
-        if estimated_risk > max_risk_amount:
+        elif flags & RISK_TOO_HIGH:
+            # This is a simplified check - in reality, you'd need to calculate
+            # the actual risk based on stop loss and position size
             logger.warning(
                 "Trade risk exceeds limit",
-                estimated_risk=str(estimated_risk),
-                max_risk_amount=str(max_risk_amount),
+                estimated_risk=order_value * self._risk_estimate_factor,
+                max_risk_amount=account_balance * self._max_risk_per_trade_pct,
             )
-            return False
-        
-        return True
@@ -1,19 +1,30 @@
 """Anthropic LLM client implementation."""
 
-from typing import Any, Dict
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 import anthropic
 import structlog
 
-from .base import BaseLLMClient
+from .base import SCORE_MAX_TOKENS, BaseLLMClient, LLMError, build_score_prompt, parse_score
 from ..core.types import LLMProvider
 
 logger = structlog.get_logger(__name__)
 
+# Seconds between status checks of a submitted message batch
+BATCH_POLL_INTERVAL = 10.0
+
+# Seconds to wait for a message batch (batches expire after 24 hours)
+BATCH_TIMEOUT = 24 * 3600.0
+
 
 class AnthropicClient(BaseLLMClient):
     """Anthropic LLM client."""
     
+    supports_streaming = True
+    supports_offline_batch = True
+    
     def __init__(self, model: str = "claude-3-sonnet-20240229", api_key: str = None):
         """Initialize Anthropic client.
         
@@ -23,8 +34,9 @@ class AnthropicClient(BaseLLMClient):
         """
         super().__init__(LLMProvider.ANTHROPIC, model, api_key)
         
-        # Initialize Anthropic client
+        # Initialize Anthropic clients
         self.client = anthropic.Anthropic(api_key=api_key)
+        self.aclient = anthropic.AsyncAnthropic(api_key=api_key)
     
     def _make_request(
         self,
@@ -61,6 +73,246 @@ class AnthropicClient(BaseLLMClient):
             logger.error("Anthropic API request failed", error=str(e))
             raise
     
+    async def _amake_request(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Make an asynchronous request to Anthropic API.
+        
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
+            
+        Returns:
+            Raw response from Anthropic
+        """
+        try:
+            response = await self.aclient.messages.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                **kwargs
+            )
+            
+            return response.model_dump()
+        
+        except Exception as e:
+            logger.error("Anthropic API request failed", error=str(e))
+            raise
+    
+    def _make_request_stream(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        **kwargs: Any,
+    ) -> Iterator[str]:
+        """Make a streaming request to Anthropic API.
+        
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
+            
+        Returns:
+            Generator of text deltas; closing it aborts the request
+        """
+        try:
+            with self.client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                **kwargs
+            ) as stream:
+                yield from stream.text_stream
+        
+        except Exception as e:
+            logger.error("Anthropic streaming request failed", error=str(e))
+            raise
+    
+    async def _amake_request_stream(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Make an asynchronous streaming request to Anthropic API.
+        
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
+            
+        Returns:
+            Async generator of text deltas; closing it aborts the request
+        """
+        try:
+            async with self.aclient.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                **kwargs
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+        
+        except Exception as e:
+            logger.error("Anthropic streaming request failed", error=str(e))
+            raise
+    
+    def _response_from_text(self, content: str) -> Dict[str, Any]:
+        """Wrap streamed text in the Anthropic response format.
+        
+        Args:
+            content: Response text
+            
+        Returns:
+            Raw response in the Messages API shape
+        """
+        return {"content": [{"type": "text", "text": content}], "usage": {}}
+    
+    async def score_many(
+        self,
+        texts: List[str],
+        criteria: str,
+        poll_interval: float = BATCH_POLL_INTERVAL,
+        timeout: float = BATCH_TIMEOUT,
+    ) -> List[float]:
+        """Score many texts against criteria with one Message Batches job.
+        
+        Batches are billed at a discount and do not count against the
+        per-minute request limits, which suits offline work such as
+        backtests where every prompt is known up front. This call waits
+        until the batch has finished processing.
+        
+        Args:
+            texts: Texts to score
+            criteria: Scoring criteria
+            poll_interval: Seconds between batch status checks
+            timeout: Seconds to wait for the batch before cancelling it
+            
+        Returns:
+            Scores between 0 and 1, in the same order as the texts
+        """
+        if not texts:
+            return []
+        
+        params = [
+            {
+                "model": self.model,
+                "max_tokens": SCORE_MAX_TOKENS,
+                "temperature": 0.0,
+                "messages": [
+                    {"role": "user", "content": build_score_prompt(text, criteria)}
+                ],
+            }
+            for text in texts
+        ]
+        contents = await self._arun_batch(params, poll_interval, timeout)
+        
+        # Unsuccessful requests keep the neutral default score
+        return [0.5 if content is None else parse_score(content) for content in contents]
+    
+    async def _asubmit_batch(
+        self,
+        prompts: List[str],
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        poll_interval: float = BATCH_POLL_INTERVAL,
+        timeout: float = BATCH_TIMEOUT,
+        **kwargs: Any,
+    ) -> List[str]:
+        """Run prompts as one Message Batches job.
+        
+        Args:
+            prompts: Input prompts
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            poll_interval: Seconds between batch status checks
+            timeout: Seconds to wait for the batch before cancelling it
+            **kwargs: Additional parameters
+            
+        Returns:
+            Generated texts in the same order as the prompts; requests that
+            did not succeed come back empty
+        """
+        params = [
+            {
+                "model": self.model,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+                "messages": [
+                    {"role": "user", "content": prompt}
+                ],
+                **kwargs,
+            }
+            for prompt in prompts
+        ]
+        contents = await self._arun_batch(params, poll_interval, timeout)
+        return ["" if content is None else content for content in contents]
+    
+    async def _arun_batch(
+        self,
+        params: List[Dict[str, Any]],
+        poll_interval: float,
+        timeout: float,
+    ) -> List[Optional[str]]:
+        """Submit a Message Batches job and wait for its results.
+        
+        Args:
+            params: Messages API parameters, one per request
+            poll_interval: Seconds between batch status checks
+            timeout: Seconds to wait for the batch before cancelling it
+            
+        Returns:
+            Response texts in request order, None for requests that did not succeed
+        """
+        batches = self.aclient.messages.batches
+        requests = [{"custom_id": str(i), "params": request} for i, request in enumerate(params)]
+        
+        batch = await batches.create(requests=requests)
+        logger.info("Submitted Anthropic batch", batch_id=batch.id, size=len(requests))
+        
+        deadline = time.monotonic() + timeout
+        while batch.processing_status != "ended":
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                await batches.cancel(batch.id)
+                raise LLMError(f"Anthropic batch {batch.id} did not finish within {timeout:g}s")
+            await asyncio.sleep(min(poll_interval, remaining))
+            batch = await batches.retrieve(batch.id)
+        
+        contents: List[Optional[str]] = [None] * len(requests)
+        async for entry in await batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                logger.warning(
+                    "Anthropic batch request did not succeed",
+                    batch_id=batch.id,
+                    custom_id=entry.custom_id,
+                    result=entry.result.type,
+                )
+                continue
+            contents[int(entry.custom_id)] = self._extract_content(entry.result.message.model_dump())
+        
+        return contents
+    
     def _extract_content(self, response_data: Dict[str, Any]) -> str:
         """Extract content from Anthropic response.
         
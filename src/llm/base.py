@@ -1,18 +1,296 @@
 """Base LLM client implementation."""
 
+import asyncio
+import json
+import re
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Literal, Optional, Tuple
 
 import structlog
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
+from .cache import get_response_cache, make_cache_key
+from .rate_limiter import get_rate_limiter
 from ..core.settings import get_settings
 from ..core.types import LLMProvider, LLMResponse
-from ..core.utils import retry_with_backoff
+from ..core.utils import json_loads, parse_retry_after
 
 logger = structlog.get_logger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _structured_instructions(schema: type) -> str:
+    """Build the schema instructions appended to structured prompts.
+    
+    JSON schema generation walks the whole model tree, so the formatted
+    instructions are computed once per schema class.
+    
+    Args:
+        schema: Pydantic model schema
+        
+    Returns:
+        Instruction text including the compact JSON schema
+    """
+    schema_json = json.dumps(schema.model_json_schema(), separators=(",", ":"))
+    return f"""
+        
+        Please respond with valid JSON that matches this schema:
+        {schema_json}
+        
+        Ensure the response is valid JSON and matches the required structure.
+        """
+
+
+# Token budget for score responses, which are a single number
+SCORE_MAX_TOKENS = 10
+
+# Rough characters per token, for estimating prompt size before sending
+CHARS_PER_TOKEN = 4
+
+# Client-error statuses that are still worth retrying (timeout, rate limit)
+RETRYABLE_CLIENT_STATUSES = frozenset({408, 429})
+
+# Backoff between retries of failed provider requests
+RETRY_MAX_WAIT = 30.0
+_jittered_wait = wait_random_exponential(multiplier=1, max=RETRY_MAX_WAIT)
+
+# Static parts of the score and structured prompts, assembled by concatenation
+_SCORE_PREFIX = """
+        Score the following text against the given criteria on a scale of 0 to 1.
+        
+        Text: """
+_SCORE_MIDDLE = """
+        
+        Criteria: """
+_SCORE_SUFFIX = """
+        
+        Provide only a numerical score between 0 and 1 (e.g., 0.85).
+        """
+_STRUCTURED_PREFIX = "\n        "
+
+# First numeric literal in a score response
+_SCORE_RE = re.compile(r"[-+]?\d*\.\d+|[-+]?\d+")
+
+
+def build_score_prompt(text: str, criteria: str) -> str:
+    """Build the prompt used to score text against criteria.
+    
+    Args:
+        text: Text to score
+        criteria: Scoring criteria
+        
+    Returns:
+        Scoring prompt
+    """
+    return _SCORE_PREFIX + text + _SCORE_MIDDLE + criteria + _SCORE_SUFFIX
+
+
+def parse_score(content: str) -> float:
+    """Parse a score from an LLM response.
+    
+    Args:
+        content: Response content
+        
+    Returns:
+        Score clamped between 0 and 1, or 0.5 if it cannot be parsed
+    """
+    # Take the first numeric literal, so replies like "Score: 0.85." still parse
+    match = _SCORE_RE.search(content)
+    if match is None:
+        logger.warning("Failed to parse score from LLM response", response=content)
+        return 0.5  # Default neutral score
+    
+    score = float(match.group())
+    return max(0.0, min(1.0, score))  # Clamp between 0 and 1
+
+
+def extract_json_object(chunks: Iterable[str]) -> str:
+    """Read text chunks until the first JSON object in them is complete.
+    
+    Braces are counted outside of string literals, so consumption stops as
+    soon as the top-level object closes and any remaining chunks are never
+    requested.
+    
+    Args:
+        chunks: Text chunks, e.g. streamed response deltas
+        
+    Returns:
+        Text of the first complete JSON object, or all text read if the
+        chunks end before one closes
+    """
+    text = ""
+    pos = 0
+    start = -1
+    depth = 0
+    in_string = False
+    escaped = False
+    
+    for chunk in chunks:
+        text += chunk
+        while pos < len(text):
+            char = text[pos]
+            if start < 0:
+                if char == "{":
+                    start = pos
+                    depth = 1
+            elif in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    return text[start:pos + 1]
+            pos += 1
+    
+    return text
+
+
+class JSONFieldStream:
+    """Incremental parser yielding the top-level fields of a JSON object.
+    
+    Text is fed in chunks as it streams in, and each ``key: value`` pair is
+    returned as soon as its value closes, so callers can act on early
+    fields (e.g. ``action``) while later ones are still being generated.
+    Text before the object is ignored.
+    """
+    
+    def __init__(self):
+        """Initialize the parser."""
+        self.done = False
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._field_start = -1
+        self._in_string = False
+        self._escaped = False
+    
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Consume a chunk of text.
+        
+        Args:
+            chunk: Next piece of the response
+            
+        Returns:
+            Fields completed by this chunk, in order
+        """
+        fields = []
+        if self.done:
+            return fields
+        
+        self._text += chunk
+        text = self._text
+        while self._pos < len(text):
+            char = text[self._pos]
+            if self._field_start < 0:
+                if char == "{":
+                    self._depth = 1
+                    self._field_start = self._pos + 1
+            elif self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(self._field_start, self._pos, fields)
+                    self.done = True
+                    break
+            elif char == "," and self._depth == 1:
+                self._emit(self._field_start, self._pos, fields)
+                self._field_start = self._pos + 1
+            self._pos += 1
+        
+        return fields
+    
+    def _emit(self, start: int, end: int, fields: List[Tuple[str, Any]]) -> None:
+        """Parse one ``key: value`` member and append it to the results."""
+        member = self._text[start:end].strip()
+        if not member:
+            return
+        try:
+            fields.extend(json_loads("{" + member + "}").items())
+        except ValueError:
+            logger.warning("Skipping malformed JSON field", field=member[:100])
+
+
+def _error_status(error: BaseException) -> Optional[int]:
+    """Get the HTTP status carried by a provider SDK error, if any.
+    
+    OpenAI and Anthropic errors expose ``status_code``; google.api_core
+    errors (Gemini) expose ``code``.
+    """
+    for attribute in ("status_code", "code"):
+        status = getattr(error, attribute, None)
+        if isinstance(status, int):
+            return status
+    return None
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Check whether retrying a failed provider request can help.
+    
+    Errors carrying an HTTP status below 500 (other than 408/429) are client
+    errors such as bad prompts or auth failures and are not retried. Errors
+    without a status (network failures, timeouts) are retried.
+    
+    Args:
+        error: Error raised by the provider SDK
+        
+    Returns:
+        True if the request should be retried
+    """
+    if isinstance(error, LLMError):
+        return False
+    status = _error_status(error)
+    return status is None or status >= 500 or status in RETRYABLE_CLIENT_STATUSES
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Wait for ``Retry-After`` when the provider sends it, else back off with jitter."""
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is not None:
+        retry_after = parse_retry_after(headers.get("retry-after"))
+        if retry_after is not None:
+            return min(retry_after, RETRY_MAX_WAIT)
+    return _jittered_wait(retry_state)
+
+
+def _log_retry(retry_state: RetryCallState) -> None:
+    """Log a failed attempt before tenacity sleeps."""
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    logger.warning(
+        "Retry attempt failed",
+        attempt=retry_state.attempt_number,
+        delay=retry_state.next_action.sleep if retry_state.next_action else None,
+        error=str(error),
+    )
+
+
 class LLMError(Exception):
     """Exception raised during LLM operations."""
     pass
@@ -26,6 +304,16 @@ class RateLimitError(LLMError):
 class BaseLLMClient(ABC):
     """Base class for LLM clients."""
     
+    # Providers that implement _make_request_stream set this to True
+    supports_streaming = False
+    
+    # Providers that implement _asubmit_batch with a discounted offline batch API
+    supports_offline_batch = False
+    
+    # Bumped when the shape of raw responses changes, so cached responses in
+    # the old shape are never read back
+    response_format_version = 1
+    
     def __init__(self, provider: LLMProvider, model: str, api_key: str):
         """Initialize the LLM client.
         
@@ -38,9 +326,18 @@ class BaseLLMClient(ABC):
         self.model = model
         self.api_key = api_key
         self.settings = get_settings()
-        self._request_count = 0
-        self._token_count = 0
-        self._last_reset = time.time()
+        self.response_cache = get_response_cache()
+        self.rate_limiter = get_rate_limiter(provider.value, model)
+        
+        # Deterministic requests in flight, shared by identical async calls
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
+        # Provider cap on in-flight requests per client (None means no cap)
+        self.max_concurrency: Optional[int] = None
+        
+        # Bounds abatch requests across all callers; created on first use on the running loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
     
     @abstractmethod
     def _make_request(
@@ -63,6 +360,29 @@ class BaseLLMClient(ABC):
         """
         pass
     
+    async def _amake_request(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Make a request to the LLM provider asynchronously.
+        
+        Providers without an async SDK run the blocking request in a worker
+        thread; subclasses override this with a native async call.
+        
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
+            
+        Returns:
+            Raw response from the provider
+        """
+        return await asyncio.to_thread(self._make_request, prompt, temperature, max_tokens, **kwargs)
+    
     def generate(
         self,
         prompt: str,
@@ -83,34 +403,122 @@ class BaseLLMClient(ABC):
         """
         start_time = time.time()
         
-        # Check rate limits
-        self._check_rate_limits()
+        # Serve repeated deterministic prompts from the cache
+        cache_key = self._response_cache_key(prompt, temperature, max_tokens, kwargs)
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return self._build_response(cached, start_time, cached=True)
+        
+        # Check rate limits against the estimated cost before sending
+        estimated_tokens = self._count_tokens(prompt) + max_tokens
+        self._check_rate_limits(estimated_tokens)
         
         try:
             # Make request with retry logic
-            response_data = retry_with_backoff(
-                lambda: self._make_request(prompt, temperature, max_tokens, **kwargs),
-                max_attempts=self.settings.llm.retry_attempts,
-                base_delay=self.settings.llm.retry_delay,
+            response_data = self._request_retrying()(
+                self._make_request, prompt, temperature, max_tokens, **kwargs
             )
+            if cache_key is not None:
+                self.response_cache.set(cache_key, response_data)
+            return self._build_response(response_data, start_time, reserved_tokens=estimated_tokens)
+        
+        except Exception as e:
+            logger.error(
+                "LLM request failed",
+                provider=self.provider.value,
+                model=self.model,
+                error=str(e),
+            )
+            raise LLMError(f"LLM request failed: {e}")
+    
+    async def agenerate(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Generate text using the LLM without blocking the event loop.
+        
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
             
-            # Extract content and usage
-            content = self._extract_content(response_data)
-            usage = self._extract_usage(response_data)
-            
-            # Update rate limit counters
-            self._update_counters(usage)
-            
-            # Calculate latency
-            latency_ms = (time.time() - start_time) * 1000
+        Returns:
+            LLM response
+        """
+        start_time = time.time()
+        
+        # Serve repeated deterministic prompts from the cache
+        request_key = self._request_key(prompt, temperature, max_tokens, kwargs)
+        cache_key = request_key if self.response_cache is not None else None
+        if cache_key is not None:
+            cached = await self.response_cache.aget(cache_key)
+            if cached is not None:
+                return self._build_response(cached, start_time, cached=True)
+        
+        estimated_tokens = self._count_tokens(prompt) + max_tokens
+        if request_key is None:
+            response_data = await self._asend_request(
+                prompt, temperature, max_tokens, estimated_tokens, cache_key, **kwargs
+            )
+            return self._build_response(response_data, start_time, reserved_tokens=estimated_tokens)
+        
+        # Identical calls made while this one is in flight await its response
+        # instead of sending their own (and use no quota)
+        request = self._inflight.get(request_key)
+        coalesced = request is not None
+        if request is None:
+            request = asyncio.ensure_future(self._asend_request(
+                prompt, temperature, max_tokens, estimated_tokens, cache_key, **kwargs
+            ))
+            self._inflight[request_key] = request
+            request.add_done_callback(lambda _: self._inflight.pop(request_key, None))
+        
+        response_data = await asyncio.shield(request)
+        return self._build_response(
+            response_data,
+            start_time,
+            cached=coalesced,
+            reserved_tokens=0 if coalesced else estimated_tokens,
+        )
+    
+    async def _asend_request(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        estimated_tokens: int,
+        cache_key: Optional[str],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Send a request within the rate limits and cache its response.
+        
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            estimated_tokens: Tokens to reserve from the rate limiter
+            cache_key: Response cache key, or None to skip caching
+            **kwargs: Additional parameters
             
-            return LLMResponse(
-                content=content,
-                usage=usage,
-                model=self.model,
-                provider=self.provider,
-                latency_ms=latency_ms,
+        Returns:
+            Raw response from the provider
+        """
+        # Wait for rate-limit budget for the estimated cost before sending
+        await self._wait_for_rate_limits(estimated_tokens)
+        
+        try:
+            # Make request with retry logic
+            response_data = await self._request_retrying(asynchronous=True)(
+                self._amake_request, prompt, temperature, max_tokens, **kwargs
             )
+            if cache_key is not None:
+                await self.response_cache.aset(cache_key, response_data)
+            return response_data
         
         except Exception as e:
             logger.error(
@@ -121,6 +529,197 @@ class BaseLLMClient(ABC):
             )
             raise LLMError(f"LLM request failed: {e}")
     
+    async def abatch(
+        self,
+        prompts: List[str],
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        **kwargs: Any,
+    ) -> List[LLMResponse]:
+        """Generate responses for several prompts concurrently.
+        
+        Requests are issued together, with at most ``max_concurrent_requests``
+        (and never more than ``max_requests_per_minute`` or the provider's
+        ``max_concurrency``) in flight across all concurrent ``abatch`` calls
+        on this client, so the wall time is close to the slowest single
+        request rather than the sum of all of them.
+        
+        Args:
+            prompts: Input prompts
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
+            
+        Returns:
+            LLM responses in the same order as the prompts
+        """
+        semaphore = self._concurrency_semaphore()
+        
+        async def generate_one(prompt: str) -> LLMResponse:
+            async with semaphore:
+                return await self.agenerate(prompt, temperature, max_tokens, **kwargs)
+        
+        return list(await asyncio.gather(*(generate_one(prompt) for prompt in prompts)))
+    
+    def _concurrency_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore shared by this client's batched requests.
+        
+        Created lazily so it binds to the running loop, and recreated if the
+        client is used from a different loop.
+        
+        Returns:
+            Semaphore sized to the concurrency limit
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            limit = min(self.settings.llm.max_concurrent_requests, self.settings.llm.max_requests_per_minute)
+            if self.max_concurrency is not None:
+                limit = min(limit, self.max_concurrency)
+            self._semaphore = asyncio.Semaphore(max(1, limit))
+            self._semaphore_loop = loop
+        return self._semaphore
+    
+    async def batch_generate(
+        self,
+        prompts: List[str],
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        batch_mode: Literal["sync", "async_batch"] = "sync",
+        **kwargs: Any,
+    ) -> List[str]:
+        """Generate completions for many prompts and return their texts.
+        
+        ``"sync"`` answers right away through :meth:`abatch`. ``"async_batch"``
+        submits the prompts to the provider's offline batch API, which is
+        billed at a discount and does not count against the per-minute
+        limits but may take hours, so it only suits offline work such as
+        backtests. Clients without ``supports_offline_batch`` answer
+        ``"async_batch"`` requests through :meth:`abatch` instead.
+        
+        Args:
+            prompts: Input prompts
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            batch_mode: ``"sync"`` or ``"async_batch"``
+            **kwargs: Additional parameters
+            
+        Returns:
+            Generated texts in the same order as the prompts
+        """
+        if not prompts:
+            return []
+        if batch_mode == "sync":
+            responses = await self.abatch(prompts, temperature, max_tokens, **kwargs)
+            return [response.content for response in responses]
+        if batch_mode == "async_batch":
+            return await self._asubmit_batch(prompts, temperature, max_tokens, **kwargs)
+        raise ValueError(f"Unsupported batch mode: {batch_mode}")
+    
+    async def _asubmit_batch(
+        self,
+        prompts: List[str],
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        **kwargs: Any,
+    ) -> List[str]:
+        """Run prompts through the provider's offline batch API.
+        
+        Providers with a batch API override this and set
+        ``supports_offline_batch``; the default sends the prompts as regular
+        concurrent requests through :meth:`abatch`.
+        
+        Args:
+            prompts: Input prompts
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
+            
+        Returns:
+            Generated texts in the same order as the prompts
+        """
+        logger.warning(
+            "Offline batches not supported, sending requests directly",
+            provider=self.provider.value,
+            batch_size=len(prompts),
+        )
+        responses = await self.abatch(prompts, temperature, max_tokens, **kwargs)
+        return [response.content for response in responses]
+    
+    async def stream_generate(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Generate text, yielding deltas as the model produces them.
+        
+        Streamed requests are not retried or cached, since a failure after
+        the first delta cannot be replayed transparently. Clients without
+        streaming support yield the whole response once.
+        
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
+            
+        Returns:
+            Async generator of text deltas; closing it aborts the request
+        """
+        if not self.supports_streaming:
+            response = await self.agenerate(prompt, temperature, max_tokens, **kwargs)
+            yield response.content
+            return
+        
+        await self._wait_for_rate_limits(self._count_tokens(prompt) + max_tokens)
+        
+        chunks = self._amake_request_stream(prompt, temperature, max_tokens, **kwargs)
+        try:
+            async for chunk in chunks:
+                yield chunk
+        except Exception as e:
+            logger.error(
+                "LLM streaming request failed",
+                provider=self.provider.value,
+                model=self.model,
+                error=str(e),
+            )
+            raise LLMError(f"LLM request failed: {e}")
+        finally:
+            await chunks.aclose()
+    
+    async def stream_json_fields(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        **kwargs: Any,
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Stream a JSON object response, yielding top-level fields as they close.
+        
+        The stream is closed as soon as the object is complete.
+        
+        Args:
+            prompt: Input prompt asking for a JSON object
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
+            
+        Returns:
+            Async generator of ``(key, value)`` pairs in generation order
+        """
+        parser = JSONFieldStream()
+        chunks = self.stream_generate(prompt, temperature, max_tokens, **kwargs)
+        try:
+            async for chunk in chunks:
+                for field in parser.feed(chunk):
+                    yield field
+                if parser.done:
+                    break
+        finally:
+            await chunks.aclose()
+    
     def score(
         self,
         text: str,
@@ -137,26 +736,9 @@ class BaseLLMClient(ABC):
         Returns:
             Score between 0 and 1
         """
-        prompt = f"""
-        Score the following text against the given criteria on a scale of 0 to 1.
-        
-        Text: {text}
-        
-        Criteria: {criteria}
-        
-        Provide only a numerical score between 0 and 1 (e.g., 0.85).
-        """
-        
-        response = self.generate(prompt, temperature=0.0, max_tokens=10, **kwargs)
-        
-        try:
-            # Extract numerical score from response
-            score_text = response.content.strip()
-            score = float(score_text)
-            return max(0.0, min(1.0, score))  # Clamp between 0 and 1
-        except ValueError:
-            logger.warning("Failed to parse score from LLM response", response=response.content)
-            return 0.5  # Default neutral score
+        prompt = build_score_prompt(text, criteria)
+        response = self.generate(prompt, temperature=0.0, max_tokens=SCORE_MAX_TOKENS, **kwargs)
+        return parse_score(response.content)
     
     def structured(
         self,
@@ -175,51 +757,321 @@ class BaseLLMClient(ABC):
             Structured response matching the schema
         """
         # Add schema instruction to prompt
-        structured_prompt = f"""
-        {prompt}
-        
-        Please respond with valid JSON that matches this schema:
-        {schema.model_json_schema()}
+        structured_prompt = _STRUCTURED_PREFIX + prompt + _structured_instructions(schema)
         
-        Ensure the response is valid JSON and matches the required structure.
-        """
-        
-        response = self.generate(structured_prompt, temperature=0.1, **kwargs)
+        if self.supports_streaming:
+            content = self._generate_json_stream(structured_prompt, temperature=0.1, **kwargs)
+        else:
+            content = self.generate(structured_prompt, temperature=0.1, **kwargs).content
         
         try:
-            import json
-            data = json.loads(response.content)
+            data = json_loads(content)
             return schema.model_validate(data)
         except (json.JSONDecodeError, ValueError) as e:
-            logger.error("Failed to parse structured response", error=str(e), response=response.content)
+            logger.error("Failed to parse structured response", error=str(e), response=content)
             raise LLMError(f"Failed to generate structured response: {e}")
     
-    def _check_rate_limits(self) -> None:
-        """Check if rate limits are exceeded."""
-        current_time = time.time()
+    def _generate_json_stream(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        **kwargs: Any,
+    ) -> str:
+        """Stream a response and stop as soon as its JSON object is complete.
+        
+        Closing the stream early saves the time (and output tokens) the model
+        would spend on anything after the object.
+        
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
+            
+        Returns:
+            Text of the JSON object
+        """
+        # Shares cache entries with generate() for the same request
+        cache_key = self._response_cache_key(prompt, temperature, max_tokens, kwargs)
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return self._extract_content(cached)
+        
+        # Check rate limits against the estimated cost before sending
+        self._check_rate_limits(self._count_tokens(prompt) + max_tokens)
+        
+        try:
+            content = self._request_retrying()(
+                self._read_json_stream, prompt, temperature, max_tokens, **kwargs
+            )
+        except Exception as e:
+            logger.error(
+                "LLM streaming request failed",
+                provider=self.provider.value,
+                model=self.model,
+                error=str(e),
+            )
+            raise LLMError(f"LLM request failed: {e}")
+        
+        response_data = self._response_from_text(content) if cache_key is not None else None
+        if response_data is not None:
+            self.response_cache.set(cache_key, response_data)
+        return content
+    
+    def _read_json_stream(self, prompt: str, temperature: float, max_tokens: int, **kwargs: Any) -> str:
+        """Read a streamed response up to the end of its first JSON object."""
+        chunks = self._make_request_stream(prompt, temperature, max_tokens, **kwargs)
+        try:
+            return extract_json_object(chunks)
+        finally:
+            chunks.close()
+    
+    def _make_request_stream(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        **kwargs: Any,
+    ) -> Iterator[str]:
+        """Make a streaming request to the LLM provider.
+        
+        Providers with a streaming API override this and set
+        ``supports_streaming``; the default yields the whole response of a
+        regular request as one delta.
+        
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
+            
+        Returns:
+            Generator of text deltas; closing it aborts the request
+        """
+        yield self._extract_content(self._make_request(prompt, temperature, max_tokens, **kwargs))
+    
+    async def _amake_request_stream(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Make an asynchronous streaming request to the LLM provider.
+        
+        The default yields the whole response of a regular request as one
+        delta (see :meth:`_make_request_stream`).
+        
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
+            
+        Returns:
+            Async generator of text deltas; closing it aborts the request
+        """
+        yield self._extract_content(await self._amake_request(prompt, temperature, max_tokens, **kwargs))
+    
+    def _response_from_text(self, content: str) -> Optional[Dict[str, Any]]:
+        """Wrap streamed text in the provider's raw response format.
         
-        # Reset counters every minute
-        if current_time - self._last_reset >= 60:
-            self._request_count = 0
-            self._token_count = 0
-            self._last_reset = current_time
+        Args:
+            content: Response text
+            
+        Returns:
+            Raw response accepted by :meth:`_extract_content`, or None if the
+            provider does not define one (the text is then not cached)
+        """
+        return None
+    
+    def _request_retrying(self, asynchronous: bool = False) -> Callable:
+        """Build the retry policy for provider requests.
+        
+        Retryable errors (see :func:`is_retryable_error`) are retried with
+        jittered exponential backoff, or after ``Retry-After`` when the
+        provider sends it; anything else is raised immediately.
+        
+        Args:
+            asynchronous: Build an ``AsyncRetrying`` instead of ``Retrying``
+            
+        Returns:
+            Tenacity retrying object, called with the function and its arguments
+        """
+        retrying_class = AsyncRetrying if asynchronous else Retrying
+        return retrying_class(
+            retry=retry_if_exception(is_retryable_error),
+            wait=_retry_wait,
+            stop=stop_after_attempt(self.settings.retry_attempts),
+            before_sleep=_log_retry,
+            reraise=True,
+        )
+    
+    def _response_cache_key(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        kwargs: Dict[str, Any],
+    ) -> Optional[str]:
+        """Get the cache key for a request.
+        
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            kwargs: Additional parameters
+            
+        Returns:
+            Cache key, or None if the response should not be cached
+        """
+        if self.response_cache is None:
+            return None
+        return self._request_key(prompt, temperature, max_tokens, kwargs)
+    
+    def _request_key(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        kwargs: Dict[str, Any],
+    ) -> Optional[str]:
+        """Get the key identifying a deterministic request.
+        
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            kwargs: Additional parameters
+            
+        Returns:
+            Request key, or None if the temperature makes responses vary
+        """
+        if temperature > self.settings.llm.response_cache_max_temperature:
+            return None
+        provider = f"{self.provider.value}/v{self.response_format_version}"
+        return make_cache_key(provider, self.model, temperature, max_tokens, prompt, kwargs)
+    
+    def _build_response(
+        self,
+        response_data: Dict[str, Any],
+        start_time: float,
+        cached: bool = False,
+        reserved_tokens: int = 0,
+    ) -> LLMResponse:
+        """Build an LLM response from raw provider data.
+        
+        Args:
+            response_data: Raw response from the provider
+            start_time: Time the request started
+            cached: Whether the response came from the cache
+            reserved_tokens: Tokens reserved for the request before sending
+            
+        Returns:
+            LLM response
+        """
+        # Extract content and usage
+        content = self._extract_content(response_data)
+        usage = self._extract_usage(response_data)
+        
+        # Update rate limit counters (cached responses use no quota)
+        if not cached:
+            self._update_counters(usage, reserved_tokens)
+        
+        # Calculate latency
+        latency_ms = (time.time() - start_time) * 1000
+        
+        return LLMResponse(
+            content=content,
+            usage=usage,
+            model=self.model,
+            provider=self.provider,
+            latency_ms=latency_ms,
+        )
+    
+    def _check_rate_limits(self, estimated_tokens: int = 0) -> None:
+        """Take a request token and reserve the estimated tokens, or fail.
+        
+        The buckets are shared by every client of this provider model and
+        refill smoothly, so bursts are capped at the per-minute limits.
+        
+        Args:
+            estimated_tokens: Estimated prompt plus completion tokens
+            
+        Raises:
+            RateLimitError: If the request or token budget is exhausted
+        """
+        self._check_request_size(estimated_tokens)
         
         # Check request rate limit
-        if self._request_count >= self.settings.llm.max_requests_per_minute:
+        if not self.rate_limiter.requests.try_acquire(1):
             raise RateLimitError("Request rate limit exceeded")
         
         # Check token rate limit
-        if self._token_count >= self.settings.llm.max_tokens_per_minute:
+        if not self.rate_limiter.tokens.try_acquire(max(1, estimated_tokens)):
+            self.rate_limiter.requests.consume(-1)
             raise RateLimitError("Token rate limit exceeded")
     
-    def _update_counters(self, usage: Dict[str, int]) -> None:
+    async def _wait_for_rate_limits(self, estimated_tokens: int = 0) -> None:
+        """Wait until a request token and the estimated tokens are available.
+        
+        Unlike :meth:`_check_rate_limits`, this schedules requests within the
+        budget instead of failing, so concurrent batches never need the
+        provider to reject them with 429s.
+        
+        Args:
+            estimated_tokens: Estimated prompt plus completion tokens
+            
+        Raises:
+            RateLimitError: If the request can never fit the token budget
+        """
+        self._check_request_size(estimated_tokens)
+        await self.rate_limiter.requests.acquire(1)
+        await self.rate_limiter.tokens.acquire(max(1, estimated_tokens))
+    
+    def _check_request_size(self, estimated_tokens: int) -> None:
+        """Reject requests larger than the whole per-minute token budget.
+        
+        Args:
+            estimated_tokens: Estimated prompt plus completion tokens
+            
+        Raises:
+            RateLimitError: If the request can never fit the token budget
+        """
+        max_tokens = self.rate_limiter.tokens_per_minute
+        if estimated_tokens > max_tokens:
+            raise RateLimitError(
+                f"Request needs ~{estimated_tokens} tokens, above the limit of {max_tokens} per minute"
+            )
+    
+    def _count_tokens(self, text: str) -> int:
+        """Estimate the number of tokens in a text without calling the API.
+        
+        The default assumes roughly four characters per token; providers with
+        a local tokenizer override this.
+        
+        Args:
+            text: Text to measure
+            
+        Returns:
+            Estimated token count
+        """
+        return len(text) // CHARS_PER_TOKEN + 1
+    
+    def _update_counters(self, usage: Dict[str, int], reserved_tokens: int = 0) -> None:
         """Update rate limit counters.
         
+        Actual token usage is only known after the response; the difference
+        from the reservation is charged (or refunded) here and may leave the
+        token bucket in debt until it refills.
+        
         Args:
             usage: Token usage information
+            reserved_tokens: Tokens reserved for the request before sending
         """
-        self._request_count += 1
-        self._token_count += usage.get("total_tokens", 0)
+        self.rate_limiter.tokens.consume(usage.get("total_tokens", 0) - reserved_tokens)
     
     @abstractmethod
     def _extract_content(self, response_data: Dict[str, Any]) -> str:
@@ -0,0 +1,268 @@
+"""Persistent cache for raw LLM provider responses."""
+
+import asyncio
+import hashlib
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import structlog
+
+from ..core.settings import get_settings
+
+logger = structlog.get_logger(__name__)
+
+RESPONSE_CACHE_FILENAME = "llm_responses.sqlite3"
+MEMORY_CACHE_MAX_ENTRIES = 1000
+
+
+def make_cache_key(
+    provider: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    prompt: str,
+    kwargs: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Build a content-addressed key for an LLM request.
+    
+    Runs of whitespace in the prompt are collapsed first, so prompts that
+    only differ in indentation or line wrapping share an entry.
+    
+    Args:
+        provider: LLM provider name
+        model: Model name
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate
+        prompt: Input prompt
+        kwargs: Additional request parameters
+        
+    Returns:
+        Hex digest identifying the request
+    """
+    extra = repr(sorted(kwargs.items())) if kwargs else ""
+    normalized_prompt = " ".join(prompt.split())
+    payload = f"{provider}|{model}|{temperature}|{max_tokens}|{extra}|{normalized_prompt}"
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class MemoryResponseCache:
+    """In-process LRU cache of raw provider responses with a TTL."""
+    
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        """Initialize the memory cache.
+        
+        Args:
+            max_entries: Maximum number of responses kept
+            ttl_seconds: Time-to-live of cached responses
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached response.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Raw provider response or None if not found/expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        created_at, response_data = entry
+        if time.time() - created_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return response_data
+    
+    def put(self, key: str, response_data: Dict[str, Any], created_at: Optional[float] = None) -> None:
+        """Store a response, evicting the least recently used one if full.
+        
+        Args:
+            key: Cache key
+            response_data: Raw provider response
+            created_at: Time the response was first cached (defaults to now)
+        """
+        self._entries[key] = (created_at or time.time(), response_data)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all responses."""
+        self._entries.clear()
+
+
+class LLMResponseCache:
+    """SQLite-backed cache of raw provider responses.
+    
+    Entries are keyed by :func:`make_cache_key` and expire after
+    ``ttl_seconds``. Recently used responses are also kept in a
+    :class:`MemoryResponseCache`, so hot prompts skip the database and
+    unpickling. The connection is shared between threads, so database access
+    is serialized with a lock; the memory tier has its own lock so it is
+    never held across database I/O. Async callers use :meth:`aget` and
+    :meth:`aset`, which run the database work in a worker thread.
+    """
+    
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttl_seconds: int,
+        memory_entries: int = MEMORY_CACHE_MAX_ENTRIES,
+    ):
+        """Initialize the response cache.
+        
+        Args:
+            path: SQLite database file
+            ttl_seconds: Time-to-live of cached responses
+            memory_entries: Number of responses also kept in memory
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._memory = MemoryResponseCache(memory_entries, ttl_seconds)
+        self._memory_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, created_at REAL NOT NULL, data BLOB NOT NULL)"
+        )
+        self._conn.commit()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached response.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Raw provider response or None if not found/expired
+        """
+        response_data = self._get_memory(key)
+        if response_data is not None:
+            return response_data
+        
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT created_at, data FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                
+                created_at, data = row
+                if time.time() - created_at > self.ttl_seconds:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._conn.commit()
+                    return None
+                
+                response_data = pickle.loads(data)
+            
+            with self._memory_lock:
+                self._memory.put(key, response_data, created_at)
+            return response_data
+        
+        except Exception as e:
+            logger.warning("Failed to read cached LLM response", error=str(e))
+            return None
+    
+    def set(self, key: str, response_data: Dict[str, Any]) -> None:
+        """Store a response.
+        
+        Args:
+            key: Cache key
+            response_data: Raw provider response
+        """
+        with self._memory_lock:
+            self._memory.put(key, response_data)
+        self._write(key, response_data)
+    
+    async def aget(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached response without blocking the event loop on the database.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Raw provider response or None if not found/expired
+        """
+        response_data = self._get_memory(key)
+        if response_data is not None:
+            return response_data
+        return await asyncio.to_thread(self.get, key)
+    
+    async def aset(self, key: str, response_data: Dict[str, Any]) -> None:
+        """Store a response without blocking the event loop on the database.
+        
+        Args:
+            key: Cache key
+            response_data: Raw provider response
+        """
+        with self._memory_lock:
+            self._memory.put(key, response_data)
+        await asyncio.to_thread(self._write, key, response_data)
+    
+    def _get_memory(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a response from the memory tier only."""
+        with self._memory_lock:
+            return self._memory.get(key)
+    
+    def _write(self, key: str, response_data: Dict[str, Any]) -> None:
+        """Write a response to the database."""
+        try:
+            data = pickle.dumps(response_data)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, created_at, data) VALUES (?, ?, ?)",
+                    (key, time.time(), data),
+                )
+                self._conn.commit()
+        
+        except Exception as e:
+            logger.warning("Failed to cache LLM response", error=str(e))
+    
+    def clear_expired(self) -> int:
+        """Remove expired responses.
+        
+        Returns:
+            Number of responses removed
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+@lru_cache(maxsize=1)
+def get_response_cache() -> Optional[LLMResponseCache]:
+    """Get the shared response cache.
+    
+    Returns:
+        Response cache, or None if caching is disabled in settings
+    """
+    settings = get_settings()
+    if not settings.llm.response_cache_enabled:
+        return None
+    
+    path = Path(settings.data.cache_directory) / RESPONSE_CACHE_FILENAME
+    return LLMResponseCache(path, settings.llm.response_cache_ttl_seconds)
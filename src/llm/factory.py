@@ -1,6 +1,7 @@
 """LLM client factory for creating provider-specific clients."""
 
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple
 
 import structlog
 
@@ -20,6 +21,12 @@ class LLMClientFactory:
     def __init__(self):
         """Initialize the factory."""
         self.settings = get_settings()
+        self._clients: Dict[Tuple[LLMProvider, Hashable], BaseLLMClient] = {}
+        self._registry: Mapping[LLMProvider, Callable[..., BaseLLMClient]] = MappingProxyType({
+            LLMProvider.OPENAI: self._create_openai_client,
+            LLMProvider.ANTHROPIC: self._create_anthropic_client,
+            LLMProvider.GEMINI: self._create_gemini_client,
+        })
     
     def create_client(
         self,
@@ -28,6 +35,9 @@ class LLMClientFactory:
     ) -> BaseLLMClient:
         """Create an LLM client for the specified provider.
         
+        Clients are cached per provider and keyword arguments, so repeated
+        calls return the same instance.
+        
         Args:
             provider: LLM provider (defaults to primary provider from settings)
             **kwargs: Additional parameters for client initialization
@@ -41,16 +51,34 @@ class LLMClientFactory:
         if provider is None:
             provider = LLMProvider(self.settings.llm.primary_provider)
         
-        logger.info("Creating LLM client", provider=provider.value)
+        # Reuse clients so their HTTP connection pools are kept alive
+        cache_key = (provider, frozenset(kwargs.items()))
+        client = self._clients.get(cache_key)
+        if client is None:
+            client = self._build_client(provider, **kwargs)
+            self._clients[cache_key] = client
+        return client
+    
+    def _build_client(self, provider: LLMProvider, **kwargs: Any) -> BaseLLMClient:
+        """Build a new LLM client for the specified provider.
         
-        if provider == LLMProvider.OPENAI:
-            return self._create_openai_client(**kwargs)
-        elif provider == LLMProvider.ANTHROPIC:
-            return self._create_anthropic_client(**kwargs)
-        elif provider == LLMProvider.GEMINI:
-            return self._create_gemini_client(**kwargs)
-        else:
+        Args:
+            provider: LLM provider
+            **kwargs: Additional parameters for client initialization
+            
+        Returns:
+            LLM client instance
+            
+        Raises:
+            ValueError: If provider is not supported or configuration is invalid
+        """
+        try:
+            create = self._registry[provider]
+        except KeyError:
             raise ValueError(f"Unsupported LLM provider: {provider}")
+        
+        logger.info("Creating LLM client", provider=provider.value)
+        return create(**kwargs)
     
     def _create_openai_client(self, **kwargs) -> OpenAIClient:
         """Create OpenAI client.
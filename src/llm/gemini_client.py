@@ -1,6 +1,6 @@
 """Google Gemini LLM client implementation."""
 
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
 
 import google.generativeai as genai
 import structlog
@@ -10,10 +10,30 @@ from ..core.types import LLMProvider
 
 logger = structlog.get_logger(__name__)
 
+# API key genai is currently configured with (configuration is process-wide)
+_configured_api_key: Optional[str] = None
+
+
+def _configure(api_key: str) -> None:
+    """Configure genai once per API key.
+    
+    Reconfiguring drops the SDK's cached gRPC channel, so clients sharing a
+    key keep reusing the same multiplexed connection.
+    
+    Args:
+        api_key: Gemini API key
+    """
+    global _configured_api_key
+    if api_key != _configured_api_key:
+        genai.configure(api_key=api_key, transport="grpc")
+        _configured_api_key = api_key
+
 
 class GeminiClient(BaseLLMClient):
     """Google Gemini LLM client."""
     
+    supports_streaming = True
+    
     def __init__(self, model: str = "gemini-pro", api_key: str = None):
         """Initialize Gemini client.
         
@@ -23,8 +43,11 @@ class GeminiClient(BaseLLMClient):
         """
         super().__init__(LLMProvider.GEMINI, model, api_key)
         
+        # Google AI rejects bursts beyond a handful of concurrent requests
+        self.max_concurrency = self.settings.llm.gemini_max_concurrent_requests
+        
         # Configure Gemini
-        genai.configure(api_key=api_key)
+        _configure(api_key)
         self.model_instance = genai.GenerativeModel(model)
     
     def _make_request(
@@ -46,28 +69,151 @@ class GeminiClient(BaseLLMClient):
             Raw response from Gemini
         """
         try:
-            # Configure generation parameters
-            generation_config = genai.types.GenerationConfig(
-                temperature=temperature,
-                max_output_tokens=max_tokens,
-                **kwargs
+            response = self.model_instance.generate_content(
+                prompt,
+                generation_config=self._generation_config(temperature, max_tokens, **kwargs),
+            )
+            return self._response_to_dict(response)
+        
+        except Exception as e:
+            logger.error("Gemini API request failed", error=str(e))
+            raise
+    
+    async def _amake_request(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Make an asynchronous request to Gemini API.
+        
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
+            
+        Returns:
+            Raw response from Gemini
+        """
+        try:
+            response = await self.model_instance.generate_content_async(
+                prompt,
+                generation_config=self._generation_config(temperature, max_tokens, **kwargs),
             )
+            return self._response_to_dict(response)
+        
+        except Exception as e:
+            logger.error("Gemini API request failed", error=str(e))
+            raise
+    
+    def _make_request_stream(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        **kwargs: Any,
+    ) -> Iterator[str]:
+        """Make a streaming request to Gemini API.
+        
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
             
+        Returns:
+            Generator of text deltas; closing it stops reading the stream
+        """
+        try:
             response = self.model_instance.generate_content(
                 prompt,
-                generation_config=generation_config
+                generation_config=self._generation_config(temperature, max_tokens, **kwargs),
+                stream=True,
             )
+            for chunk in response:
+                yield chunk.text
+        
+        except Exception as e:
+            logger.error("Gemini streaming request failed", error=str(e))
+            raise
+    
+    async def _amake_request_stream(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Make an asynchronous streaming request to Gemini API.
+        
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
             
-            # Convert to dictionary format
-            return {
-                "text": response.text,
-                "usage_metadata": getattr(response, "usage_metadata", {}),
-            }
+        Returns:
+            Async generator of text deltas; closing it stops reading the stream
+        """
+        try:
+            response = await self.model_instance.generate_content_async(
+                prompt,
+                generation_config=self._generation_config(temperature, max_tokens, **kwargs),
+                stream=True,
+            )
+            async for chunk in response:
+                yield chunk.text
         
         except Exception as e:
-            logger.error("Gemini API request failed", error=str(e))
+            logger.error("Gemini streaming request failed", error=str(e))
             raise
     
+    def _response_from_text(self, content: str) -> Dict[str, Any]:
+        """Wrap streamed text in the Gemini response format.
+        
+        Args:
+            content: Response text
+            
+        Returns:
+            Raw response dictionary
+        """
+        return {"text": content, "usage_metadata": {}}
+    
+    @staticmethod
+    def _generation_config(temperature: float, max_tokens: int, **kwargs: Any) -> Any:
+        """Build Gemini generation parameters.
+        
+        Args:
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
+            
+        Returns:
+            Gemini generation config
+        """
+        return genai.types.GenerationConfig(
+            temperature=temperature,
+            max_output_tokens=max_tokens,
+            **kwargs
+        )
+    
+    @staticmethod
+    def _response_to_dict(response: Any) -> Dict[str, Any]:
+        """Convert a Gemini response to dictionary format.
+        
+        Args:
+            response: Gemini response
+            
+        Returns:
+            Raw response dictionary
+        """
+        return {
+            "text": response.text,
+            "usage_metadata": getattr(response, "usage_metadata", {}),
+        }
+    
     def _extract_content(self, response_data: Dict[str, Any]) -> str:
         """Extract content from Gemini response.
         
@@ -1,19 +1,119 @@
 """OpenAI LLM client implementation."""
 
-from typing import Any, Dict
+import asyncio
+import json
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Optional
 
+import httpx
 import openai
 import structlog
 
-from .base import BaseLLMClient
+from .base import BaseLLMClient, LLMError
 from ..core.types import LLMProvider
+from ..core.utils import HTTP2_AVAILABLE, json_loads
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - tiktoken is an optional speedup
+    tiktoken = None
 
 logger = structlog.get_logger(__name__)
 
+# Connection pool shared by every OpenAI client in the process
+HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+HTTP_CONNECT_TIMEOUT = 10.0
+
+# Models served by the legacy /completions endpoint, which accepts a list of
+# prompts in one request
+COMPLETIONS_MODEL_PREFIXES = ("gpt-3.5-turbo-instruct", "davinci-002", "babbage-002")
+
+# Seconds between status checks of a submitted batch
+BATCH_POLL_INTERVAL = 30.0
+BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+@lru_cache(maxsize=None)
+def _shared_http_client(timeout: float) -> httpx.Client:
+    """Get the keep-alive HTTP client shared by sync OpenAI clients.
+    
+    Args:
+        timeout: Read timeout in seconds
+        
+    Returns:
+        Shared HTTP client (HTTP/2 when h2 is installed)
+    """
+    return httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(timeout, connect=HTTP_CONNECT_TIMEOUT),
+        limits=HTTP_LIMITS,
+    )
+
+
+@lru_cache(maxsize=None)
+def _shared_async_http_client(timeout: float) -> httpx.AsyncClient:
+    """Get the keep-alive HTTP client shared by async OpenAI clients.
+    
+    Args:
+        timeout: Read timeout in seconds
+        
+    Returns:
+        Shared async HTTP client (HTTP/2 when h2 is installed)
+    """
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(timeout, connect=HTTP_CONNECT_TIMEOUT),
+        limits=HTTP_LIMITS,
+    )
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str) -> Optional[Any]:
+    """Get the tiktoken encoding for a model, if tiktoken is available.
+    
+    Args:
+        model: OpenAI model name
+        
+    Returns:
+        Encoding, or None if it cannot be loaded
+    """
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            # Unknown model names use the encoding of current chat models
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning("Failed to load tiktoken encoding", model=model, error=str(e))
+        return None
+
+
+def _chat_messages(prompt: str) -> List[Dict[str, str]]:
+    """Build the chat messages sent for a prompt.
+    
+    Args:
+        prompt: Input prompt
+        
+    Returns:
+        Chat completion messages
+    """
+    return [
+        {"role": "system", "content": "You are a helpful trading assistant."},
+        {"role": "user", "content": prompt}
+    ]
+
 
 class OpenAIClient(BaseLLMClient):
     """OpenAI LLM client."""
     
+    supports_streaming = True
+    supports_offline_batch = True
+    
+    # Responses are flat dictionaries plucked from the SDK objects
+    response_format_version = 2
+    
     def __init__(self, model: str = "gpt-4", api_key: str = None):
         """Initialize OpenAI client.
         
@@ -23,8 +123,11 @@ class OpenAIClient(BaseLLMClient):
         """
         super().__init__(LLMProvider.OPENAI, model, api_key)
         
-        # Initialize OpenAI client
-        self.client = openai.OpenAI(api_key=api_key)
+        # Initialize OpenAI clients on shared pools, so repeat calls (and other
+        # client instances) reuse warm TCP/TLS connections
+        timeout = float(self.settings.llm.timeout_seconds)
+        self.client = openai.OpenAI(api_key=api_key, http_client=_shared_http_client(timeout))
+        self.aclient = openai.AsyncOpenAI(api_key=api_key, http_client=_shared_async_http_client(timeout))
     
     def _make_request(
         self,
@@ -47,33 +150,358 @@ class OpenAIClient(BaseLLMClient):
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a helpful trading assistant."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=_chat_messages(prompt),
                 temperature=temperature,
                 max_tokens=max_tokens,
                 **kwargs
             )
             
-            return response.model_dump()
+            return self._lean_response(response)
         
         except Exception as e:
             logger.error("OpenAI API request failed", error=str(e))
             raise
     
+    async def _amake_request(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Make an asynchronous request to OpenAI API.
+        
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
+            
+        Returns:
+            Raw response from OpenAI
+        """
+        try:
+            response = await self.aclient.chat.completions.create(
+                model=self.model,
+                messages=_chat_messages(prompt),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs
+            )
+            
+            return self._lean_response(response)
+        
+        except Exception as e:
+            logger.error("OpenAI API request failed", error=str(e))
+            raise
+    
+    def _lean_response(self, response: Any) -> Dict[str, Any]:
+        """Pluck the fields the client uses from a chat completion.
+        
+        Avoids ``model_dump()``, which serializes the whole response tree
+        only for a few fields to be read back out of it.
+        
+        Args:
+            response: Chat completion from the SDK
+            
+        Returns:
+            Flat response dictionary (with the SDK object under ``_raw`` in
+            debug mode)
+        """
+        choice = response.choices[0]
+        usage = response.usage
+        response_data = {
+            "text": choice.message.content,
+            "finish_reason": choice.finish_reason,
+            "prompt_tokens": usage.prompt_tokens if usage else 0,
+            "completion_tokens": usage.completion_tokens if usage else 0,
+            "total_tokens": usage.total_tokens if usage else 0,
+        }
+        if self.settings.debug:
+            response_data["_raw"] = response
+        return response_data
+    
+    def _make_request_stream(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        **kwargs: Any,
+    ) -> Iterator[str]:
+        """Make a streaming request to OpenAI API.
+        
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
+            
+        Returns:
+            Generator of text deltas; closing it aborts the request
+        """
+        try:
+            with self.client.chat.completions.create(
+                model=self.model,
+                messages=_chat_messages(prompt),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                **kwargs
+            ) as stream:
+                for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+        
+        except Exception as e:
+            logger.error("OpenAI streaming request failed", error=str(e))
+            raise
+    
+    async def _amake_request_stream(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Make an asynchronous streaming request to OpenAI API.
+        
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters
+            
+        Returns:
+            Async generator of text deltas; closing it aborts the request
+        """
+        try:
+            stream = await self.aclient.chat.completions.create(
+                model=self.model,
+                messages=_chat_messages(prompt),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                **kwargs
+            )
+            async with stream:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+        
+        except Exception as e:
+            logger.error("OpenAI streaming request failed", error=str(e))
+            raise
+    
+    def _response_from_text(self, content: str) -> Dict[str, Any]:
+        """Wrap streamed text in the OpenAI response format.
+        
+        Args:
+            content: Response text
+            
+        Returns:
+            Flat response dictionary, as built by ``_lean_response``
+        """
+        return {"text": content}
+    
+    async def batch_generate(
+        self,
+        prompts: List[str],
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        batch_mode: Literal["sync", "async_batch"] = "sync",
+        **kwargs: Any,
+    ) -> List[str]:
+        """Generate completions for many prompts and return their texts.
+        
+        Completions models take every prompt in a single ``/completions``
+        request, so N prompts use one request of the per-minute budget.
+        Chat models have no multi-prompt endpoint and fall back to
+        concurrent requests.
+        
+        Args:
+            prompts: Input prompts
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            batch_mode: ``"sync"`` or ``"async_batch"``
+            **kwargs: Additional parameters
+            
+        Returns:
+            Generated texts in the same order as the prompts
+        """
+        if batch_mode == "sync" and prompts and self.model.startswith(COMPLETIONS_MODEL_PREFIXES):
+            return await self._agenerate_prompt_list(prompts, temperature, max_tokens, **kwargs)
+        return await super().batch_generate(prompts, temperature, max_tokens, batch_mode, **kwargs)
+    
+    async def _agenerate_prompt_list(
+        self,
+        prompts: List[str],
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any,
+    ) -> List[str]:
+        """Generate completions for several prompts in one request.
+        
+        Args:
+            prompts: Input prompts
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate per prompt
+            **kwargs: Additional parameters
+            
+        Returns:
+            Generated texts in the same order as the prompts
+        """
+        estimated_tokens = sum(self._count_tokens(prompt) + max_tokens for prompt in prompts)
+        await self._wait_for_rate_limits(estimated_tokens)
+        
+        try:
+            response_data = await self._request_retrying(asynchronous=True)(
+                self._amake_batch_request, prompts, temperature, max_tokens, **kwargs
+            )
+        except Exception as e:
+            logger.error("OpenAI batch request failed", model=self.model, size=len(prompts), error=str(e))
+            raise LLMError(f"LLM request failed: {e}")
+        
+        self._update_counters(self._extract_usage(response_data), estimated_tokens)
+        return response_data["texts"]
+    
+    async def _amake_batch_request(
+        self,
+        prompts: List[str],
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Make one request to the OpenAI completions API for many prompts.
+        
+        Args:
+            prompts: Input prompts
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate per prompt
+            **kwargs: Additional parameters
+            
+        Returns:
+            Flat response dictionary with the texts in prompt order
+        """
+        response = await self.aclient.completions.create(
+            model=self.model,
+            prompt=prompts,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs
+        )
+        usage = response.usage
+        return {
+            "texts": [choice.text for choice in sorted(response.choices, key=lambda choice: choice.index)],
+            "prompt_tokens": usage.prompt_tokens if usage else 0,
+            "completion_tokens": usage.completion_tokens if usage else 0,
+            "total_tokens": usage.total_tokens if usage else 0,
+        }
+    
+    async def _asubmit_batch(
+        self,
+        prompts: List[str],
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        poll_interval: float = BATCH_POLL_INTERVAL,
+        **kwargs: Any,
+    ) -> List[str]:
+        """Run prompts as one OpenAI Batch API job.
+        
+        The requests are uploaded as an in-memory JSONL file and the job is
+        polled until it reaches a terminal status, which can take up to the
+        24 hour completion window.
+        
+        Args:
+            prompts: Input prompts
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            poll_interval: Seconds between batch status checks
+            **kwargs: Additional parameters
+            
+        Returns:
+            Generated texts in the same order as the prompts; requests that
+            did not succeed come back empty
+        """
+        lines = [
+            json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": _chat_messages(prompt),
+                    "temperature": temperature,
+                    "max_tokens": max_tokens,
+                    **kwargs,
+                },
+            })
+            for i, prompt in enumerate(prompts)
+        ]
+        
+        input_file = await self.aclient.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = await self.aclient.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        logger.info("Submitted OpenAI batch", batch_id=batch.id, size=len(prompts))
+        
+        while batch.status not in BATCH_TERMINAL_STATUSES:
+            await asyncio.sleep(poll_interval)
+            batch = await self.aclient.batches.retrieve(batch.id)
+        
+        # Expired batches still return the requests that finished in time
+        if batch.output_file_id is None:
+            raise LLMError(f"OpenAI batch {batch.id} {batch.status} without output")
+        
+        output = await self.aclient.files.content(batch.output_file_id)
+        contents = [""] * len(prompts)
+        for line in output.text.splitlines():
+            if not line:
+                continue
+            entry = json_loads(line)
+            response = entry.get("response") or {}
+            if response.get("status_code") != 200:
+                logger.warning(
+                    "OpenAI batch request did not succeed",
+                    batch_id=batch.id,
+                    custom_id=entry.get("custom_id"),
+                    error=entry.get("error"),
+                )
+                continue
+            contents[int(entry["custom_id"])] = response["body"]["choices"][0]["message"]["content"]
+        
+        return contents
+    
+    def _count_tokens(self, text: str) -> int:
+        """Count prompt tokens with tiktoken, falling back to an estimate.
+        
+        Args:
+            text: Text to measure
+            
+        Returns:
+            Token count
+        """
+        encoding = _get_encoding(self.model)
+        if encoding is None:
+            return super()._count_tokens(text)
+        return len(encoding.encode(text))
+    
     def _extract_content(self, response_data: Dict[str, Any]) -> str:
         """Extract content from OpenAI response.
         
         Args:
-            response_data: Raw response from OpenAI
+            response_data: Flat response from ``_lean_response``
             
         Returns:
             Extracted content string
         """
         try:
-            return response_data["choices"][0]["message"]["content"]
-        except (KeyError, IndexError) as e:
+            return response_data["text"]
+        except KeyError as e:
             logger.error("Failed to extract content from OpenAI response", error=str(e))
             raise
     
@@ -81,17 +509,16 @@ class OpenAIClient(BaseLLMClient):
         """Extract usage information from OpenAI response.
         
         Args:
-            response_data: Raw response from OpenAI
+            response_data: Flat response from ``_lean_response``
             
         Returns:
             Usage information dictionary
         """
         try:
-            usage = response_data.get("usage", {})
             return {
-                "prompt_tokens": usage.get("prompt_tokens", 0),
-                "completion_tokens": usage.get("completion_tokens", 0),
-                "total_tokens": usage.get("total_tokens", 0),
+                "prompt_tokens": response_data.get("prompt_tokens", 0),
+                "completion_tokens": response_data.get("completion_tokens", 0),
+                "total_tokens": response_data.get("total_tokens", 0),
             }
         except Exception as e:
             logger.error("Failed to extract usage from OpenAI response", error=str(e))
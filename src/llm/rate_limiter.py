@@ -0,0 +1,128 @@
+"""Client-side rate limiting for LLM providers."""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Tuple
+
+from ..core.settings import get_settings
+
+
+class TokenBucket:
+    """Token bucket refilled continuously from a monotonic clock.
+    
+    The bucket may go into debt through :meth:`consume`, for costs that are
+    only known after the fact (e.g. completion tokens). Refill and take are
+    guarded by a thread lock that is never held across an ``await``, so one
+    bucket can be shared by sync callers and any event loop.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        """Initialize the bucket.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens held
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+    
+    def try_acquire(self, amount: float = 1.0) -> bool:
+        """Take tokens if enough are available.
+        
+        Args:
+            amount: Tokens to take
+            
+        Returns:
+            True if the tokens were taken
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens < amount:
+                return False
+            self._tokens -= amount
+            return True
+    
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until enough tokens are available, then take them.
+        
+        Args:
+            amount: Tokens to take (at most the bucket capacity)
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                wait = (amount - self._tokens) / self.rate
+            await asyncio.sleep(wait)
+    
+    def consume(self, amount: float) -> None:
+        """Charge (or, if negative, refund) tokens unconditionally.
+        
+        Args:
+            amount: Tokens to charge
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens - amount)
+    
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+
+class RateLimiter:
+    """Request and token budgets for one provider model."""
+    
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        """Initialize the rate limiter.
+        
+        Args:
+            requests_per_minute: Maximum requests per minute
+            tokens_per_minute: Maximum prompt plus completion tokens per minute
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.requests = TokenBucket(requests_per_minute / 60, requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute / 60, tokens_per_minute)
+
+
+_rate_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, model: str) -> RateLimiter:
+    """Get the rate limiter shared by all clients of a provider model.
+    
+    Quotas are enforced per account and model, so every client instance for
+    the same pair draws from the same buckets.
+    
+    Args:
+        provider: LLM provider name
+        model: Model name
+        
+    Returns:
+        Shared rate limiter
+    """
+    key = (provider, model)
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(key)
+        if limiter is None:
+            settings = get_settings()
+            limiter = RateLimiter(settings.llm.max_requests_per_minute, settings.llm.max_tokens_per_minute)
+            _rate_limiters[key] = limiter
+    return limiter
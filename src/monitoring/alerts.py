@@ -1,16 +1,26 @@
 """Alert system for trading bot monitoring and notifications."""
 
 import asyncio
+import heapq
+import logging
+import time
+from collections import Counter, deque
+from itertools import count, islice
 from datetime import datetime, timezone, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Callable, Any
+from typing import Deque, Dict, FrozenSet, Iterable, List, Optional, Callable, Any, Set, Tuple, Union
 import structlog
 
 from ..core.settings import get_settings
 from ..core.types import TradingDecision
+from ..core.utils import is_log_enabled, json_dumps
 
 logger = structlog.get_logger(__name__)
 
+MAX_ALERT_HISTORY = 1000
+SUMMARY_BUCKET_SECONDS = 60
+DEFAULT_SUMMARY_RETENTION_HOURS = 24
+
 
 class AlertLevel(str, Enum):
     """Alert severity levels."""
@@ -49,6 +59,9 @@ class AlertType(str, Enum):
 class Alert:
     """Alert object."""
     
+    # Process-wide sequence for alert IDs, unique even within a microsecond
+    _id_counter = count()
+    
     def __init__(
         self,
         alert_type: AlertType,
@@ -71,11 +84,13 @@ class Alert:
         self.message = message
         self.details = details or {}
         self.timestamp = timestamp or datetime.now(timezone.utc)
-        self.id = f"{self.alert_type}_{self.timestamp.timestamp()}"
+        self.id = f"{self.alert_type.value}_{next(Alert._id_counter)}"
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert alert to dictionary.
         
+        The timestamp stays a ``datetime``; :meth:`to_json` formats it.
+        
         Returns:
             Dictionary representation of alert
         """
@@ -85,8 +100,48 @@ class Alert:
             "level": self.level.value,
             "message": self.message,
             "details": self.details,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp,
         }
+    
+    def to_json(self) -> bytes:
+        """Serialize the alert to JSON, e.g. for webhook payloads.
+        
+        Returns:
+            UTF-8 encoded JSON (call ``.decode()`` where text is required)
+        """
+        return json_dumps(self.to_dict())
+
+
+def _latest(alerts: Deque[Alert], limit: int) -> List[Alert]:
+    """Get the most recent alerts, oldest first.
+    
+    Args:
+        alerts: Alert history
+        limit: Maximum number of alerts to return
+        
+    Returns:
+        Up to ``limit`` of the newest alerts, without copying the rest
+    """
+    return list(islice(reversed(alerts), limit))[::-1]
+
+
+def compile_condition(expression: str, name: str = "condition") -> Callable[[Dict[str, Any]], bool]:
+    """Compile a condition expression over ``data`` into a function.
+    
+    The expression is compiled once into a plain function, so evaluating it
+    costs the same as a hand-written lambda. Expressions come from code, not
+    user input; builtins are still withheld to keep them to simple checks.
+    
+    Args:
+        expression: Python expression reading the payload as ``data``,
+            e.g. ``"data.get('data_age_hours', 0) > 1"``
+        name: Name used in tracebacks
+        
+    Returns:
+        Condition function
+    """
+    code = compile(f"lambda data: ({expression})", f"<rule:{name}>", "eval")
+    return eval(code, {"__builtins__": {}})
 
 
 class AlertRule:
@@ -97,9 +152,10 @@ class AlertRule:
         name: str,
         alert_type: AlertType,
         level: AlertLevel,
-        condition: Callable[[Dict[str, Any]], bool],
+        condition: Union[str, Callable[[Dict[str, Any]], bool]],
         message_template: str,
         cooldown_seconds: int = 300,  # 5 minutes default
+        watched_keys: Optional[Iterable[str]] = None,
     ):
         """Initialize an alert rule.
         
@@ -107,32 +163,40 @@ class AlertRule:
             name: Rule name
             alert_type: Type of alert to trigger
             level: Alert severity level
-            condition: Function that returns True if alert should trigger
+            condition: Function that returns True if alert should trigger, or
+                a Python expression over ``data`` compiled into one
             message_template: Message template for the alert
             cooldown_seconds: Minimum time between alerts of this type
+            watched_keys: Data keys the condition reads; the rule is only
+                evaluated for payloads containing one of them (None means
+                every payload)
         """
         self.name = name
         self.alert_type = alert_type
         self.level = level
-        self.condition = condition
+        self.condition_expr = condition if isinstance(condition, str) else None
+        self.condition = compile_condition(condition, name) if isinstance(condition, str) else condition
         self.message_template = message_template
         self.cooldown_seconds = cooldown_seconds
-        self.last_triggered: Optional[datetime] = None
+        self.watched_keys: Optional[FrozenSet[str]] = (
+            frozenset(watched_keys) if watched_keys is not None else None
+        )
+        self.last_triggered: Optional[datetime] = None  # For reporting only
+        self._cooldown_until = 0.0  # time.monotonic() deadline
     
-    def should_trigger(self, data: Dict[str, Any]) -> bool:
+    def should_trigger(self, data: Dict[str, Any], now: Optional[float] = None) -> bool:
         """Check if alert should trigger.
         
         Args:
             data: Data to evaluate
+            now: Current ``time.monotonic()`` reading, shared across a tick
             
         Returns:
             True if alert should trigger
         """
         # Check cooldown
-        if self.last_triggered:
-            time_since_last = (datetime.now(timezone.utc) - self.last_triggered).total_seconds()
-            if time_since_last < self.cooldown_seconds:
-                return False
+        if (time.monotonic() if now is None else now) < self._cooldown_until:
+            return False
         
         # Check condition
         try:
@@ -141,16 +205,24 @@ class AlertRule:
             logger.error("Error evaluating alert condition", rule=self.name, error=str(e))
             return False
     
-    def trigger(self, data: Dict[str, Any]) -> Alert:
+    def trigger(
+        self,
+        data: Dict[str, Any],
+        timestamp: Optional[datetime] = None,
+        now: Optional[float] = None,
+    ) -> Alert:
         """Trigger the alert.
         
         Args:
             data: Data for the alert
+            timestamp: Wall-clock time of the alert, shared across a tick
+            now: Current ``time.monotonic()`` reading, shared across a tick
             
         Returns:
             Generated alert
         """
-        self.last_triggered = datetime.now(timezone.utc)
+        self.last_triggered = timestamp or datetime.now(timezone.utc)
+        self._cooldown_until = (time.monotonic() if now is None else now) + self.cooldown_seconds
         
         # Format message
         try:
@@ -163,6 +235,7 @@ class AlertRule:
             level=self.level,
             message=message,
             details=data,
+            timestamp=self.last_triggered,
         )
 
 
@@ -172,17 +245,46 @@ class AlertManager:
     def __init__(self):
         """Initialize the alert manager."""
         self.settings = get_settings()
+        self.log = logger.bind(component="alert_manager")
+        self._info_enabled = is_log_enabled(self.log, logging.INFO)
         self.rules: List[AlertRule] = []
-        self.alert_history: List[Alert] = []
-        self.max_history_size = 1000
         
-        # Notification callbacks
+        # Rules indexed by the data keys they watch, plus rules that watch
+        # every payload, so evaluation skips rules the data cannot trigger
+        self._rules_by_key: Dict[str, List[AlertRule]] = {}
+        self._unkeyed_rules: List[AlertRule] = []
+        self._rule_order: Dict[AlertRule, int] = {}
+        
+        # Rules out of cooldown, and a heap of (cooldown end, order, rule) for
+        # the rest, so ticks never look at rules that are cooling down
+        self._eligible: Set[AlertRule] = set()
+        self._cooling: List[Tuple[float, int, AlertRule]] = []
+        self.max_history_size = MAX_ALERT_HISTORY
+        
+        # Bounded histories: appends evict the oldest alert in O(1), and the
+        # per-level/per-type views keep filtered getters from rescanning
+        self.alert_history: Deque[Alert] = deque(maxlen=self.max_history_size)
+        self._history_by_level: Dict[AlertLevel, Deque[Alert]] = {
+            level: deque(maxlen=self.max_history_size) for level in AlertLevel
+        }
+        self._history_by_type: Dict[AlertType, Deque[Alert]] = {
+            alert_type: deque(maxlen=self.max_history_size) for alert_type in AlertType
+        }
+        
+        # Per-minute alert counts by level and type, so summaries sum a few
+        # buckets instead of rescanning the history
+        self._summary_buckets: Dict[int, Counter] = {}
+        self._summary_retention_hours = DEFAULT_SUMMARY_RETENTION_HOURS
+        
+        # Notification callbacks, split by kind at registration
         self.notification_callbacks: List[Callable[[Alert], None]] = []
+        self._async_callbacks: List[Callable[[Alert], Any]] = []
+        self._sync_callbacks: List[Callable[[Alert], None]] = []
         
         # Setup default rules
         self._setup_default_rules()
         
-        logger.info("Initialized alert manager")
+        self.log.info("Initialized alert manager")
     
     def _setup_default_rules(self) -> None:
         """Setup default alert rules."""
@@ -192,9 +294,10 @@ class AlertManager:
             name="bot_stopped",
             alert_type=AlertType.BOT_STOPPED,
             level=AlertLevel.ERROR,
-            condition=lambda data: not data.get("running", True),
+            condition="not data.get('running', True)",
             message_template="Trading bot has stopped running",
             cooldown_seconds=60,
+            watched_keys={"running"},
         ))
         
         # Risk management rules
@@ -202,9 +305,10 @@ class AlertManager:
             name="risk_limit_exceeded",
             alert_type=AlertType.RISK_LIMIT_EXCEEDED,
             level=AlertLevel.CRITICAL,
-            condition=lambda data: data.get("risk_exceeded", False),
+            condition="data.get('risk_exceeded', False)",
             message_template="Risk limit exceeded: {risk_details}",
             cooldown_seconds=300,
+            watched_keys={"risk_exceeded"},
         ))
         
         # Data quality rules
@@ -212,9 +316,10 @@ class AlertManager:
             name="data_stale",
             alert_type=AlertType.DATA_STALE,
             level=AlertLevel.WARNING,
-            condition=lambda data: data.get("data_age_hours", 0) > 1,
+            condition="data.get('data_age_hours', 0) > 1",
             message_template="Data is stale: {data_age_hours:.1f} hours old",
             cooldown_seconds=600,
+            watched_keys={"data_age_hours"},
         ))
         
         # WebSocket connection rules
@@ -222,9 +327,10 @@ class AlertManager:
             name="websocket_disconnected",
             alert_type=AlertType.WEBSOCKET_DISCONNECTED,
             level=AlertLevel.ERROR,
-            condition=lambda data: not data.get("websocket_connected", True),
+            condition="not data.get('websocket_connected', True)",
             message_template="WebSocket connection lost",
             cooldown_seconds=60,
+            watched_keys={"websocket_connected"},
         ))
         
         # Performance rules
@@ -232,9 +338,10 @@ class AlertManager:
             name="low_success_rate",
             alert_type=AlertType.LOW_SUCCESS_RATE,
             level=AlertLevel.WARNING,
-            condition=lambda data: data.get("success_rate", 1.0) < 0.5,
+            condition="data.get('success_rate', 1.0) < 0.5",
             message_template="Low success rate: {success_rate:.1%}",
             cooldown_seconds=900,
+            watched_keys={"success_rate"},
         ))
         
         # Order execution rules
@@ -242,12 +349,13 @@ class AlertManager:
             name="order_failed",
             alert_type=AlertType.ORDER_FAILED,
             level=AlertLevel.ERROR,
-            condition=lambda data: data.get("order_failed", False),
+            condition="data.get('order_failed', False)",
             message_template="Order execution failed: {order_details}",
             cooldown_seconds=60,
+            watched_keys={"order_failed"},
         ))
         
-        logger.info("Setup default alert rules", count=len(self.rules))
+        self.log.info("Setup default alert rules", count=len(self.rules))
     
     def add_rule(self, rule: AlertRule) -> None:
         """Add an alert rule.
@@ -256,7 +364,8 @@ class AlertManager:
             rule: Alert rule to add
         """
         self.rules.append(rule)
-        logger.info("Added alert rule", rule=rule.name)
+        self._index_rule(rule)
+        self.log.debug("Added alert rule", rule=rule.name)
     
     def remove_rule(self, rule_name: str) -> bool:
         """Remove an alert rule.
@@ -270,10 +379,39 @@ class AlertManager:
         for i, rule in enumerate(self.rules):
             if rule.name == rule_name:
                 del self.rules[i]
-                logger.info("Removed alert rule", rule=rule_name)
+                self._rebuild_rule_index()
+                self.log.info("Removed alert rule", rule=rule_name)
                 return True
         return False
     
+    def _index_rule(self, rule: AlertRule) -> None:
+        """Add a rule to the watched-key index.
+        
+        Args:
+            rule: Alert rule to index
+        """
+        self._rule_order[rule] = len(self._rule_order)
+        if rule._cooldown_until > time.monotonic():
+            heapq.heappush(self._cooling, (rule._cooldown_until, self._rule_order[rule], rule))
+        else:
+            self._eligible.add(rule)
+        
+        if rule.watched_keys is None:
+            self._unkeyed_rules.append(rule)
+            return
+        for key in rule.watched_keys:
+            self._rules_by_key.setdefault(key, []).append(rule)
+    
+    def _rebuild_rule_index(self) -> None:
+        """Rebuild the watched-key index from the rule list."""
+        self._rules_by_key = {}
+        self._unkeyed_rules = []
+        self._rule_order = {}
+        self._eligible = set()
+        self._cooling = []
+        for rule in self.rules:
+            self._index_rule(rule)
+    
     def add_notification_callback(self, callback: Callable[[Alert], None]) -> None:
         """Add a notification callback.
         
@@ -281,10 +419,18 @@ class AlertManager:
             callback: Function to call when alert is triggered
         """
         self.notification_callbacks.append(callback)
-        logger.info("Added notification callback")
+        if asyncio.iscoroutinefunction(callback):
+            self._async_callbacks.append(callback)
+        else:
+            self._sync_callbacks.append(callback)
+        self.log.info("Added notification callback")
     
     async def evaluate_alerts(self, data: Dict[str, Any]) -> List[Alert]:
-        """Evaluate all alert rules against data.
+        """Evaluate the alert rules watching the data against it.
+        
+        Only rules watching one of the payload keys (or watching every
+        payload) are considered, and rules still in cooldown are kept in a
+        heap until it expires, so they cost nothing per tick.
         
         Args:
             data: Data to evaluate
@@ -294,49 +440,75 @@ class AlertManager:
         """
         triggered_alerts = []
         
-        for rule in self.rules:
+        # Read the clocks once per tick; wall-clock time only when needed
+        now = time.monotonic()
+        timestamp = None
+        
+        # Return rules whose cooldown has expired to the eligible set
+        while self._cooling and self._cooling[0][0] <= now:
+            self._eligible.add(heapq.heappop(self._cooling)[2])
+        
+        candidates = set(self._unkeyed_rules)
+        for key in data:
+            rules = self._rules_by_key.get(key)
+            if rules:
+                candidates.update(rules)
+        candidates &= self._eligible
+        
+        for rule in sorted(candidates, key=self._rule_order.__getitem__):
+            # Rules triggered outside this manager are not in the heap
+            if now < rule._cooldown_until:
+                continue
             try:
-                if rule.should_trigger(data):
-                    alert = rule.trigger(data)
+                # Cooldown was checked above, so call the condition directly
+                if rule.condition(data):
+                    if timestamp is None:
+                        timestamp = datetime.now(timezone.utc)
+                    alert = rule.trigger(data, timestamp, now)
                     triggered_alerts.append(alert)
+                    self._eligible.discard(rule)
+                    heapq.heappush(self._cooling, (rule._cooldown_until, self._rule_order[rule], rule))
                     
                     # Add to history
                     self.alert_history.append(alert)
-                    
-                    # Trim history
-                    if len(self.alert_history) > self.max_history_size:
-                        self.alert_history = self.alert_history[-self.max_history_size:]
-                    
-                    logger.info(
-                        "Alert triggered",
-                        rule=rule.name,
-                        level=alert.level.value,
-                        message=alert.message,
-                    )
+                    self._history_by_level[alert.level].append(alert)
+                    self._history_by_type[alert.alert_type].append(alert)
+                    self._count_alert(alert)
             
             except Exception as e:
-                logger.error("Error evaluating alert rule", rule=rule.name, error=str(e))
+                self.log.error("Error evaluating alert rule", rule=rule.name, error=str(e))
         
         # Send notifications
-        for alert in triggered_alerts:
-            await self._send_notifications(alert)
+        if triggered_alerts:
+            if self._info_enabled:
+                self.log.info(
+                    "Alerts triggered",
+                    count=len(triggered_alerts),
+                    level=triggered_alerts[0].level.value,
+                    message=triggered_alerts[0].message,
+                )
+            await asyncio.gather(*(self._send_notifications(alert) for alert in triggered_alerts))
         
         return triggered_alerts
     
     async def _send_notifications(self, alert: Alert) -> None:
         """Send notifications for an alert.
         
+        Callbacks run concurrently, with sync ones in worker threads, so a
+        slow sink does not delay the others or block the event loop.
+        
         Args:
             alert: Alert to send notifications for
         """
-        for callback in self.notification_callbacks:
-            try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(alert)
-                else:
-                    callback(alert)
-            except Exception as e:
-                logger.error("Error sending notification", error=str(e))
+        notifications = [callback(alert) for callback in self._async_callbacks]
+        notifications.extend(asyncio.to_thread(callback, alert) for callback in self._sync_callbacks)
+        if not notifications:
+            return
+        
+        results = await asyncio.gather(*notifications, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                self.log.error("Error sending notification", error=str(result))
     
     def get_alert_history(self, limit: int = 100) -> List[Alert]:
         """Get alert history.
@@ -347,7 +519,7 @@ class AlertManager:
         Returns:
             List of recent alerts
         """
-        return self.alert_history[-limit:] if self.alert_history else []
+        return _latest(self.alert_history, limit)
     
     def get_alerts_by_level(self, level: AlertLevel, limit: int = 100) -> List[Alert]:
         """Get alerts by severity level.
@@ -359,8 +531,7 @@ class AlertManager:
         Returns:
             List of alerts with specified level
         """
-        filtered_alerts = [alert for alert in self.alert_history if alert.level == level]
-        return filtered_alerts[-limit:] if filtered_alerts else []
+        return _latest(self._history_by_level[level], limit)
     
     def get_alerts_by_type(self, alert_type: AlertType, limit: int = 100) -> List[Alert]:
         """Get alerts by type.
@@ -372,42 +543,63 @@ class AlertManager:
         Returns:
             List of alerts with specified type
         """
-        filtered_alerts = [alert for alert in self.alert_history if alert.alert_type == alert_type]
-        return filtered_alerts[-limit:] if filtered_alerts else []
+        return _latest(self._history_by_type[alert_type], limit)
+    
+    def _count_alert(self, alert: Alert) -> None:
+        """Add an alert to the per-minute summary counts.
+        
+        Args:
+            alert: Triggered alert
+        """
+        bucket = int(alert.timestamp.timestamp()) // SUMMARY_BUCKET_SECONDS
+        counts = self._summary_buckets.get(bucket)
+        if counts is None:
+            counts = self._summary_buckets[bucket] = Counter()
+            self._evict_summary_buckets(bucket)
+        counts[alert.level] += 1
+        counts[alert.alert_type] += 1
+    
+    def _evict_summary_buckets(self, current_bucket: int) -> None:
+        """Drop summary buckets older than any summary window requested.
+        
+        Args:
+            current_bucket: Newest bucket index
+        """
+        oldest = current_bucket - self._summary_retention_hours * 3600 // SUMMARY_BUCKET_SECONDS
+        # Buckets are created in time order, so stale ones are at the front
+        while self._summary_buckets:
+            bucket = next(iter(self._summary_buckets))
+            if bucket >= oldest:
+                break
+            del self._summary_buckets[bucket]
     
     def get_alert_summary(self, hours: int = 24) -> Dict[str, Any]:
         """Get alert summary for the last N hours.
         
+        Counts come from per-minute buckets, so the window is aligned to
+        whole minutes.
+        
         Args:
             hours: Number of hours to analyze
             
         Returns:
             Alert summary
         """
+        self._summary_retention_hours = max(self._summary_retention_hours, hours)
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+        cutoff_bucket = int(cutoff_time.timestamp()) // SUMMARY_BUCKET_SECONDS
         
-        recent_alerts = [
-            alert for alert in self.alert_history
-            if alert.timestamp >= cutoff_time
-        ]
-        
-        # Count by level
-        level_counts = {}
-        for level in AlertLevel:
-            level_counts[level.value] = len([
-                alert for alert in recent_alerts if alert.level == level
-            ])
+        totals: Counter = Counter()
+        for bucket, counts in self._summary_buckets.items():
+            if bucket >= cutoff_bucket:
+                totals.update(counts)
         
-        # Count by type
-        type_counts = {}
-        for alert_type in AlertType:
-            type_counts[alert_type.value] = len([
-                alert for alert in recent_alerts if alert.alert_type == alert_type
-            ])
+        level_counts = {level.value: totals[level] for level in AlertLevel}
+        type_counts = {alert_type.value: totals[alert_type] for alert_type in AlertType}
         
         return {
             "period_hours": hours,
-            "total_alerts": len(recent_alerts),
+            "total_alerts": sum(level_counts.values()),
             "level_counts": level_counts,
             "type_counts": type_counts,
             "most_common_type": max(type_counts.items(), key=lambda x: x[1])[0] if type_counts else None,
@@ -417,7 +609,12 @@ class AlertManager:
     def clear_history(self) -> None:
         """Clear alert history."""
         self.alert_history.clear()
-        logger.info("Cleared alert history")
+        for alerts in self._history_by_level.values():
+            alerts.clear()
+        for alerts in self._history_by_type.values():
+            alerts.clear()
+        self._summary_buckets.clear()
+        self.log.info("Cleared alert history")
     
     def get_rules_status(self) -> List[Dict[str, Any]]:
         """Get status of all alert rules.
@@ -431,6 +628,7 @@ class AlertManager:
                 "type": rule.alert_type.value,
                 "level": rule.level.value,
                 "cooldown_seconds": rule.cooldown_seconds,
+                "condition": rule.condition_expr,
                 "last_triggered": rule.last_triggered.isoformat() if rule.last_triggered else None,
                 "active": True,
             }
@@ -1,22 +1,66 @@
 """Dashboard manager for aggregating and displaying trading metrics."""
 
 import asyncio
-from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any
+import time
+from collections import deque
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Any, Tuple
+
+import numpy as np
 import structlog
 
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - pyarrow is only needed for exports
+    pa = None
+
 from ..core.settings import get_settings
 from ..core.types import TradingDecision, OHLCVData
+from ..core.utils import epoch_ns
 
 logger = structlog.get_logger(__name__)
 
+UTC = timezone.utc
+
+# Numeric columns kept per tick in the history ring arrays:
+# (name, dtype, metrics section, key in that section)
+SERIES_COLUMNS = (
+    ("analysis_count", np.int64, "performance_metrics", "analysis_count"),
+    ("decision_count", np.int64, "performance_metrics", "decision_count"),
+    ("order_count", np.int64, "performance_metrics", "order_count"),
+    ("success_rate", np.float64, "performance_metrics", "success_rate"),
+    ("open_orders", np.int64, "order_metrics", "open_orders"),
+    ("buffer_utilization", np.float64, "buffer_metrics", "utilization"),
+    ("total_dropped", np.int64, "buffer_metrics", "total_dropped"),
+)
+
+METRICS_SECTIONS = (
+    "bot_status",
+    "performance_metrics",
+    "order_metrics",
+    "buffer_metrics",
+    "risk_metrics",
+    "llm_metrics",
+)
+
+# Health check outcomes by mask bit: (response list, message)
+_HEALTH_MSGS = (
+    ("issues", "Bot is not running"),
+    ("warnings", "Low buffer utilization"),
+    ("warnings", "Low success rate"),
+    ("warnings", "High data drop rate"),
+)
+
 
 class DashboardMetrics:
     """Container for dashboard metrics."""
     
+    __slots__ = ("timestamp",) + METRICS_SECTIONS
+    
     def __init__(self):
         """Initialize dashboard metrics."""
-        self.timestamp = datetime.now(timezone.utc)
+        self.timestamp = datetime.now(UTC)
         self.bot_status = {}
         self.performance_metrics = {}
         self.order_metrics = {}
@@ -25,6 +69,17 @@ class DashboardMetrics:
         self.llm_metrics = {}
 
 
+def _refill(target: Dict[str, Any], values: Dict[str, Any]) -> None:
+    """Replace the contents of a pooled metrics dictionary in place.
+    
+    Args:
+        target: Dictionary owned by a pooled snapshot
+        values: New contents
+    """
+    target.clear()
+    target.update(values)
+
+
 class DashboardManager:
     """Manager for dashboard metrics and real-time updates."""
     
@@ -37,9 +92,24 @@ class DashboardManager:
         self.trading_loop = trading_loop
         self.settings = get_settings()
         
-        # Metrics history
-        self.metrics_history: List[DashboardMetrics] = []
+        # Metrics history (appends evict the oldest entry in O(1))
         self.max_history_size = 1000  # Keep last 1000 metrics
+        self.metrics_history: Deque[DashboardMetrics] = deque(maxlen=self.max_history_size)
+        
+        # Snapshots are recycled from a ring one larger than the history, so
+        # the slot being refilled has always left the history already
+        self._metrics_pool = [DashboardMetrics() for _ in range(self.max_history_size + 1)]
+        self._pool_index = 0
+        
+        # Numeric history as parallel ring arrays (struct of arrays), so
+        # summaries and exports read columns instead of walking snapshots.
+        # Timestamps are epoch nanoseconds.
+        self._series_count = 0
+        self._series_index = 0
+        self._hist_ts = np.zeros(self.max_history_size, dtype=np.int64)
+        self._series = {
+            name: np.zeros(self.max_history_size, dtype=dtype) for name, dtype, _, _ in SERIES_COLUMNS
+        }
         
         # Real-time metrics
         self.current_metrics = DashboardMetrics()
@@ -49,6 +119,20 @@ class DashboardManager:
         self.update_task: Optional[asyncio.Task] = None
         self.running = False
         
+        # Status fields the last full rebuild was made from
+        self._last_status_key: Optional[tuple] = None
+        
+        # Last bot start time string and its parsed value
+        self._parsed_start: Optional[Tuple[str, datetime]] = None
+        
+        # Failed health checks and the response built for them
+        self._last_health_mask = 0
+        self._health_response: Optional[Dict[str, Any]] = None
+        
+        # Clock reading shared by the last update tick
+        self._last_tick_now: Optional[datetime] = None
+        self._last_tick_monotonic = 0.0
+        
         logger.info("Initialized dashboard manager")
     
     async def start(self) -> None:
@@ -81,9 +165,19 @@ class DashboardManager:
     async def _update_loop(self) -> None:
         """Main update loop for dashboard metrics."""
         try:
+            # Schedule ticks against monotonic deadlines so the time spent
+            # updating does not push every later tick back
+            loop = asyncio.get_running_loop()
+            next_deadline = loop.time()
             while self.running:
                 await self._update_metrics()
-                await asyncio.sleep(self.update_interval)
+                next_deadline += self.update_interval
+                delay = next_deadline - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    # Overran a whole interval: restart the schedule from now
+                    next_deadline = loop.time()
         
         except asyncio.CancelledError:
             logger.info("Dashboard update loop cancelled")
@@ -97,83 +191,203 @@ class DashboardManager:
             if not self.trading_loop:
                 return
             
-            # Get trading loop status
-            status = self.trading_loop.get_status()
+            # Read the clock once for the whole tick
+            now_ns = time.time_ns()
+            now = datetime.fromtimestamp(now_ns / 1e9, UTC)
+            self._last_tick_now = now
+            self._last_tick_monotonic = time.monotonic()
             
-            # Update bot status
-            self.current_metrics.bot_status = {
-                "running": status.get("running", False),
-                "symbol": status.get("symbol", ""),
-                "strategy": status.get("strategy", ""),
-                "llm_provider": status.get("llm_provider", ""),
-                "start_time": status.get("start_time"),
-                "uptime": self._calculate_uptime(status.get("start_time")),
-            }
+            # Get trading loop status off the event loop, since it may take locks
+            status = await asyncio.to_thread(self.trading_loop.get_status)
             
-            # Update performance metrics
-            self.current_metrics.performance_metrics = {
-                "analysis_count": status.get("analysis_count", 0),
-                "decision_count": status.get("decision_count", 0),
-                "order_count": status.get("order_count", 0),
-                "success_rate": self._calculate_success_rate(status),
-            }
+            # Refill the next pooled snapshot in place
+            metrics = self._metrics_pool[self._pool_index]
             
-            # Update order metrics
+            # Rebuild the sections only if the status or risk state moved since the last tick
             order_status = status.get("order_manager_status", {})
-            self.current_metrics.order_metrics = {
-                "open_orders": order_status.get("open_orders", 0),
-                "max_orders": order_status.get("max_orders", 0),
-                "total_orders": order_status.get("total_orders", 0),
-                "successful_orders": order_status.get("successful_orders", 0),
-                "failed_orders": order_status.get("failed_orders", 0),
-                "success_rate": order_status.get("success_rate", 0),
-            }
-            
-            # Update buffer metrics
             buffer_info = status.get("buffer_info", {})
-            self.current_metrics.buffer_metrics = {
-                "current_size": buffer_info.get("current_size", 0),
-                "max_size": buffer_info.get("max_size", 0),
-                "utilization": buffer_info.get("utilization", 0),
-                "last_update": buffer_info.get("last_update"),
-                "total_received": buffer_info.get("total_received", 0),
-                "total_dropped": buffer_info.get("total_dropped", 0),
-            }
-            
-            # Update risk metrics
-            self.current_metrics.risk_metrics = {
-                "max_risk_per_trade": self.settings.binance.max_risk_per_trade,
-                "max_daily_trades": self.settings.trading.max_daily_trades,
-                "max_daily_loss": self.settings.trading.max_daily_loss,
-                "current_risk": self._calculate_current_risk(),
-            }
-            
-            # Update LLM metrics
-            self.current_metrics.llm_metrics = {
-                "provider": status.get("llm_provider", ""),
-                "primary_provider": self.settings.llm.primary_provider,
-                "fallback_providers": self.settings.llm.fallback_providers,
-                "max_requests_per_minute": self.settings.llm.max_requests_per_minute,
-            }
+            current_risk = self._calculate_current_risk()
+            status_key = (
+                tuple(current_risk.values()),
+                status.get("running"),
+                status.get("analysis_count"),
+                status.get("decision_count"),
+                status.get("order_count"),
+                order_status.get("open_orders"),
+                buffer_info.get("current_size"),
+                buffer_info.get("total_dropped"),
+            )
+            if status_key == self._last_status_key:
+                previous = self.current_metrics
+                for section in METRICS_SECTIONS:
+                    _refill(getattr(metrics, section), getattr(previous, section))
+                metrics.bot_status["uptime"] = self._calculate_uptime(status.get("start_time"), now)
+            else:
+                self._fill_metrics(metrics, status, now, current_risk)
+                self._last_status_key = status_key
             
             # Update timestamp
-            self.current_metrics.timestamp = datetime.now(timezone.utc)
-            
-            # Add to history
-            self.metrics_history.append(self.current_metrics)
+            metrics.timestamp = now
             
-            # Trim history
-            if len(self.metrics_history) > self.max_history_size:
-                self.metrics_history = self.metrics_history[-self.max_history_size:]
+            # Publish the snapshot and add it to history
+            self._pool_index = (self._pool_index + 1) % len(self._metrics_pool)
+            self.current_metrics = metrics
+            self._append_history(metrics, now_ns)
         
         except Exception as e:
             logger.error("Error updating dashboard metrics", error=str(e))
     
-    def _calculate_uptime(self, start_time: Optional[str]) -> Optional[str]:
+    def _fill_metrics(
+        self,
+        metrics: DashboardMetrics,
+        status: Dict[str, Any],
+        now: datetime,
+        current_risk: Dict[str, Any],
+    ) -> None:
+        """Build every metrics section from a trading loop status.
+        
+        Args:
+            metrics: Pooled snapshot to fill
+            status: Trading loop status
+            now: Time of the current tick
+            current_risk: Current risk metrics
+        """
+        # Update bot status
+        _refill(metrics.bot_status, {
+            "running": status.get("running", False),
+            "symbol": status.get("symbol", ""),
+            "strategy": status.get("strategy", ""),
+            "llm_provider": status.get("llm_provider", ""),
+            "start_time": status.get("start_time"),
+            "uptime": self._calculate_uptime(status.get("start_time"), now),
+        })
+        
+        # Update performance metrics
+        _refill(metrics.performance_metrics, {
+            "analysis_count": status.get("analysis_count", 0),
+            "decision_count": status.get("decision_count", 0),
+            "order_count": status.get("order_count", 0),
+            "success_rate": self._calculate_success_rate(status),
+        })
+        
+        # Update order metrics
+        order_status = status.get("order_manager_status", {})
+        _refill(metrics.order_metrics, {
+            "open_orders": order_status.get("open_orders", 0),
+            "max_orders": order_status.get("max_orders", 0),
+            "total_orders": order_status.get("total_orders", 0),
+            "successful_orders": order_status.get("successful_orders", 0),
+            "failed_orders": order_status.get("failed_orders", 0),
+            "success_rate": order_status.get("success_rate", 0),
+        })
+        
+        # Update buffer metrics
+        buffer_info = status.get("buffer_info", {})
+        _refill(metrics.buffer_metrics, {
+            "current_size": buffer_info.get("current_size", 0),
+            "max_size": buffer_info.get("max_size", 0),
+            "utilization": buffer_info.get("utilization", 0),
+            "last_update": buffer_info.get("last_update"),
+            "total_received": buffer_info.get("total_received", 0),
+            "total_dropped": buffer_info.get("total_dropped", 0),
+        })
+        
+        # Update risk metrics
+        _refill(metrics.risk_metrics, {
+            "max_risk_per_trade": self.settings.binance.max_risk_per_trade,
+            "max_daily_trades": self.settings.trading.max_daily_trades,
+            "max_daily_loss": self.settings.trading.max_daily_loss,
+            "current_risk": current_risk,
+        })
+        
+        # Update LLM metrics
+        _refill(metrics.llm_metrics, {
+            "provider": status.get("llm_provider", ""),
+            "primary_provider": self.settings.llm.primary_provider,
+            "fallback_providers": self.settings.llm.fallback_providers,
+            "max_requests_per_minute": self.settings.llm.max_requests_per_minute,
+        })
+    
+    def _append_history(self, metrics: DashboardMetrics, timestamp_ns: Optional[int] = None) -> None:
+        """Add a snapshot to the history and its numbers to the ring arrays.
+        
+        Args:
+            metrics: Completed metrics snapshot
+            timestamp_ns: Snapshot time in epoch nanoseconds (derived from
+                ``metrics.timestamp`` if not given)
+        """
+        self.metrics_history.append(metrics)
+        
+        i = self._series_index
+        self._hist_ts[i] = epoch_ns(metrics.timestamp) if timestamp_ns is None else timestamp_ns
+        for name, _, section, key in SERIES_COLUMNS:
+            self._series[name][i] = getattr(metrics, section).get(key) or 0
+        
+        self._series_index = (i + 1) % self.max_history_size
+        self._series_count = min(self._series_count + 1, self.max_history_size)
+    
+    def _ring_segments(self, array: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Split the filled part of a ring array into its two runs.
+        
+        Args:
+            array: History ring array
+            
+        Returns:
+            Views of the older and newer runs, each in time order
+        """
+        if self._series_count < self.max_history_size:
+            return array[:0], array[:self._series_count]
+        return array[self._series_index:], array[:self._series_index]
+    
+    def _chronological(self, array: np.ndarray) -> np.ndarray:
+        """Get the filled part of a ring array, oldest first.
+        
+        Args:
+            array: History ring array
+            
+        Returns:
+            Array of the recorded values in time order
+        """
+        older, newer = self._ring_segments(array)
+        return np.concatenate((older, newer)) if older.size else newer
+    
+    def get_metrics_series(self) -> Dict[str, np.ndarray]:
+        """Get the numeric metrics history as columns.
+        
+        Returns:
+            Mapping of column name to values oldest first, including
+            ``timestamp`` as ``datetime64[ns]`` (UTC)
+        """
+        series = {"timestamp": self._chronological(self._hist_ts).astype("datetime64[ns]")}
+        for name in self._series:
+            series[name] = self._chronological(self._series[name])
+        return series
+    
+    def get_metrics_history_arrow(self) -> "pa.Table":
+        """Get the numeric metrics history as an Arrow table.
+        
+        Built straight from the history ring arrays, so exporters can write
+        JSON, Parquet or Feather in one call instead of walking snapshots.
+        
+        Returns:
+            Table with one row per recorded tick, oldest first
+            
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if pa is None:
+            raise ImportError('pyarrow is required for Arrow exports: pip install -e ".[export]"')
+        
+        series = self.get_metrics_series()
+        series["timestamp"] = pa.array(series["timestamp"], type=pa.timestamp("ns", tz="UTC"))
+        return pa.table(series)
+    
+    def _calculate_uptime(self, start_time: Optional[str], now: Optional[datetime] = None) -> Optional[str]:
         """Calculate bot uptime.
         
         Args:
             start_time: Bot start time as ISO string
+            now: Current time (defaults to the clock)
             
         Returns:
             Uptime as formatted string
@@ -182,8 +396,11 @@ class DashboardManager:
             return None
         
         try:
-            start = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-            uptime = datetime.now(timezone.utc) - start
+            # The start time rarely changes, so keep the last parse
+            if self._parsed_start is None or self._parsed_start[0] != start_time:
+                self._parsed_start = (start_time, datetime.fromisoformat(start_time.replace('Z', '+00:00')))
+            start = self._parsed_start[1]
+            uptime = (now or datetime.now(UTC)) - start
             
             days = uptime.days
             hours, remainder = divmod(uptime.seconds, 3600)
@@ -224,6 +441,9 @@ class DashboardManager:
     def _calculate_current_risk(self) -> Dict[str, Any]:
         """Calculate current risk metrics.
         
+        The risk manager serves a cached status dict, so it is read directly
+        rather than through a worker thread.
+        
         Returns:
             Dictionary with current risk information
         """
@@ -261,7 +481,8 @@ class DashboardManager:
         Returns:
             List of historical metrics
         """
-        return self.metrics_history[-limit:] if self.metrics_history else []
+        size = len(self.metrics_history)
+        return list(islice(self.metrics_history, max(0, size - limit), size))
     
     def get_performance_summary(self, hours: int = 24) -> Dict[str, Any]:
         """Get performance summary for the last N hours.
@@ -273,15 +494,15 @@ class DashboardManager:
             Performance summary
         """
         try:
-            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+            cutoff_ns = time.time_ns() - int(hours * 3600 * 1_000_000_000)
             
-            # Filter metrics within time range
-            recent_metrics = [
-                m for m in self.metrics_history
-                if m.timestamp >= cutoff_time
-            ]
+            # Binary search the window start in each sorted run of the ring
+            older, newer = self._ring_segments(self._hist_ts)
+            older_start = int(np.searchsorted(older, cutoff_ns, side="left"))
+            newer_start = int(np.searchsorted(newer, cutoff_ns, side="left"))
+            metrics_count = (older.size - older_start) + (newer.size - newer_start)
             
-            if not recent_metrics:
+            if metrics_count == 0:
                 return {
                     "period_hours": hours,
                     "total_analyses": 0,
@@ -291,16 +512,18 @@ class DashboardManager:
                     "average_analysis_interval": 0.0,
                 }
             
-            # Calculate summary
-            total_analyses = recent_metrics[-1].performance_metrics.get("analysis_count", 0)
-            total_decisions = recent_metrics[-1].performance_metrics.get("decision_count", 0)
-            total_orders = recent_metrics[-1].performance_metrics.get("order_count", 0)
-            success_rate = recent_metrics[-1].performance_metrics.get("success_rate", 0.0)
+            # Calculate summary from the newest entry
+            last = (self._series_index - 1) % self.max_history_size
+            total_analyses = int(self._series["analysis_count"][last])
+            total_decisions = int(self._series["decision_count"][last])
+            total_orders = int(self._series["order_count"][last])
+            success_rate = float(self._series["success_rate"][last])
             
             # Calculate average analysis interval
-            if len(recent_metrics) > 1:
-                time_span = (recent_metrics[-1].timestamp - recent_metrics[0].timestamp).total_seconds()
-                average_interval = time_span / len(recent_metrics) if len(recent_metrics) > 0 else 0
+            if metrics_count > 1:
+                first_ns = older[older_start] if older_start < older.size else newer[newer_start]
+                time_span = (self._hist_ts[last] - first_ns) / 1e9
+                average_interval = float(time_span / metrics_count)
             else:
                 average_interval = 0
             
@@ -311,13 +534,23 @@ class DashboardManager:
                 "total_orders": total_orders,
                 "success_rate": success_rate,
                 "average_analysis_interval": average_interval,
-                "metrics_count": len(recent_metrics),
+                "metrics_count": metrics_count,
             }
         
         except Exception as e:
             logger.error("Error calculating performance summary", error=str(e))
             return {}
     
+    def _check_time(self) -> datetime:
+        """Get the time of the last update tick, or now if it is stale.
+        
+        Returns:
+            Timezone-aware check time
+        """
+        if self._last_tick_now and time.monotonic() - self._last_tick_monotonic < self.update_interval:
+            return self._last_tick_now
+        return datetime.now(UTC)
+    
     def get_health_status(self) -> Dict[str, Any]:
         """Get overall health status of the trading bot.
         
@@ -325,37 +558,43 @@ class DashboardManager:
             Health status information
         """
         try:
+            last_check = self._check_time().isoformat()
+            
+            if not self.trading_loop:
+                return {
+                    "overall": "error",
+                    "issues": ["Trading loop not available"],
+                    "warnings": [],
+                    "last_check": last_check,
+                }
+            
+            # One bit per failed check, in _HEALTH_MSGS order
+            metrics = self.current_metrics
+            mask = (
+                int(not metrics.bot_status.get("running", False))
+                | int(metrics.buffer_metrics.get("utilization", 0) < 0.5) << 1
+                | int(metrics.performance_metrics.get("success_rate", 0) < 0.5) << 2
+                | int(metrics.buffer_metrics.get("total_dropped", 0) > 10) << 3
+            )
+            
+            # Reuse the messages while the same checks are failing
+            if self._health_response is not None and mask == self._last_health_mask:
+                return {**self._health_response, "last_check": last_check}
+            
             health_status = {
                 "overall": "healthy",
                 "issues": [],
                 "warnings": [],
-                "last_check": datetime.now(timezone.utc).isoformat(),
+                "last_check": last_check,
             }
-            
-            if not self.trading_loop:
+            for bit, (kind, message) in enumerate(_HEALTH_MSGS):
+                if mask & (1 << bit):
+                    health_status[kind].append(message)
+            if health_status["issues"]:
                 health_status["overall"] = "error"
-                health_status["issues"].append("Trading loop not available")
-                return health_status
-            
-            # Check bot status
-            if not self.current_metrics.bot_status.get("running", False):
-                health_status["overall"] = "error"
-                health_status["issues"].append("Bot is not running")
-            
-            # Check buffer utilization
-            buffer_util = self.current_metrics.buffer_metrics.get("utilization", 0)
-            if buffer_util < 0.5:
-                health_status["warnings"].append("Low buffer utilization")
-            
-            # Check success rate
-            success_rate = self.current_metrics.performance_metrics.get("success_rate", 0)
-            if success_rate < 0.5:
-                health_status["warnings"].append("Low success rate")
-            
-            # Check for recent errors
-            if self.current_metrics.buffer_metrics.get("total_dropped", 0) > 10:
-                health_status["warnings"].append("High data drop rate")
             
+            self._last_health_mask = mask
+            self._health_response = health_status
             return health_status
         
         except Exception as e:
@@ -364,5 +603,5 @@ class DashboardManager:
                 "overall": "error",
                 "issues": [f"Health check failed: {str(e)}"],
                 "warnings": [],
-                "last_check": datetime.now(timezone.utc).isoformat(),
+                "last_check": datetime.now(UTC).isoformat(),
             }
@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
 
+import numpy as np
 import structlog
 
 from ..core.types import OHLCVData, TechnicalIndicators, TradingDecision, StrategyConfig
@@ -10,6 +11,9 @@ from ..llm.base import BaseLLMClient
 
 logger = structlog.get_logger(__name__)
 
+# Direction of a favourable price move per order side; anything else is a sell
+_SIGN = {"BUY": 1.0, "SELL": -1.0}
+
 
 class StrategyError(Exception):
     """Exception raised during strategy operations."""
@@ -17,7 +21,13 @@ class StrategyError(Exception):
 
 
 class BaseStrategy(ABC):
-    """Base class for trading strategies."""
+    """Base class for trading strategies.
+    
+    Subclasses that add no instance attributes can declare empty
+    ``__slots__`` to avoid a per-instance ``__dict__``.
+    """
+    
+    __slots__ = ("name", "description", "llm_client")
     
     def __init__(self, name: str, description: str, llm_client: Optional[BaseLLMClient] = None):
         """Initialize the strategy.
@@ -115,10 +125,7 @@ class BaseStrategy(ABC):
         Returns:
             Stop loss price
         """
-        if side == "BUY":
-            return entry_price * (1 - stop_loss_pct)
-        else:  # SELL
-            return entry_price * (1 + stop_loss_pct)
+        return entry_price * (1.0 - _SIGN.get(side, -1.0) * stop_loss_pct)
     
     def calculate_take_profit(
         self,
@@ -136,10 +143,35 @@ class BaseStrategy(ABC):
         Returns:
             Take profit price
         """
-        if side == "BUY":
-            return entry_price * (1 + take_profit_pct)
-        else:  # SELL
-            return entry_price * (1 - take_profit_pct)
+        return entry_price * (1.0 + _SIGN.get(side, -1.0) * take_profit_pct)
+    
+    def calculate_stop_loss_vec(self, entry_prices: np.ndarray, sides: np.ndarray, stop_loss_pct: float) -> np.ndarray:
+        """Calculate stop loss prices for many entries at once.
+        
+        Args:
+            entry_prices: Entry prices
+            sides: Order sides (BUY/SELL) matching ``entry_prices``
+            stop_loss_pct: Stop loss percentage
+            
+        Returns:
+            Stop loss prices
+        """
+        signs = np.where(np.asarray(sides) == "BUY", 1.0, -1.0)
+        return np.asarray(entry_prices, dtype=float) * (1.0 - signs * stop_loss_pct)
+    
+    def calculate_take_profit_vec(self, entry_prices: np.ndarray, sides: np.ndarray, take_profit_pct: float) -> np.ndarray:
+        """Calculate take profit prices for many entries at once.
+        
+        Args:
+            entry_prices: Entry prices
+            sides: Order sides (BUY/SELL) matching ``entry_prices``
+            take_profit_pct: Take profit percentage
+            
+        Returns:
+            Take profit prices
+        """
+        signs = np.where(np.asarray(sides) == "BUY", 1.0, -1.0)
+        return np.asarray(entry_prices, dtype=float) * (1.0 + signs * take_profit_pct)
     
     def get_strategy_info(self) -> Dict[str, str]:
         """Get strategy information.
@@ -1,16 +1,155 @@
 """LLM-powered trading strategy implementation."""
 
+import math
+import re
 from decimal import Decimal
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 import structlog
 
 from .base import BaseStrategy
 from ..core.types import OHLCVData, TechnicalIndicators, TradingDecision, StrategyConfig, OrderSide
+from ..core.utils import json_loads
 from ..llm.base import BaseLLMClient
 
 logger = structlog.get_logger(__name__)
 
+# Longest free-text response kept as decision reasoning
+MAX_REASONING_CHARS = 200
+
+# Exponent for converting float prices and sizes back to Decimal
+_Q8 = Decimal("0.00000001")
+_ZERO = Decimal("0")
+
+# Quantizing to 8 places keeps 28 significant digits, so larger magnitudes overflow
+_MAX_Q8_VALUE = 1e20
+
+_CONFIDENCE_RE = re.compile(r'(?:confidence|conf):\s*(\d+(?:\.\d+)?)', re.IGNORECASE)
+
+
+_PROMPT_TEMPLATE = """
+        You are an expert trading analyst. Analyze the following market data and make a trading decision.
+
+        Market Data:
+        - Symbol: {symbol}
+        - Current Price: ${current_price:.2f}
+        - Price Changes: {price_changes}
+        - Technical Indicators:
+          * RSI: {rsi}
+          * SMA(20): {sma_20}
+          * EMA(20): {ema_20}
+          * ATR: {atr}
+          * Volatility: {volatility}
+        - Market Signals:
+          * Trend: {trend}
+          * Momentum: {momentum}
+          * Volatility Regime: {volatility_regime}
+
+{config_block}
+
+        Based on this analysis, provide a trading decision in the following JSON format:
+        {{
+            "action": "BUY" | "SELL" | "HOLD",
+            "confidence": 0.0-1.0,
+            "reasoning": "Brief explanation of the decision",
+            "risk_score": 0.0-1.0
+        }}
+
+        Consider:
+        1. Technical indicators and their signals
+        2. Market trend and momentum
+        3. Risk management parameters
+        4. Current volatility conditions
+        5. Price action and volume patterns
+
+        Only recommend BUY or SELL if you have high confidence (>70%) and clear signals.
+        """
+
+
+@lru_cache(maxsize=32)
+def _config_block(max_risk_per_trade: float, stop_loss_pct: float, take_profit_pct: float, min_confidence: float) -> str:
+    """Render the strategy configuration section of the decision prompt.
+    
+    Keyed on the values rather than the config object, so edits to a
+    config are picked up while unchanged configs reuse the rendered text.
+    
+    Returns:
+        Configuration section text
+    """
+    return (
+        "        Strategy Configuration:\n"
+        f"        - Max Risk per Trade: {max_risk_per_trade:.1%}\n"
+        f"        - Stop Loss: {stop_loss_pct:.1%}\n"
+        f"        - Take Profit: {take_profit_pct:.1%}\n"
+        f"        - Min Confidence: {min_confidence:.1%}"
+    )
+
+
+def _summarize_response(response: str) -> str:
+    """Shorten a free-text LLM response for use as decision reasoning.
+    
+    Args:
+        response: LLM response string
+        
+    Returns:
+        Response truncated to ``MAX_REASONING_CHARS`` characters
+    """
+    if len(response) <= MAX_REASONING_CHARS:
+        return response
+    return response[:MAX_REASONING_CHARS] + "..."
+
+
+def _extract_json_object(response: str) -> Optional[str]:
+    """Get the text from the first ``{`` to the last ``}`` of a response.
+    
+    Equivalent to a greedy ``{.*}`` DOTALL match, found with two scans
+    instead of regex backtracking.
+    
+    Args:
+        response: LLM response string
+        
+    Returns:
+        Candidate JSON object text, or None if there is none
+    """
+    start = response.find("{")
+    if start == -1:
+        return None
+    end = response.rfind("}")
+    if end < start:
+        return None
+    return response[start:end + 1]
+
+
+def _finite_float(value) -> Optional[float]:
+    """Convert an LLM-supplied number to a finite float.
+    
+    Args:
+        value: Number or numeric string from the parsed response
+        
+    Returns:
+        The value as a float, or None if it is not a finite number
+    """
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def _to_q8(value: float) -> Optional[Decimal]:
+    """Convert a float price or size to an 8-decimal Decimal.
+    
+    Args:
+        value: Float to convert
+        
+    Returns:
+        Quantized Decimal, or None if the value is not finite or too large to quantize
+    """
+    if not math.isfinite(value) or abs(value) >= _MAX_Q8_VALUE:
+        return None
+    return Decimal.from_float(value).quantize(_Q8)
+
 
 class LLMStrategy(BaseStrategy):
     """LLM-powered trading strategy that uses AI for decision making."""
@@ -26,6 +165,10 @@ class LLMStrategy(BaseStrategy):
             description="AI-powered trading strategy using LLM for decision making",
             llm_client=llm_client
         )
+        
+        # Float prices of the last candle list seen, keyed by its newest candle
+        self._snapshot_key: Optional[Tuple[OHLCVData, int]] = None
+        self._snapshot: Optional[Tuple[float, Dict[int, float], List[float]]] = None
     
     def decide(
         self,
@@ -83,15 +226,13 @@ class LLMStrategy(BaseStrategy):
         Returns:
             Market analysis dictionary
         """
-        current_price = float(data[-1].close)
+        current_price, past_closes, recent_volumes = self._price_snapshot(data)
         symbol = data[-1].symbol
         
         # Calculate price change over different periods
         price_changes = {}
-        if len(data) >= 5:
-            price_changes["5_period"] = (current_price - float(data[-5].close)) / float(data[-5].close)
-        if len(data) >= 20:
-            price_changes["20_period"] = (current_price - float(data[-20].close)) / float(data[-20].close)
+        for period, past_close in past_closes.items():
+            price_changes[f"{period}_period"] = (current_price - past_close) / past_close
         
         # Prepare analysis
         analysis = {
@@ -106,11 +247,36 @@ class LLMStrategy(BaseStrategy):
                 "volatility": indicators.volatility,
             },
             "market_signals": signals,
-            "recent_volumes": [float(point.volume) for point in data[-10:]] if len(data) >= 10 else [],
+            "recent_volumes": recent_volumes,
         }
         
         return analysis
     
+    def _price_snapshot(self, data: List[OHLCVData]) -> Tuple[float, Dict[int, float], List[float]]:
+        """Convert the prices used by a decision to floats once per candle.
+        
+        The result is reused while the newest candle and length of ``data``
+        are unchanged, so analysis and decision building share one set of
+        Decimal to float conversions.
+        
+        Args:
+            data: Historical OHLCV data
+            
+        Returns:
+            Current close, past closes by lookback period, and the last 10
+            volumes (empty with fewer than 10 candles)
+        """
+        key = (data[-1], len(data))
+        if self._snapshot_key is not None and self._snapshot_key[0] is key[0] and self._snapshot_key[1] == key[1]:
+            return self._snapshot
+        
+        past_closes = {period: float(data[-period].close) for period in (5, 20) if len(data) >= period}
+        recent_volumes = [float(point.volume) for point in data[-10:]] if len(data) >= 10 else []
+        
+        self._snapshot_key = key
+        self._snapshot = (float(data[-1].close), past_closes, recent_volumes)
+        return self._snapshot
+    
     def _create_decision_prompt(self, market_analysis: Dict, config: StrategyConfig) -> str:
         """Create LLM prompt for trading decision.
         
@@ -121,49 +287,27 @@ class LLMStrategy(BaseStrategy):
         Returns:
             LLM prompt string
         """
-        prompt = f"""
-        You are an expert trading analyst. Analyze the following market data and make a trading decision.
-
-        Market Data:
-        - Symbol: {market_analysis['symbol']}
-        - Current Price: ${market_analysis['current_price']:.2f}
-        - Price Changes: {market_analysis['price_changes']}
-        - Technical Indicators:
-          * RSI: {market_analysis['technical_indicators']['rsi']}
-          * SMA(20): {market_analysis['technical_indicators']['sma_20']}
-          * EMA(20): {market_analysis['technical_indicators']['ema_20']}
-          * ATR: {market_analysis['technical_indicators']['atr']}
-          * Volatility: {market_analysis['technical_indicators']['volatility']}
-        - Market Signals:
-          * Trend: {market_analysis['market_signals'].get('trend', 'unknown')}
-          * Momentum: {market_analysis['market_signals'].get('momentum', 'unknown')}
-          * Volatility Regime: {market_analysis['market_signals'].get('volatility_regime', 'unknown')}
-
-        Strategy Configuration:
-        - Max Risk per Trade: {config.max_risk_per_trade:.1%}
-        - Stop Loss: {config.stop_loss_pct:.1%}
-        - Take Profit: {config.take_profit_pct:.1%}
-        - Min Confidence: {config.min_confidence:.1%}
-
-        Based on this analysis, provide a trading decision in the following JSON format:
-        {{
-            "action": "BUY" | "SELL" | "HOLD",
-            "confidence": 0.0-1.0,
-            "reasoning": "Brief explanation of the decision",
-            "risk_score": 0.0-1.0
-        }}
-
-        Consider:
-        1. Technical indicators and their signals
-        2. Market trend and momentum
-        3. Risk management parameters
-        4. Current volatility conditions
-        5. Price action and volume patterns
-
-        Only recommend BUY or SELL if you have high confidence (>70%) and clear signals.
-        """
-        
-        return prompt
+        indicators = market_analysis["technical_indicators"]
+        signals = market_analysis["market_signals"]
+        return _PROMPT_TEMPLATE.format_map({
+            "symbol": market_analysis["symbol"],
+            "current_price": market_analysis["current_price"],
+            "price_changes": market_analysis["price_changes"],
+            "rsi": indicators["rsi"],
+            "sma_20": indicators["sma_20"],
+            "ema_20": indicators["ema_20"],
+            "atr": indicators["atr"],
+            "volatility": indicators["volatility"],
+            "trend": signals.get("trend", "unknown"),
+            "momentum": signals.get("momentum", "unknown"),
+            "volatility_regime": signals.get("volatility_regime", "unknown"),
+            "config_block": _config_block(
+                config.max_risk_per_trade,
+                config.stop_loss_pct,
+                config.take_profit_pct,
+                config.min_confidence,
+            ),
+        })
     
     def _parse_llm_response(self, response: str) -> Dict:
         """Parse LLM response to extract decision data.
@@ -174,16 +318,19 @@ class LLMStrategy(BaseStrategy):
         Returns:
             Parsed decision data
         """
-        import json
-        import re
+        # Well-behaved responses are the JSON object itself
+        if response.lstrip().startswith("{"):
+            try:
+                return json_loads(response)
+            except ValueError:
+                pass
         
         try:
             # Try to extract JSON from response
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                json_str = json_match.group()
-                return json.loads(json_str)
-        except json.JSONDecodeError:
+            json_str = _extract_json_object(response)
+            if json_str:
+                return json_loads(json_str)
+        except ValueError:
             pass
         
         # Fallback parsing if JSON extraction fails
@@ -197,7 +344,7 @@ class LLMStrategy(BaseStrategy):
         
         # Extract confidence (look for numbers between 0-1 or 0-100)
         confidence = 0.5
-        confidence_match = re.search(r'(?:confidence|conf):\s*(\d+(?:\.\d+)?)', response_lower)
+        confidence_match = _CONFIDENCE_RE.search(response)
         if confidence_match:
             conf_value = float(confidence_match.group(1))
             if conf_value > 1:
@@ -208,7 +355,7 @@ class LLMStrategy(BaseStrategy):
         return {
             "action": action,
             "confidence": confidence,
-            "reasoning": response[:200] + "..." if len(response) > 200 else response,
+            "response": response,  # Summarized into reasoning only if the decision is used
             "risk_score": 0.5,  # Default risk score
         }
     
@@ -228,17 +375,25 @@ class LLMStrategy(BaseStrategy):
         Returns:
             Trading decision
         """
-        current_price = float(data[-1].close)
+        current_price = self._price_snapshot(data)[0]
         symbol = data[-1].symbol
         action = decision_data.get("action", "HOLD")
-        confidence = decision_data.get("confidence", 0.0)
-        reasoning = decision_data.get("reasoning", "No reasoning provided")
-        risk_score = decision_data.get("risk_score", 0.5)
+        confidence = _finite_float(decision_data.get("confidence", 0.0))
+        risk_score = _finite_float(decision_data.get("risk_score", 0.5))
+        if confidence is None or risk_score is None:
+            return self._create_no_action_decision(data, "Invalid LLM decision values")
         
         # Check confidence threshold
         if confidence < config.min_confidence:
             return self._create_no_action_decision(data, f"Confidence too low: {confidence:.1%}")
         
+        if "reasoning" in decision_data:
+            reasoning = decision_data["reasoning"]
+        elif "response" in decision_data:
+            reasoning = _summarize_response(decision_data["response"])
+        else:
+            reasoning = "No reasoning provided"
+        
         # Check if action is HOLD
         if action == "HOLD":
             return self._create_no_action_decision(data, reasoning)
@@ -258,13 +413,17 @@ class LLMStrategy(BaseStrategy):
             config.max_risk_per_trade,
         )
         
+        levels = [_to_q8(value) for value in (quantity, stop_loss_price, take_profit_price)]
+        if None in levels:
+            return self._create_no_action_decision(data, "Invalid LLM decision values")
+        
         return TradingDecision(
             action=side,
             symbol=symbol,
-            quantity=Decimal(str(quantity)),
-            price=Decimal(str(current_price)),
-            stop_loss=Decimal(str(stop_loss_price)),
-            take_profit=Decimal(str(take_profit_price)),
+            quantity=levels[0],
+            price=data[-1].close,
+            stop_loss=levels[1],
+            take_profit=levels[2],
             confidence=confidence,
             reasoning=reasoning,
             risk_score=risk_score,
@@ -280,11 +439,13 @@ class LLMStrategy(BaseStrategy):
         Returns:
             No-action trading decision
         """
-        return TradingDecision(
+        # Built without validation: the zero quantity and price that mark a
+        # no-action decision are outside the model's bounds for real orders
+        return TradingDecision.model_construct(
             action=OrderSide.BUY,  # Dummy action
             symbol=data[-1].symbol,
-            quantity=Decimal("0"),
-            price=Decimal("0"),
+            quantity=_ZERO,
+            price=_ZERO,
             stop_loss=None,
             take_profit=None,
             confidence=0.0,
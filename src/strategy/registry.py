@@ -41,12 +41,13 @@ class StrategyRegistry:
         Returns:
             Strategy instance or None if not found
         """
-        if name not in self._strategies:
-            logger.warning("Strategy not found", name=name, available=list(self._strategies.keys()))
+        strategies = self._strategies
+        strategy_class = strategies.get(name)
+        if strategy_class is None:
+            logger.warning("Strategy not found", name=name, available=list(strategies.keys()))
             return None
         
         try:
-            strategy_class = self._strategies[name]
             return strategy_class(**kwargs)
         except Exception as e:
             logger.error("Failed to create strategy", name=name, error=str(e))
@@ -0,0 +1,116 @@
+"""Technical signal scoring kernel, JIT-compiled with Numba when it is installed."""
+
+import math
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba is an optional speedup
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function as plain Python."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Signal codes returned by the kernel
+SIGNAL_HOLD = 0
+SIGNAL_BUY = 1
+SIGNAL_SELL = 2
+
+# Reason flags set by the kernel for the indicator checks
+RSI_OVERSOLD = 1
+RSI_OVERBOUGHT = 2
+RSI_NEUTRAL = 4
+PRICE_ABOVE_MAS = 8
+PRICE_BELOW_MAS = 16
+SMA_ABOVE_EMA = 32
+SMA_BELOW_EMA = 64
+
+# Market signal codes (0 is sideways trend / neutral momentum / normal volatility)
+TREND_BULLISH = 1
+TREND_BEARISH = 2
+MOMENTUM_STRONG = 1
+MOMENTUM_WEAK = 2
+VOLATILITY_HIGH = 1
+VOLATILITY_LOW = 2
+
+
+@njit(cache=True)
+def score_signals(
+    rsi: float,
+    sma_20: float,
+    ema_20: float,
+    price: float,
+    trend_code: int,
+    momentum_code: int,
+    volatility_code: int,
+):
+    """Score indicators and market signals into a trading signal.
+    
+    Missing indicators are passed as NaN and skip their checks.
+    
+    Args:
+        rsi: Relative Strength Index
+        sma_20: Simple moving average (20 periods)
+        ema_20: Exponential moving average (20 periods)
+        price: Current price
+        trend_code: Trend code (TREND_*)
+        momentum_code: Momentum code (MOMENTUM_*)
+        volatility_code: Volatility regime code (VOLATILITY_*)
+        
+    Returns:
+        Tuple of (score, signal code, reason flags)
+    """
+    score = 0.0
+    flags = 0
+    
+    if not math.isnan(rsi):
+        if rsi < 30:
+            score += 0.3
+            flags |= RSI_OVERSOLD
+        elif rsi > 70:
+            score -= 0.3
+            flags |= RSI_OVERBOUGHT
+        elif 40 <= rsi <= 60:
+            flags |= RSI_NEUTRAL
+    
+    if not math.isnan(sma_20) and not math.isnan(ema_20):
+        if price > sma_20 and price > ema_20:
+            score += 0.2
+            flags |= PRICE_ABOVE_MAS
+        elif price < sma_20 and price < ema_20:
+            score -= 0.2
+            flags |= PRICE_BELOW_MAS
+        
+        if sma_20 > ema_20:
+            score += 0.1
+            flags |= SMA_ABOVE_EMA
+        elif sma_20 < ema_20:
+            score -= 0.1
+            flags |= SMA_BELOW_EMA
+    
+    if trend_code == TREND_BULLISH:
+        score += 0.2
+    elif trend_code == TREND_BEARISH:
+        score -= 0.2
+    
+    if momentum_code == MOMENTUM_STRONG:
+        score += 0.1
+    elif momentum_code == MOMENTUM_WEAK:
+        score -= 0.1
+    
+    if volatility_code == VOLATILITY_HIGH:
+        score *= 0.8
+    elif volatility_code == VOLATILITY_LOW:
+        score *= 1.1
+    
+    if score > 0.3:
+        signal = SIGNAL_BUY
+    elif score < -0.3:
+        signal = SIGNAL_SELL
+    else:
+        signal = SIGNAL_HOLD
+    
+    return score, signal, flags
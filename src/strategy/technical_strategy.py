@@ -1,25 +1,151 @@
 """Technical analysis-based trading strategy implementation."""
 
 from decimal import Decimal
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import structlog
 
 from .base import BaseStrategy
+from .scoring_kernel import (
+    MOMENTUM_STRONG,
+    MOMENTUM_WEAK,
+    PRICE_ABOVE_MAS,
+    PRICE_BELOW_MAS,
+    RSI_NEUTRAL,
+    RSI_OVERBOUGHT,
+    RSI_OVERSOLD,
+    SIGNAL_BUY,
+    SIGNAL_HOLD,
+    SIGNAL_SELL,
+    SMA_ABOVE_EMA,
+    SMA_BELOW_EMA,
+    TREND_BEARISH,
+    TREND_BULLISH,
+    VOLATILITY_HIGH,
+    VOLATILITY_LOW,
+    score_signals,
+)
 from ..core.types import OHLCVData, TechnicalIndicators, TradingDecision, StrategyConfig, OrderSide
 
 logger = structlog.get_logger(__name__)
 
+_ZERO = Decimal("0")
+_ACCOUNT_BALANCE = 10000.0  # Placeholder for position sizing
+
+_SIGNALS = {SIGNAL_HOLD: "HOLD", SIGNAL_BUY: "BUY", SIGNAL_SELL: "SELL"}
+
+# Kernel code and reason per market signal value
+_TRENDS = {
+    "bullish": (TREND_BULLISH, "Bullish trend"),
+    "bearish": (TREND_BEARISH, "Bearish trend"),
+}
+_SIDEWAYS_TREND = (0, "Sideways trend")  # any other trend value
+_MOMENTUMS = {
+    "strong": (MOMENTUM_STRONG, "Strong momentum"),
+    "weak": (MOMENTUM_WEAK, "Weak momentum"),
+}
+_VOLATILITY_REGIMES = {
+    "high": (VOLATILITY_HIGH, "High volatility - reduced confidence"),
+    "low": (VOLATILITY_LOW, "Low volatility - increased confidence"),
+}
+_NO_REASON = (0, None)
+
+# Reasons for the moving average flags, in reporting order
+_MA_REASONS = (
+    (PRICE_ABOVE_MAS, "Price above moving averages"),
+    (PRICE_BELOW_MAS, "Price below moving averages"),
+    (SMA_ABOVE_EMA, "SMA above EMA (bullish)"),
+    (SMA_BELOW_EMA, "SMA below EMA (bearish)"),
+)
+
+DecideFn = Callable[[List[OHLCVData], TechnicalIndicators, Dict[str, str]], TradingDecision]
+
+
+def _config_key(config: StrategyConfig) -> Tuple[float, float, float, float]:
+    """Get the config values captured by :func:`_make_decide`.
+    
+    Args:
+        config: Strategy configuration
+        
+    Returns:
+        Tuple of (min confidence, stop loss, take profit, risk per trade)
+    """
+    return (config.min_confidence, config.stop_loss_pct, config.take_profit_pct, config.max_risk_per_trade)
+
+
+def _make_decide(strategy: "TechnicalStrategy", config: StrategyConfig) -> DecideFn:
+    """Build a decide function specialized for one strategy configuration.
+    
+    Config values and strategy methods are looked up once here and captured
+    as closure variables, so each decision skips those attribute lookups.
+    Stop loss and take profit percentages are folded into a per-signal side
+    table of price multipliers, and the risk percentage into an amount at risk.
+    
+    Args:
+        strategy: Strategy whose analysis and decision builders are used
+        config: Strategy configuration
+        
+    Returns:
+        Function taking (data, indicators, signals) and returning a decision
+    """
+    min_confidence = config.min_confidence
+    stop_loss_pct = config.stop_loss_pct
+    take_profit_pct = config.take_profit_pct
+    # Signal -> (side, stop loss multiplier, take profit multiplier); HOLD has no entry
+    sides = {
+        "BUY": (OrderSide.BUY, 1.0 - stop_loss_pct, 1.0 + take_profit_pct),
+        "SELL": (OrderSide.SELL, 1.0 + stop_loss_pct, 1.0 - take_profit_pct),
+    }
+    risk_amount = _ACCOUNT_BALANCE * config.max_risk_per_trade
+    analyze = strategy._analyze_technical_signals
+    create_order = strategy._create_order_decision
+    create_no_action = strategy._create_no_action_decision
+    
+    def decide(
+        data: List[OHLCVData],
+        indicators: TechnicalIndicators,
+        signals: Dict[str, str],
+    ) -> TradingDecision:
+        analysis = analyze(indicators, signals, float(data[-1].close))
+        
+        if analysis["signal_strength"] >= min_confidence:
+            side = sides.get(analysis["signal"])
+            if side is not None:
+                action, stop_loss_mul, take_profit_mul = side
+                return create_order(data, action, stop_loss_mul, take_profit_mul, risk_amount, analysis)
+        
+        # No clear signal - hold
+        return create_no_action(data, analysis["reasoning"])
+    
+    return decide
+
 
 class TechnicalStrategy(BaseStrategy):
     """Technical analysis-based trading strategy using traditional indicators."""
     
+    __slots__ = ("_compiled_key", "_decide_fast")
+    
     def __init__(self):
         """Initialize the technical strategy."""
         super().__init__(
             name="Technical Strategy",
             description="Technical analysis-based strategy using RSI, moving averages, and trend analysis"
         )
+        self._compiled_key: Optional[Tuple[float, float, float, float]] = None
+        self._decide_fast: Optional[DecideFn] = None
+    
+    def compile(self, config: StrategyConfig) -> None:
+        """Specialize :meth:`decide` for a strategy configuration.
+        
+        ``decide`` compiles automatically when the config's decision values
+        change, so equal configs built per tick share one specialization.
+        
+        Args:
+            config: Strategy configuration
+        """
+        self._decide_fast = _make_decide(self, config)
+        self._compiled_key = _config_key(config)
     
     def decide(
         self,
@@ -39,21 +165,51 @@ class TechnicalStrategy(BaseStrategy):
         Returns:
             Trading decision
         """
-        current_price = float(data[-1].close)
-        symbol = data[-1].symbol
+        if _config_key(config) != self._compiled_key:
+            self.compile(config)
+        return self._decide_fast(data, indicators, signals)
+    
+    def decide_batch(
+        self,
+        close: np.ndarray,
+        rsi: np.ndarray,
+        sma_20: np.ndarray,
+        ema_20: np.ndarray,
+        trend: np.ndarray,
+        momentum: np.ndarray,
+        volatility: np.ndarray,
+    ) -> np.ndarray:
+        """Score a window of ticks in one vectorized pass.
         
-        # Analyze technical signals
-        analysis = self._analyze_technical_signals(indicators, signals, current_price)
+        Applies the same scoring as :func:`score_signals` to parallel arrays,
+        for backtests and replays that would otherwise call :meth:`decide`
+        once per tick. Missing indicator values are NaN.
         
-        # Make decision based on analysis
-        if analysis["signal_strength"] >= config.min_confidence:
-            if analysis["signal"] == "BUY":
-                return self._create_buy_decision(data, config, analysis)
-            elif analysis["signal"] == "SELL":
-                return self._create_sell_decision(data, config, analysis)
+        Args:
+            close: Close prices
+            rsi: RSI values
+            sma_20: SMA(20) values
+            ema_20: EMA(20) values
+            trend: Trend codes (TREND_*)
+            momentum: Momentum codes (MOMENTUM_*)
+            volatility: Volatility regime codes (VOLATILITY_*)
+            
+        Returns:
+            int8 signals per tick: 1 for BUY, -1 for SELL, 0 for HOLD
+        """
+        # NaN comparisons are False, so missing indicators add nothing
+        score = np.where(rsi < 30, 0.3, np.where(rsi > 70, -0.3, 0.0))
+        score += np.where(
+            (close > sma_20) & (close > ema_20),
+            0.2,
+            np.where((close < sma_20) & (close < ema_20), -0.2, 0.0),
+        )
+        score += np.where(sma_20 > ema_20, 0.1, np.where(sma_20 < ema_20, -0.1, 0.0))
+        score += np.where(trend == TREND_BULLISH, 0.2, np.where(trend == TREND_BEARISH, -0.2, 0.0))
+        score += np.where(momentum == MOMENTUM_STRONG, 0.1, np.where(momentum == MOMENTUM_WEAK, -0.1, 0.0))
+        score *= np.where(volatility == VOLATILITY_HIGH, 0.8, np.where(volatility == VOLATILITY_LOW, 1.1, 1.0))
         
-        # No clear signal - hold
-        return self._create_no_action_decision(data, analysis["reasoning"])
+        return np.select([score > 0.3, score < -0.3], [1, -1], default=0).astype(np.int8)
     
     def _analyze_technical_signals(
         self,
@@ -71,76 +227,45 @@ class TechnicalStrategy(BaseStrategy):
         Returns:
             Analysis results
         """
-        signal_score = 0.0
-        signal_reasons = []
-        
-        # RSI Analysis
-        if indicators.rsi is not None:
-            if indicators.rsi < 30:  # Oversold
-                signal_score += 0.3
-                signal_reasons.append(f"RSI oversold ({indicators.rsi:.1f})")
-            elif indicators.rsi > 70:  # Overbought
-                signal_score -= 0.3
-                signal_reasons.append(f"RSI overbought ({indicators.rsi:.1f})")
-            elif 40 <= indicators.rsi <= 60:  # Neutral
-                signal_reasons.append(f"RSI neutral ({indicators.rsi:.1f})")
-        
-        # Moving Average Analysis
-        if indicators.sma_20 is not None and indicators.ema_20 is not None:
-            if current_price > indicators.sma_20 and current_price > indicators.ema_20:
-                signal_score += 0.2
-                signal_reasons.append("Price above moving averages")
-            elif current_price < indicators.sma_20 and current_price < indicators.ema_20:
-                signal_score -= 0.2
-                signal_reasons.append("Price below moving averages")
-            
-            # MA crossover
-            if indicators.sma_20 > indicators.ema_20:
-                signal_score += 0.1
-                signal_reasons.append("SMA above EMA (bullish)")
-            elif indicators.sma_20 < indicators.ema_20:
-                signal_score -= 0.1
-                signal_reasons.append("SMA below EMA (bearish)")
-        
-        # Trend Analysis
-        trend = signals.get("trend", "sideways")
-        if trend == "bullish":
-            signal_score += 0.2
-            signal_reasons.append("Bullish trend")
-        elif trend == "bearish":
-            signal_score -= 0.2
-            signal_reasons.append("Bearish trend")
-        else:
-            signal_reasons.append("Sideways trend")
+        nan = float("nan")
+        rsi = indicators.rsi
+        trend_code, trend_reason = _TRENDS.get(signals.get("trend", "sideways"), _SIDEWAYS_TREND)
+        momentum_code, momentum_reason = _MOMENTUMS.get(signals.get("momentum", "neutral"), _NO_REASON)
+        volatility_code, volatility_reason = _VOLATILITY_REGIMES.get(
+            signals.get("volatility_regime", "normal"), _NO_REASON
+        )
         
-        # Momentum Analysis
-        momentum = signals.get("momentum", "neutral")
-        if momentum == "strong":
-            signal_score += 0.1
-            signal_reasons.append("Strong momentum")
-        elif momentum == "weak":
-            signal_score -= 0.1
-            signal_reasons.append("Weak momentum")
+        # Numeric scoring runs in the (JIT-compiled) kernel
+        signal_score, signal_code, flags = score_signals(
+            nan if rsi is None else rsi,
+            nan if indicators.sma_20 is None else indicators.sma_20,
+            nan if indicators.ema_20 is None else indicators.ema_20,
+            current_price,
+            trend_code,
+            momentum_code,
+            volatility_code,
+        )
         
-        # Volatility Analysis
-        volatility_regime = signals.get("volatility_regime", "normal")
-        if volatility_regime == "high":
-            signal_score *= 0.8  # Reduce confidence in high volatility
-            signal_reasons.append("High volatility - reduced confidence")
-        elif volatility_regime == "low":
-            signal_score *= 1.1  # Slightly increase confidence in low volatility
-            signal_reasons.append("Low volatility - increased confidence")
+        # Reasons are assembled in Python from the kernel flags
+        signal_reasons = []
+        if flags & RSI_OVERSOLD:
+            signal_reasons.append(f"RSI oversold ({rsi:.1f})")
+        elif flags & RSI_OVERBOUGHT:
+            signal_reasons.append(f"RSI overbought ({rsi:.1f})")
+        elif flags & RSI_NEUTRAL:
+            signal_reasons.append(f"RSI neutral ({rsi:.1f})")
+        for flag, reason in _MA_REASONS:
+            if flags & flag:
+                signal_reasons.append(reason)
+        signal_reasons.append(trend_reason)
+        if momentum_reason:
+            signal_reasons.append(momentum_reason)
+        if volatility_reason:
+            signal_reasons.append(volatility_reason)
         
-        # Determine final signal
-        if signal_score > 0.3:
-            signal = "BUY"
-            confidence = min(signal_score, 1.0)
-        elif signal_score < -0.3:
-            signal = "SELL"
-            confidence = min(abs(signal_score), 1.0)
-        else:
-            signal = "HOLD"
-            confidence = 0.0
+        # Confidence is the score magnitude for BUY/SELL signals
+        signal = _SIGNALS[signal_code]
+        confidence = 0.0 if signal_code == SIGNAL_HOLD else min(abs(signal_score), 1.0)
         
         return {
             "signal": signal,
@@ -149,89 +274,46 @@ class TechnicalStrategy(BaseStrategy):
             "score": signal_score,
         }
     
-    def _create_buy_decision(
+    def _create_order_decision(
         self,
         data: List[OHLCVData],
-        config: StrategyConfig,
+        action: OrderSide,
+        stop_loss_mul: float,
+        take_profit_mul: float,
+        risk_amount: float,
         analysis: Dict,
     ) -> TradingDecision:
-        """Create a buy decision.
+        """Create a buy or sell decision from precomputed config factors.
         
         Args:
             data: Historical OHLCV data
-            config: Strategy configuration
+            action: Order side
+            stop_loss_mul: Stop loss price as a multiple of the entry price
+            take_profit_mul: Take profit price as a multiple of the entry price
+            risk_amount: Account balance at risk per trade
             analysis: Technical analysis results
             
         Returns:
-            Buy trading decision
-        """
-        current_price = float(data[-1].close)
-        symbol = data[-1].symbol
-        
-        # Calculate position size (simplified)
-        account_balance = 10000.0  # Placeholder
-        stop_loss_price = self.calculate_stop_loss(current_price, "BUY", config.stop_loss_pct)
-        take_profit_price = self.calculate_take_profit(current_price, "BUY", config.take_profit_pct)
-        
-        quantity = self.calculate_position_size(
-            account_balance,
-            current_price,
-            stop_loss_price,
-            config.max_risk_per_trade,
-        )
-        
-        return TradingDecision(
-            action=OrderSide.BUY,
-            symbol=symbol,
-            quantity=Decimal(str(quantity)),
-            price=Decimal(str(current_price)),
-            stop_loss=Decimal(str(stop_loss_price)),
-            take_profit=Decimal(str(take_profit_price)),
-            confidence=analysis["signal_strength"],
-            reasoning=f"BUY: {analysis['reasoning']}",
-            risk_score=0.3,  # Moderate risk for technical signals
-        )
-    
-    def _create_sell_decision(
-        self,
-        data: List[OHLCVData],
-        config: StrategyConfig,
-        analysis: Dict,
-    ) -> TradingDecision:
-        """Create a sell decision.
-        
-        Args:
-            data: Historical OHLCV data
-            config: Strategy configuration
-            analysis: Technical analysis results
-            
-        Returns:
-            Sell trading decision
+            Trading decision
         """
-        current_price = float(data[-1].close)
-        symbol = data[-1].symbol
+        last = data[-1]
+        current_price = float(last.close)
+        stop_loss_price = current_price * stop_loss_mul
+        take_profit_price = current_price * take_profit_mul
         
-        # Calculate position size (simplified)
-        account_balance = 10000.0  # Placeholder
-        stop_loss_price = self.calculate_stop_loss(current_price, "SELL", config.stop_loss_pct)
-        take_profit_price = self.calculate_take_profit(current_price, "SELL", config.take_profit_pct)
-        
-        quantity = self.calculate_position_size(
-            account_balance,
-            current_price,
-            stop_loss_price,
-            config.max_risk_per_trade,
-        )
+        # Position size risks risk_amount between entry and stop loss
+        price_difference = abs(current_price - stop_loss_price)
+        quantity = risk_amount / price_difference if price_difference else 0.0
         
         return TradingDecision(
-            action=OrderSide.SELL,
-            symbol=symbol,
+            action=action,
+            symbol=last.symbol,
             quantity=Decimal(str(quantity)),
             price=Decimal(str(current_price)),
             stop_loss=Decimal(str(stop_loss_price)),
             take_profit=Decimal(str(take_profit_price)),
             confidence=analysis["signal_strength"],
-            reasoning=f"SELL: {analysis['reasoning']}",
+            reasoning=f"{action.value}: {analysis['reasoning']}",
             risk_score=0.3,  # Moderate risk for technical signals
         )
     
@@ -245,11 +327,13 @@ class TechnicalStrategy(BaseStrategy):
         Returns:
             No-action trading decision
         """
-        return TradingDecision(
+        # Built without validation: the zero quantity and price that mark a
+        # no-action decision are outside the model's bounds for real orders
+        return TradingDecision.model_construct(
             action=OrderSide.BUY,  # Dummy action
             symbol=data[-1].symbol,
-            quantity=Decimal("0"),
-            price=Decimal("0"),
+            quantity=_ZERO,
+            price=_ZERO,
             stop_loss=None,
             take_profit=None,
             confidence=0.0,
@@ -1,20 +1,75 @@
 """Binance WebSocket client for real-time data streaming."""
 
 import asyncio
-import json
+import logging
+import random
 import time
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Callable, Dict, Optional, Any
+from typing import Callable, Dict, Optional, Any, Union
 import structlog
 import websockets
 from websockets.exceptions import ConnectionClosed, WebSocketException
 
-from ..core.types import OHLCVData
+from ..core.types import FastOHLCV, OHLCVData
 from ..core.settings import get_settings
+from ..core.utils import is_log_enabled, json_loads
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - msgspec is an optional speedup
+    msgspec = None
 
 logger = structlog.get_logger(__name__)
 
+_from_ts = datetime.fromtimestamp
+
+# Kline stream URL for a lowercase symbol and a timeframe
+_WS_URL_TMPL = "wss://stream.binance.com:9443/ws/{}@kline_{}"
+
+
+def _noop(*args: Any) -> None:
+    """Callback used when none is set."""
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """Convert a kline price or volume field to Decimal.
+    
+    Binance sends these fields as decimal strings, which Decimal parses
+    directly; numbers are formatted first so floats keep their short repr.
+    
+    Args:
+        value: Field value from the kline payload
+        
+    Returns:
+        Decimal value
+    """
+    if value.__class__ is str:
+        return Decimal(value)
+    return Decimal(str(value))
+
+
+if msgspec is not None:
+    class _Kline(msgspec.Struct):
+        """Kline fields used from a Binance kline frame."""
+        t: int
+        o: str
+        h: str
+        l: str
+        c: str
+        v: str
+        x: bool
+    
+    class _Frame(msgspec.Struct):
+        """Binance stream frame; ``k`` is only present on kline events."""
+        k: Optional[_Kline] = None
+    
+    _frame_decoder = msgspec.json.Decoder(_Frame)
+    _DecodeError = msgspec.DecodeError
+else:
+    _frame_decoder = None
+    _DecodeError = ValueError
+
 
 class BinanceWebSocketError(Exception):
     """Exception raised during WebSocket operations."""
@@ -24,12 +79,39 @@ class BinanceWebSocketError(Exception):
 class BinanceWebSocket:
     """Binance WebSocket client for streaming real-time market data."""
     
+    __slots__ = (
+        "symbol",
+        "timeframe",
+        "_on_new_candle",
+        "_emit",
+        "_on_error",
+        "_report_error",
+        "float_candles",
+        "message_queue",
+        "settings",
+        "websocket",
+        "running",
+        "retry_count",
+        "max_retries",
+        "retry_delay",
+        "ws_url",
+        "last_heartbeat",
+        "heartbeat_interval",
+        "_is_open",
+        "_debug_enabled",
+    )
+    
+    # Upper bound on a reconnect delay, in seconds
+    MAX_BACKOFF = 300.0
+    
     def __init__(
         self,
         symbol: str,
         timeframe: str = "1m",
-        on_new_candle: Optional[Callable[[OHLCVData], None]] = None,
+        on_new_candle: Optional[Callable[[Union[OHLCVData, FastOHLCV]], None]] = None,
         on_error: Optional[Callable[[Exception], None]] = None,
+        float_candles: bool = False,
+        message_queue: Optional[asyncio.Queue] = None,
     ):
         """Initialize the Binance WebSocket client.
         
@@ -38,26 +120,37 @@ class BinanceWebSocket:
             timeframe: Timeframe for kline data (e.g., '1m', '5m', '1h')
             on_new_candle: Callback function for new candle data
             on_error: Callback function for error handling
+            float_candles: Pass FastOHLCV candles with float fields to
+                on_new_candle instead of Decimal-based OHLCVData
+            message_queue: Queue to put ``(client, message)`` frames on for a
+                shared consumer, instead of handling them in this client's task
         """
         self.symbol = symbol.upper()
         self.timeframe = timeframe
         self.on_new_candle = on_new_candle
         self.on_error = on_error
+        self.float_candles = float_candles
+        self.message_queue = message_queue
         
         self.settings = get_settings()
         self.websocket: Optional[websockets.WebSocketServerProtocol] = None
         self.running = False
         self.retry_count = 0
-        self.max_retries = self.settings.websocket_retry_attempts
-        self.retry_delay = self.settings.websocket_retry_delay
+        self.max_retries = self.settings.streaming.websocket_retry_attempts
+        self.retry_delay = self.settings.streaming.websocket_retry_delay
         
         # WebSocket URL for Binance
-        self.ws_url = f"wss://stream.binance.com:9443/ws/{self.symbol.lower()}@kline_{self.timeframe}"
+        self.ws_url = _WS_URL_TMPL.format(self.symbol.lower(), self.timeframe)
         
-        # Connection state
-        self.last_heartbeat = time.time()
+        # Connection state (heartbeat on the monotonic clock); _is_open is
+        # set on connect and cleared when the receive loop ends or on disconnect
+        self._is_open = False
+        self.last_heartbeat = time.monotonic()
         self.heartbeat_interval = 30  # seconds
         
+        # Per-candle DEBUG logs are skipped entirely when DEBUG is filtered out
+        self._debug_enabled = is_log_enabled(logger, logging.DEBUG)
+        
         logger.info(
             "Initialized Binance WebSocket",
             symbol=self.symbol,
@@ -65,6 +158,27 @@ class BinanceWebSocket:
             ws_url=self.ws_url,
         )
     
+    @property
+    def on_new_candle(self) -> Optional[Callable[[Union[OHLCVData, FastOHLCV]], None]]:
+        """Callback for new candle data."""
+        return self._on_new_candle
+    
+    @on_new_candle.setter
+    def on_new_candle(self, callback: Optional[Callable[[Union[OHLCVData, FastOHLCV]], None]]) -> None:
+        # Bind the dispatch target once so frames call it without a check
+        self._on_new_candle = callback
+        self._emit = callback if callback is not None else _noop
+    
+    @property
+    def on_error(self) -> Optional[Callable[[Exception], None]]:
+        """Callback for error handling."""
+        return self._on_error
+    
+    @on_error.setter
+    def on_error(self, callback: Optional[Callable[[Exception], None]]) -> None:
+        self._on_error = callback
+        self._report_error = callback if callback is not None else _noop
+    
     async def connect(self) -> None:
         """Connect to Binance WebSocket."""
         try:
@@ -77,9 +191,10 @@ class BinanceWebSocket:
                 close_timeout=10,
             )
             
+            self._is_open = True
             self.running = True
             self.retry_count = 0
-            self.last_heartbeat = time.time()
+            self.last_heartbeat = time.monotonic()
             
             logger.info("Successfully connected to Binance WebSocket")
             
@@ -90,6 +205,7 @@ class BinanceWebSocket:
     async def disconnect(self) -> None:
         """Disconnect from Binance WebSocket."""
         self.running = False
+        self._is_open = False
         
         if self.websocket:
             try:
@@ -104,21 +220,27 @@ class BinanceWebSocket:
         """Start streaming data from Binance WebSocket."""
         while self.running:
             try:
-                if not self.websocket or self.websocket.closed:
+                if not self._is_open:
                     await self.connect()
                 
-                # Listen for messages
-                async for message in self.websocket:
-                    if not self.running:
-                        break
-                    
-                    try:
-                        await self._handle_message(message)
-                        self.last_heartbeat = time.time()
-                    except Exception as e:
-                        logger.error("Error handling WebSocket message", error=str(e))
-                        if self.on_error:
-                            self.on_error(e)
+                # Listen for messages; iteration ends or raises once the connection closes
+                try:
+                    async for message in self.websocket:
+                        if not self.running:
+                            break
+                        
+                        try:
+                            if self.message_queue is not None:
+                                # Blocks while the shared consumer is behind
+                                await self.message_queue.put((self, message))
+                            else:
+                                await self._handle_message(message)
+                            self.last_heartbeat = time.monotonic()
+                        except Exception as e:
+                            logger.error("Error handling WebSocket message", error=str(e))
+                            self._report_error(e)
+                finally:
+                    self._is_open = False
                 
             except (ConnectionClosed, WebSocketException) as e:
                 logger.warning("WebSocket connection lost", error=str(e))
@@ -128,39 +250,46 @@ class BinanceWebSocket:
                 logger.error("Unexpected WebSocket error", error=str(e))
                 await self._handle_connection_error(e)
     
-    async def _handle_message(self, message: str) -> None:
+    async def _handle_message(self, message: Union[str, bytes]) -> None:
         """Handle incoming WebSocket message.
         
         Args:
-            message: Raw WebSocket message
+            message: Raw WebSocket message (text or binary frame)
         """
         try:
-            data = json.loads(message)
-            
-            # Check if it's kline data
-            if "k" in data:
-                kline_data = data["k"]
+            if _frame_decoder is not None:
+                # Decode straight into the typed frame, without an intermediate dict
+                kline = _frame_decoder.decode(message).k
+                
+                # Only process closed candles (x indicates if kline is closed)
+                if kline is None or not kline.x:
+                    return
+                ohlcv = self._make_candle(kline.t, kline.o, kline.h, kline.l, kline.c, kline.v)
+            else:
+                data = json_loads(message)
                 
-                # Only process closed candles
-                if kline_data["x"]:  # x indicates if kline is closed
-                    ohlcv = self._parse_kline_data(kline_data)
-                    
-                    if self.on_new_candle:
-                        self.on_new_candle(ohlcv)
-                    
-                    logger.debug(
-                        "Received new candle",
-                        symbol=ohlcv.symbol,
-                        timestamp=ohlcv.timestamp,
-                        close=ohlcv.close,
-                    )
+                # Check if it's a closed kline
+                kline_data = data.get("k")
+                if kline_data is None or not kline_data["x"]:
+                    return
+                ohlcv = self._parse_kline_data(kline_data)
             
-        except json.JSONDecodeError as e:
+            self._emit(ohlcv)
+            
+            if self._debug_enabled:
+                logger.debug(
+                    "Received new candle",
+                    symbol=ohlcv.symbol,
+                    timestamp=ohlcv.timestamp,
+                    close=ohlcv.close,
+                )
+        
+        except (ValueError, _DecodeError) as e:
             logger.error("Failed to parse WebSocket message", error=str(e))
         except Exception as e:
             logger.error("Error processing WebSocket message", error=str(e))
     
-    def _parse_kline_data(self, kline_data: Dict[str, Any]) -> OHLCVData:
+    def _parse_kline_data(self, kline_data: Dict[str, Any]) -> Union[OHLCVData, FastOHLCV]:
         """Parse Binance kline data to OHLCVData.
         
         Args:
@@ -169,15 +298,40 @@ class BinanceWebSocket:
         Returns:
             Parsed OHLCV data
         """
-        return OHLCVData(
-            timestamp=datetime.fromtimestamp(
-                kline_data["t"] / 1000, tz=timezone.utc
-            ),
-            open=Decimal(str(kline_data["o"])),
-            high=Decimal(str(kline_data["h"])),
-            low=Decimal(str(kline_data["l"])),
-            close=Decimal(str(kline_data["c"])),
-            volume=Decimal(str(kline_data["v"])),
+        return self._make_candle(
+            kline_data["t"], kline_data["o"], kline_data["h"], kline_data["l"], kline_data["c"], kline_data["v"]
+        )
+    
+    def _make_candle(
+        self, open_time: int, open_: Any, high: Any, low: Any, close: Any, volume: Any
+    ) -> Union[OHLCVData, FastOHLCV]:
+        """Build a candle from kline fields.
+        
+        Args:
+            open_time: Kline open time in milliseconds
+            open_: Open price
+            high: High price
+            low: Low price
+            close: Close price
+            volume: Base asset volume
+            
+        Returns:
+            OHLCV data for this stream's symbol
+        """
+        timestamp = _from_ts(open_time / 1000, tz=timezone.utc)
+        if self.float_candles:
+            return FastOHLCV(
+                timestamp, float(open_), float(high), float(low), float(close), float(volume), self.symbol
+            )
+        
+        # Skip model validation: the data buffer validates every candle it accepts
+        return OHLCVData.model_construct(
+            timestamp=timestamp,
+            open=_to_decimal(open_),
+            high=_to_decimal(high),
+            low=_to_decimal(low),
+            close=_to_decimal(close),
+            volume=_to_decimal(volume),
             symbol=self.symbol,
         )
     
@@ -195,16 +349,18 @@ class BinanceWebSocket:
             )
             self.running = False
             
-            if self.on_error:
-                self.on_error(
-                    BinanceWebSocketError(
-                        f"Max retry attempts reached: {self.max_retries}"
-                    )
+            self._report_error(
+                BinanceWebSocketError(
+                    f"Max retry attempts reached: {self.max_retries}"
                 )
+            )
             return
         
         self.retry_count += 1
-        retry_delay = self.retry_delay * (2 ** (self.retry_count - 1))  # Exponential backoff
+        # Capped exponential backoff with jitter, so sockets that dropped
+        # together do not all reconnect at the same moment
+        retry_delay = min(self.MAX_BACKOFF, self.retry_delay * (1 << (self.retry_count - 1)))
+        retry_delay = random.uniform(retry_delay * 0.5, retry_delay)
         
         logger.warning(
             "WebSocket connection error, retrying",
@@ -214,18 +370,17 @@ class BinanceWebSocket:
         )
         
         # Notify error callback
-        if self.on_error:
-            self.on_error(error)
+        self._report_error(error)
         
         # Wait before retry
         await asyncio.sleep(retry_delay)
     
     async def send_ping(self) -> None:
         """Send ping to keep connection alive."""
-        if self.websocket and not self.websocket.closed:
+        if self._is_open:
             try:
                 await self.websocket.ping()
-                self.last_heartbeat = time.time()
+                self.last_heartbeat = time.monotonic()
             except Exception as e:
                 logger.warning("Failed to send ping", error=str(e))
     
@@ -235,11 +390,7 @@ class BinanceWebSocket:
         Returns:
             True if connected and running
         """
-        return (
-            self.running and
-            self.websocket is not None and
-            not self.websocket.closed
-        )
+        return self.running and self._is_open
     
     def get_connection_info(self) -> Dict[str, Any]:
         """Get connection information.
@@ -253,18 +404,28 @@ class BinanceWebSocket:
             "connected": self.is_connected(),
             "retry_count": self.retry_count,
             "max_retries": self.max_retries,
-            "last_heartbeat": self.last_heartbeat,
+            "last_heartbeat": time.time() - (time.monotonic() - self.last_heartbeat),
             "ws_url": self.ws_url,
         }
 
 
 class WebSocketManager:
-    """Manager for multiple WebSocket connections."""
+    """Manager for multiple WebSocket connections.
+    
+    Connections only receive frames and put them on one bounded queue; a
+    single consumer task decodes and dispatches frames from every socket.
+    """
+    
+    # Frames buffered before receiving sockets wait for the consumer
+    QUEUE_SIZE = 10_000
     
     def __init__(self):
         """Initialize the WebSocket manager."""
         self.connections: Dict[str, BinanceWebSocket] = {}
         self.running = False
+        # Created on first use so it belongs to the running event loop
+        self.messages: Optional[asyncio.Queue] = None
+        self._consumer_task: Optional[asyncio.Task] = None
     
     async def add_connection(
         self,
@@ -295,6 +456,7 @@ class WebSocketManager:
             timeframe=timeframe,
             on_new_candle=on_new_candle,
             on_error=on_error,
+            message_queue=self._message_queue(),
         )
         
         self.connections[connection_id] = ws
@@ -325,6 +487,9 @@ class WebSocketManager:
         """Start all WebSocket connections."""
         self.running = True
         
+        if self._consumer_task is None:
+            self._consumer_task = asyncio.create_task(self._consume())
+        
         for ws in self.connections.values():
             await ws.connect()
             asyncio.create_task(ws.start_streaming())
@@ -338,8 +503,31 @@ class WebSocketManager:
         for ws in self.connections.values():
             await ws.disconnect()
         
+        if self._consumer_task is not None:
+            self._consumer_task.cancel()
+            self._consumer_task = None
+        
         logger.info("Stopped all WebSocket connections")
     
+    def _message_queue(self) -> asyncio.Queue:
+        """Get the shared frame queue, creating it if needed."""
+        if self.messages is None:
+            self.messages = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        return self.messages
+    
+    async def _consume(self) -> None:
+        """Handle frames from all connections in arrival order."""
+        messages = self._message_queue()
+        while True:
+            ws, message = await messages.get()
+            try:
+                await ws._handle_message(message)
+            except Exception as e:
+                logger.error("Error handling WebSocket message", error=str(e))
+                ws._report_error(e)
+            finally:
+                messages.task_done()
+    
     def get_connection_status(self) -> Dict[str, Dict[str, Any]]:
         """Get status of all connections.
         
@@ -1,50 +1,119 @@
 """Data buffer for managing real-time market data with circular buffer."""
 
 import threading
-from collections import deque
+from collections.abc import Sequence
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Callable, Dict, Any
+from decimal import Decimal
+from typing import List, Optional, Callable, Dict, Any, Tuple, Union
+
+import numpy as np
 import structlog
 
 from ..core.types import OHLCVData
-from ..core.utils import parse_timestamp
+from ..core.utils import epoch_ns, parse_timestamp
 
 logger = structlog.get_logger(__name__)
 
+# Columns of the float OHLCV ring array, in order
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
 
 class DataBufferError(Exception):
     """Exception raised during data buffer operations."""
     pass
 
 
+class BufferView(Sequence):
+    """Read-only view of a data buffer's candles in chronological order.
+    
+    Reads go to the live buffer under its lock, so the view never copies the
+    history up front and always reflects the latest candles.
+    """
+    
+    __slots__ = ("_owner",)
+    
+    def __init__(self, owner: "DataBuffer"):
+        """Initialize the view.
+        
+        Args:
+            owner: Buffer to read from
+        """
+        self._owner = owner
+    
+    def __len__(self) -> int:
+        return self._owner._count
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[OHLCVData, List[OHLCVData]]:
+        owner = self._owner
+        with owner.lock:
+            count = owner._count
+            if isinstance(index, slice):
+                start, stop, step = index.indices(count)
+                if step == 1:
+                    return owner._ordered(start, max(start, stop))
+                return owner._ordered(0, count)[index]
+            if index < 0:
+                index += count
+            if not 0 <= index < count:
+                raise IndexError("buffer index out of range")
+            return owner._candles[(owner._head + index) % owner.max_size]
+    
+    def __iter__(self):
+        # Iterate a snapshot: the buffer may be appended to while callers iterate
+        with self._owner.lock:
+            return iter(self._owner._ordered(0, self._owner._count))
+
+
+BufferUpdatedCallback = Callable[[OHLCVData, Optional[OHLCVData], BufferView], None]
+
+
 class DataBuffer:
-    """Circular buffer for managing real-time market data."""
+    """Circular buffer for managing real-time market data.
+    
+    Candles are kept in a fixed-size ring alongside structure-of-arrays
+    columns: epoch-nanosecond timestamps and float OHLCV values. Adding a
+    candle writes one slot and advances the ring, without allocating.
+    """
     
     def __init__(
         self,
         initial_data: Optional[List[OHLCVData]] = None,
         max_size: int = 480,  # 8 hours of 1-minute data
-        on_buffer_updated: Optional[Callable[[List[OHLCVData]], None]] = None,
+        on_buffer_updated: Optional[BufferUpdatedCallback] = None,
+        pool_size: int = 0,
     ):
         """Initialize the data buffer.
         
         Args:
             initial_data: Initial historical data to populate buffer
             max_size: Maximum number of data points to keep
-            on_buffer_updated: Callback function when buffer is updated
+            on_buffer_updated: Callback invoked with the new candle, the candle
+                it evicted (or None) and a view of the buffer after each add
+            pool_size: Number of evicted candles kept for reuse by
+                :meth:`acquire_slot` (0 disables pooling)
         """
         self.max_size = max_size
         self.on_buffer_updated = on_buffer_updated
         
-        # Thread-safe circular buffer
-        self.buffer = deque(maxlen=max_size)
-        self.lock = threading.RLock()
+        # Free list of evicted candles, recycled by acquire_slot
+        self.pool_size = pool_size
+        self._pool: List[OHLCVData] = []
+        
+        # Thread-safe ring: slot _head holds the oldest of _count candles
+        self._allocate(max_size)
+        self.lock = threading.Lock()
+        self.view = BufferView(self)
         
         # Statistics
         self.total_received = 0
         self.total_dropped = 0
         self.last_update = None
         
+        # Buffer info is rebuilt lazily once per write; writers bump _version
+        # after their changes are complete
+        self._version = 0
+        self._info_cache = (-1, {})
+        
         # Initialize with historical data if provided
         if initial_data:
             self._initialize_with_historical_data(initial_data)
@@ -52,31 +121,150 @@ class DataBuffer:
         logger.info(
             "Initialized data buffer",
             max_size=max_size,
-            initial_count=len(self.buffer),
+            initial_count=self._count,
         )
     
-    def _initialize_with_historical_data(self, data: List[OHLCVData]) -> None:
-        """Initialize buffer with historical data.
+    def _allocate(self, size: int) -> None:
+        """Allocate empty ring storage.
         
         Args:
-            data: Historical OHLCV data
+            size: Number of slots
         """
-        with self.lock:
-            # Sort data by timestamp to ensure chronological order
-            sorted_data = sorted(data, key=lambda x: x.timestamp)
+        self._candles: List[Optional[OHLCVData]] = [None] * size
+        self._ts = np.zeros(size, dtype=np.int64)
+        self._ohlcv = np.zeros((size, len(OHLCV_COLUMNS)), dtype=np.float64)
+        self._head = 0
+        self._count = 0
+        
+        # Candles are appended in time order except for late ones (up to a
+        # minute old); binary search is valid while none of those is buffered
+        self._appended = 0
+        self._last_late = 0
+    
+    def _append(self, candle: OHLCVData, timestamp_ns: int) -> Optional[OHLCVData]:
+        """Write a candle into the next ring slot.
+        
+        Args:
+            candle: OHLCV data point
+            timestamp_ns: Candle timestamp in epoch nanoseconds
             
-            # Add data to buffer
-            for item in sorted_data:
-                self.buffer.append(item)
+        Returns:
+            Candle evicted to make room, or None
+        """
+        size = self.max_size
+        self._appended += 1
+        if self._count and timestamp_ns < self._ts[(self._head + self._count - 1) % size]:
+            self._last_late = self._appended
+        
+        if self._count == size:
+            # Full: overwrite the oldest slot and advance the head
+            i = self._head
+            evicted = self._candles[i]
+            self._head = (i + 1) % size
+        else:
+            i = (self._head + self._count) % size
+            evicted = None
+            self._count += 1
+        
+        self._candles[i] = candle
+        self._ts[i] = timestamp_ns
+        self._ohlcv[i] = (
+            float(candle.open),
+            float(candle.high),
+            float(candle.low),
+            float(candle.close),
+            float(candle.volume),
+        )
+        return evicted
+    
+    def _segments(self, start: int, stop: int) -> Tuple[slice, slice]:
+        """Map logical positions [start, stop) to at most two slot ranges.
+        
+        Args:
+            start: First position (0 is the oldest candle)
+            stop: Position after the last one
             
-            self.last_update = sorted_data[-1].timestamp if sorted_data else None
+        Returns:
+            Older and newer slot slices, each in time order
+        """
+        size = self.max_size
+        lo = self._head + start
+        hi = self._head + stop
+        if hi <= size:
+            return slice(lo, hi), slice(0, 0)
+        if lo >= size:
+            return slice(lo - size, hi - size), slice(0, 0)
+        return slice(lo, size), slice(0, hi - size)
+    
+    def _ordered(self, start: int, stop: int) -> List[OHLCVData]:
+        """Get the candles at logical positions [start, stop), oldest first.
+        
+        Args:
+            start: First position (0 is the oldest candle)
+            stop: Position after the last one
             
-            logger.info(
-                "Initialized buffer with historical data",
-                data_points=len(sorted_data),
-                start_time=sorted_data[0].timestamp if sorted_data else None,
-                end_time=self.last_update,
-            )
+        Returns:
+            New list of candles
+        """
+        older, newer = self._segments(start, stop)
+        return self._candles[older] + self._candles[newer]
+    
+    def _column(self, array: np.ndarray, start: int, stop: int) -> np.ndarray:
+        """Copy logical positions [start, stop) of a ring column, oldest first.
+        
+        Args:
+            array: Ring column
+            start: First position (0 is the oldest candle)
+            stop: Position after the last one
+            
+        Returns:
+            New array of the values in time order
+        """
+        older, newer = self._segments(start, stop)
+        return np.concatenate((array[older], array[newer]))
+    
+    def _initialize_with_historical_data(self, data: List[OHLCVData]) -> None:
+        """Initialize the empty buffer with historical data.
+        
+        The data is ordered with an argsort of its timestamps and written into
+        the ring as whole columns rather than appended one candle at a time.
+        
+        Args:
+            data: Historical OHLCV data, in any order
+        """
+        count = len(data)
+        timestamps = np.fromiter((epoch_ns(item.timestamp) for item in data), dtype=np.int64, count=count)
+        
+        # Stable sort keeps equal timestamps in input order; only the newest max_size fit
+        order = np.argsort(timestamps, kind="stable")
+        keep = order[-self.max_size:]
+        size = len(keep)
+        
+        kept = [data[i] for i in keep]
+        ohlcv = np.array(
+            [(float(c.open), float(c.high), float(c.low), float(c.close), float(c.volume)) for c in kept],
+            dtype=np.float64,
+        ).reshape(size, 5)
+        
+        with self.lock:
+            # Fill the empty ring in one shot, oldest first from slot 0
+            self._candles[:size] = kept
+            self._ts[:size] = timestamps[keep]
+            self._ohlcv[:size] = ohlcv
+            self._head = 0
+            self._count = size
+            self._appended = size
+            self._last_late = 0
+            
+            self.last_update = data[order[-1]].timestamp if count else None
+            self._version += 1
+        
+        logger.info(
+            "Initialized buffer with historical data",
+            data_points=count,
+            start_time=data[order[0]].timestamp if count else None,
+            end_time=self.last_update,
+        )
     
     def add_new_candle(self, candle: OHLCVData) -> None:
         """Add a new candle to the buffer.
@@ -84,41 +272,101 @@ class DataBuffer:
         Args:
             candle: New OHLCV data point
         """
+        # Validate candle data (no shared state, so outside the lock)
+        self._validate_candle(candle)
+        timestamp_ns = epoch_ns(candle.timestamp)
+        
         with self.lock:
-            # Validate candle data
-            self._validate_candle(candle)
-            
             # Check if this is a duplicate or out-of-order candle
-            if self._should_skip_candle(candle):
-                logger.debug("Skipping duplicate or out-of-order candle", timestamp=candle.timestamp)
-                return
-            
-            # Add to buffer (automatically removes oldest if at max capacity)
-            old_size = len(self.buffer)
-            self.buffer.append(candle)
-            self.total_received += 1
-            
-            # Update statistics
-            self.last_update = candle.timestamp
-            
-            # Log if we dropped data
-            if old_size == self.max_size:
-                self.total_dropped += 1
-                logger.debug("Buffer at capacity, dropped oldest data point")
-            
-            # Notify callback
-            if self.on_buffer_updated:
-                try:
-                    self.on_buffer_updated(self.get_full_history())
-                except Exception as e:
-                    logger.error("Error in buffer update callback", error=str(e))
+            skip = self._should_skip_candle(candle, timestamp_ns)
+            if not skip:
+                # Add to buffer (overwrites the oldest if at max capacity)
+                evicted = self._append(candle, timestamp_ns)
+                self.total_received += 1
+                
+                # Update statistics
+                self.last_update = candle.timestamp
+                if evicted is not None:
+                    self.total_dropped += 1
+                buffer_size = self._count
+                self._version += 1
+        
+        if skip:
+            logger.debug("Skipping duplicate or out-of-order candle", timestamp=candle.timestamp)
+            return
+        
+        # Log if we dropped data
+        if evicted is not None:
+            logger.debug("Buffer at capacity, dropped oldest data point")
+        
+        # Notify callback with the change; history is read through the view
+        if self.on_buffer_updated:
+            try:
+                self.on_buffer_updated(candle, evicted, self.view)
+            except Exception as e:
+                logger.error("Error in buffer update callback", error=str(e))
+        
+        # Recycle the evicted candle once the callback has seen it
+        if self.pool_size and evicted.__class__ is OHLCVData:
+            with self.lock:
+                if len(self._pool) < self.pool_size:
+                    self._pool.append(evicted)
+        
+        logger.debug(
+            "Added new candle to buffer",
+            timestamp=candle.timestamp,
+            close=candle.close,
+            buffer_size=buffer_size,
+        )
+    
+    def acquire_slot(
+        self,
+        timestamp: datetime,
+        open: Decimal,
+        high: Decimal,
+        low: Decimal,
+        close: Decimal,
+        volume: Decimal,
+        symbol: str,
+    ) -> OHLCVData:
+        """Get a candle with the given fields, reusing an evicted one if pooled.
+        
+        Candles are built without model validation; :meth:`add_new_candle`
+        validates them. With pooling enabled, a candle is overwritten once it
+        has been evicted and reacquired, so consumers must not keep candles
+        (including ``get_full_history`` snapshots) longer than ``max_size``
+        further candles.
+        
+        Args:
+            timestamp: Candle open time
+            open: Opening price
+            high: Highest price
+            low: Lowest price
+            close: Closing price
+            volume: Trading volume
+            symbol: Trading symbol
             
-            logger.debug(
-                "Added new candle to buffer",
-                timestamp=candle.timestamp,
-                close=candle.close,
-                buffer_size=len(self.buffer),
+        Returns:
+            OHLCV data point
+        """
+        with self.lock:
+            candle = self._pool.pop() if self._pool else None
+        
+        if candle is None:
+            return OHLCVData.model_construct(
+                timestamp=timestamp, open=open, high=high, low=low, close=close, volume=volume, symbol=symbol
             )
+        
+        # Overwrite the recycled instance's field storage in place
+        fields = candle.__dict__
+        fields["timestamp"] = timestamp
+        fields["open"] = open
+        fields["high"] = high
+        fields["low"] = low
+        fields["close"] = close
+        fields["volume"] = volume
+        fields["symbol"] = symbol
+        return candle
     
     def _validate_candle(self, candle: OHLCVData) -> None:
         """Validate candle data before adding to buffer.
@@ -147,30 +395,32 @@ class DataBuffer:
         if candle.low > candle.open or candle.low > candle.close:
             raise DataBufferError("Low price must be <= open and close prices")
     
-    def _should_skip_candle(self, candle: OHLCVData) -> bool:
+    def _should_skip_candle(self, candle: OHLCVData, timestamp_ns: int) -> bool:
         """Check if candle should be skipped (duplicate or out-of-order).
         
         Args:
             candle: OHLCV data to check
+            timestamp_ns: Candle timestamp in epoch nanoseconds
             
         Returns:
             True if candle should be skipped
         """
-        if not self.buffer:
+        if not self._count:
             return False
         
         # Check for duplicate timestamp
-        last_candle = self.buffer[-1]
-        if candle.timestamp == last_candle.timestamp:
+        last = (self._head + self._count - 1) % self.max_size
+        last_ns = int(self._ts[last])
+        if timestamp_ns == last_ns:
             return True
         
         # Check for out-of-order data (allow small tolerance for network delays)
-        time_diff = (candle.timestamp - last_candle.timestamp).total_seconds()
+        time_diff = (timestamp_ns - last_ns) / 1e9
         if time_diff < -60:  # More than 1 minute in the past
             logger.warning(
                 "Received out-of-order candle data",
                 candle_time=candle.timestamp,
-                last_time=last_candle.timestamp,
+                last_time=self._candles[last].timestamp,
                 time_diff=time_diff,
             )
             return True
@@ -184,7 +434,23 @@ class DataBuffer:
             List of all OHLCV data points in chronological order
         """
         with self.lock:
-            return list(self.buffer)
+            return self._ordered(0, self._count)
+    
+    def get_ohlcv_arrays(self) -> Dict[str, np.ndarray]:
+        """Get the buffered history as columns.
+        
+        Returns:
+            Dictionary with ``timestamp`` (int64 epoch nanoseconds) and float64
+            ``open``, ``high``, ``low``, ``close`` and ``volume`` arrays,
+            oldest first
+        """
+        with self.lock:
+            count = self._count
+            ohlcv = self._column(self._ohlcv, 0, count)
+            arrays = {"timestamp": self._column(self._ts, 0, count)}
+        for i, name in enumerate(OHLCV_COLUMNS):
+            arrays[name] = ohlcv[:, i]
+        return arrays
     
     def get_recent_data(self, count: int) -> List[OHLCVData]:
         """Get recent data points from buffer.
@@ -196,10 +462,8 @@ class DataBuffer:
             List of recent OHLCV data points
         """
         with self.lock:
-            if count >= len(self.buffer):
-                return list(self.buffer)
-            
-            return list(self.buffer)[-count:]
+            size = self._count
+            return self._ordered(size - count if 0 < count < size else 0, size)
     
     def get_data_in_range(
         self,
@@ -215,12 +479,39 @@ class DataBuffer:
         Returns:
             List of OHLCV data points within the time range
         """
+        start_ns = epoch_ns(start_time)
+        end_ns = epoch_ns(end_time)
+        
         with self.lock:
-            result = []
-            for candle in self.buffer:
-                if start_time <= candle.timestamp <= end_time:
-                    result.append(candle)
-            return result
+            if self._appended - self._last_late < self._count:
+                # A late candle is still buffered, so timestamps may be unsorted
+                timestamps = self._column(self._ts, 0, self._count)
+                return [
+                    candle
+                    for candle, timestamp_ns in zip(self._ordered(0, self._count), timestamps)
+                    if start_ns <= timestamp_ns <= end_ns
+                ]
+            
+            start = self._search(start_ns, "left")
+            stop = self._search(end_ns, "right")
+            return self._ordered(start, stop) if start < stop else []
+    
+    def _search(self, timestamp_ns: int, side: str) -> int:
+        """Binary-search the sorted ring timestamps; the caller holds the lock.
+        
+        Args:
+            timestamp_ns: Timestamp in epoch nanoseconds
+            side: ``"left"`` or ``"right"``, as for ``np.searchsorted``
+            
+        Returns:
+            Logical insertion position (0 is the oldest candle)
+        """
+        older, newer = self._segments(0, self._count)
+        run = self._ts[older]
+        position = int(np.searchsorted(run, timestamp_ns, side))
+        if position < run.size:
+            return position
+        return run.size + int(np.searchsorted(self._ts[newer], timestamp_ns, side))
     
     def get_latest_candle(self) -> Optional[OHLCVData]:
         """Get the most recent candle.
@@ -229,34 +520,53 @@ class DataBuffer:
             Latest OHLCV data point or None if buffer is empty
         """
         with self.lock:
-            return self.buffer[-1] if self.buffer else None
+            return self._latest()
+    
+    def _latest(self) -> Optional[OHLCVData]:
+        """Get the most recent candle; the caller holds the lock."""
+        if not self._count:
+            return None
+        return self._candles[(self._head + self._count - 1) % self.max_size]
     
     def get_buffer_info(self) -> Dict[str, Any]:
         """Get buffer information and statistics.
         
+        Reads without taking the lock: statistics may lag a concurrent write
+        by one candle. The ISO timestamps are formatted at most once per write.
+        
         Returns:
             Dictionary with buffer statistics
         """
-        with self.lock:
-            return {
-                "current_size": len(self.buffer),
+        version = self._version
+        cached_version, info = self._info_cache
+        if cached_version != version:
+            count = self._count
+            first = self._candles[self._head] if count else None
+            last = self._latest()
+            last_update = self.last_update
+            info = {
+                "current_size": count,
                 "max_size": self.max_size,
                 "total_received": self.total_received,
                 "total_dropped": self.total_dropped,
-                "last_update": self.last_update.isoformat() if self.last_update else None,
-                "start_time": self.buffer[0].timestamp.isoformat() if self.buffer else None,
-                "end_time": self.buffer[-1].timestamp.isoformat() if self.buffer else None,
-                "is_full": len(self.buffer) == self.max_size,
-                "utilization": len(self.buffer) / self.max_size,
+                "last_update": last_update.isoformat() if last_update else None,
+                "start_time": first.timestamp.isoformat() if first else None,
+                "end_time": last.timestamp.isoformat() if last else None,
+                "is_full": count == self.max_size,
+                "utilization": count / self.max_size,
             }
+            self._info_cache = (version, info)
+        return dict(info)
     
     def clear(self) -> None:
         """Clear all data from buffer."""
         with self.lock:
-            self.buffer.clear()
+            self._allocate(self.max_size)
+            self._pool.clear()
             self.total_received = 0
             self.total_dropped = 0
             self.last_update = None
+            self._version += 1
             logger.info("Cleared data buffer")
     
     def resize(self, new_size: int) -> None:
@@ -270,22 +580,40 @@ class DataBuffer:
         
         with self.lock:
             old_size = self.max_size
-            self.max_size = new_size
             
-            # Create new deque with new size
-            new_buffer = deque(self.buffer, maxlen=new_size)
-            self.buffer = new_buffer
+            # Keep the newest candles that fit, copied into new storage
+            keep = min(self._count, new_size)
+            start = self._count - keep
+            candles = self._ordered(start, self._count)
+            timestamps = self._column(self._ts, start, self._count)
+            ohlcv = self._column(self._ohlcv, start, self._count)
+            
+            self.max_size = new_size
+            self._allocate(new_size)
+            self._candles[:keep] = candles
+            self._ts[:keep] = timestamps
+            self._ohlcv[:keep] = ohlcv
+            self._count = keep
+            self._appended = keep
+            if keep > 1 and (np.diff(timestamps) < 0).any():
+                # Treat the kept candles as late until they have all been evicted
+                self._last_late = keep
+            self._version += 1
             
             logger.info(
                 "Resized data buffer",
                 old_size=old_size,
                 new_size=new_size,
-                current_count=len(self.buffer),
+                current_count=self._count,
             )
 
 
 class MultiSymbolDataBuffer:
-    """Data buffer manager for multiple trading symbols."""
+    """Data buffer manager for multiple trading symbols.
+    
+    ``buffers`` is copy-on-write: adding or removing a symbol publishes a new
+    dictionary under the lock, so per-candle lookups read it without locking.
+    """
     
     def __init__(self, max_size: int = 480):
         """Initialize multi-symbol data buffer.
@@ -295,20 +623,21 @@ class MultiSymbolDataBuffer:
         """
         self.max_size = max_size
         self.buffers: Dict[str, DataBuffer] = {}
-        self.lock = threading.RLock()
+        self.lock = threading.Lock()  # Serializes writers only
     
     def add_symbol(
         self,
         symbol: str,
         initial_data: Optional[List[OHLCVData]] = None,
-        on_buffer_updated: Optional[Callable[[str, List[OHLCVData]], None]] = None,
+        on_buffer_updated: Optional[Callable[[str, OHLCVData, Optional[OHLCVData], BufferView], None]] = None,
     ) -> DataBuffer:
         """Add a new symbol to the buffer manager.
         
         Args:
             symbol: Trading symbol
             initial_data: Initial historical data
-            on_buffer_updated: Callback for buffer updates
+            on_buffer_updated: Callback for buffer updates, called with the
+                symbol followed by the DataBuffer callback arguments
             
         Returns:
             DataBuffer instance for the symbol
@@ -319,9 +648,10 @@ class MultiSymbolDataBuffer:
                 return self.buffers[symbol]
             
             # Create callback wrapper
-            def wrapped_callback(data):
-                if on_buffer_updated:
-                    on_buffer_updated(symbol, data)
+            wrapped_callback = None
+            if on_buffer_updated:
+                def wrapped_callback(candle, evicted, view):
+                    on_buffer_updated(symbol, candle, evicted, view)
             
             buffer = DataBuffer(
                 initial_data=initial_data,
@@ -329,7 +659,9 @@ class MultiSymbolDataBuffer:
                 on_buffer_updated=wrapped_callback,
             )
             
-            self.buffers[symbol] = buffer
+            buffers = dict(self.buffers)
+            buffers[symbol] = buffer
+            self.buffers = buffers
             logger.info("Added symbol to buffer manager", symbol=symbol)
             
             return buffer
@@ -342,7 +674,9 @@ class MultiSymbolDataBuffer:
         """
         with self.lock:
             if symbol in self.buffers:
-                del self.buffers[symbol]
+                buffers = dict(self.buffers)
+                del buffers[symbol]
+                self.buffers = buffers
                 logger.info("Removed symbol from buffer manager", symbol=symbol)
     
     def add_candle(self, symbol: str, candle: OHLCVData) -> None:
@@ -352,11 +686,10 @@ class MultiSymbolDataBuffer:
             symbol: Trading symbol
             candle: OHLCV data point
         """
-        with self.lock:
-            if symbol not in self.buffers:
-                raise DataBufferError(f"Symbol {symbol} not found in buffer manager")
-            
-            self.buffers[symbol].add_new_candle(candle)
+        buffer = self.buffers.get(symbol)
+        if buffer is None:
+            raise DataBufferError(f"Symbol {symbol} not found in buffer manager")
+        buffer.add_new_candle(candle)
     
     def get_symbol_data(self, symbol: str) -> Optional[List[OHLCVData]]:
         """Get data for a specific symbol.
@@ -367,11 +700,8 @@ class MultiSymbolDataBuffer:
         Returns:
             List of OHLCV data points or None if symbol not found
         """
-        with self.lock:
-            if symbol not in self.buffers:
-                return None
-            
-            return self.buffers[symbol].get_full_history()
+        buffer = self.buffers.get(symbol)
+        return buffer.get_full_history() if buffer is not None else None
     
     def get_all_symbols(self) -> List[str]:
         """Get list of all symbols in the buffer manager.
@@ -379,8 +709,7 @@ class MultiSymbolDataBuffer:
         Returns:
             List of trading symbols
         """
-        with self.lock:
-            return list(self.buffers.keys())
+        return list(self.buffers)
     
     def get_manager_info(self) -> Dict[str, Any]:
         """Get information about all buffers.
@@ -388,8 +717,4 @@ class MultiSymbolDataBuffer:
         Returns:
             Dictionary with information about all symbol buffers
         """
-        with self.lock:
-            return {
-                symbol: buffer.get_buffer_info()
-                for symbol, buffer in self.buffers.items()
-            }
+        return {symbol: buffer.get_buffer_info() for symbol, buffer in self.buffers.items()}
@@ -40,6 +40,9 @@ class AnalysisScheduler:
         self.running = False
         self.task: Optional[asyncio.Task] = None
         
+        # Set to wake the scheduler loop when the next analysis time changes
+        self._reschedule: Optional[asyncio.Event] = None
+        
         # Statistics
         self.analysis_count = 0
         self.last_analysis_time = None
@@ -69,6 +72,7 @@ class AnalysisScheduler:
         self._calculate_next_analysis_time()
         
         # Start the scheduler task
+        self._reschedule = asyncio.Event()
         self.task = asyncio.create_task(self._scheduler_loop())
         
         logger.info(
@@ -98,15 +102,22 @@ class AnalysisScheduler:
         """Main scheduler loop."""
         try:
             while self.running:
+                self._reschedule.clear()
                 current_time = datetime.now(timezone.utc)
+                delay = (self.next_analysis_time - current_time).total_seconds()
                 
                 # Check if it's time for analysis
-                if self.next_analysis_time and current_time >= self.next_analysis_time:
+                if delay <= 0:
                     await self._trigger_analysis(current_time)
                     self._calculate_next_analysis_time()
+                    continue
                 
-                # Sleep for a short interval to avoid busy waiting
-                await asyncio.sleep(1)
+                # Sleep until the next analysis time, or until it is changed;
+                # the time is re-checked on waking in case the clock moved
+                try:
+                    await asyncio.wait_for(self._reschedule.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
         
         except asyncio.CancelledError:
             logger.info("Scheduler loop cancelled")
@@ -199,6 +210,8 @@ class AnalysisScheduler:
         # Recalculate next analysis time if scheduler is running
         if self.running:
             self._calculate_next_analysis_time()
+            if self._reschedule is not None:
+                self._reschedule.set()
         
         logger.info(
             "Updated analysis interval",
@@ -103,6 +103,8 @@ class OrderManager:
                 pass
             self.order_check_task = None
         
+        await self.binance_client.close()
+        
         logger.info("Stopped order manager")
     
     async def _order_check_loop(self) -> None:
@@ -205,7 +207,7 @@ class OrderManager:
         """
         try:
             # Place order
-            order_response = self.binance_client.place_order(order_request)
+            order_response = await self.binance_client.place_order_async(order_request)
             
             # Notify callback
             if self.on_order_update:
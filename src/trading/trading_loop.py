@@ -11,7 +11,7 @@ from ..core.types import OHLCVData, TradingDecision, TradingMode
 from ..data.features import TechnicalIndicatorCalculator, MarketSignalGenerator
 from ..llm.factory import get_llm_client
 from ..strategy.registry import get_strategy
-from ..streaming.data_buffer import DataBuffer
+from ..streaming.data_buffer import BufferView, DataBuffer
 from ..streaming.scheduler import AnalysisScheduler
 from .order_manager import OrderManager
 from .state_manager import StateManager
@@ -197,18 +197,25 @@ class AutonomousTradingLoop:
             if self.on_error:
                 self.on_error(e)
     
-    async def _on_buffer_updated(self, data: List[OHLCVData]) -> None:
+    def _on_buffer_updated(
+        self,
+        candle: OHLCVData,
+        evicted: Optional[OHLCVData],
+        history: BufferView,
+    ) -> None:
         """Handle buffer update events.
         
         Args:
-            data: Updated data buffer
+            candle: Candle added to the buffer
+            evicted: Candle dropped to make room, if any
+            history: View of the updated data buffer
         """
         try:
             logger.debug(
                 "Buffer updated",
                 symbol=self.symbol,
-                data_points=len(data),
-                latest_time=data[-1].timestamp if data else None,
+                data_points=len(history),
+                latest_time=candle.timestamp,
             )
         
         except Exception as e:
@@ -0,0 +1,183 @@
+"""Tests for alert rule evaluation."""
+
+import asyncio
+import json
+from collections import deque
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from src.monitoring.alerts import Alert, AlertLevel, AlertManager, AlertRule, AlertType, compile_condition
+
+
+def make_rule(name: str, calls: list, watched_keys=None, cooldown_seconds: int = 300) -> AlertRule:
+    """Create a rule that records its evaluations and always triggers."""
+    return AlertRule(
+        name=name,
+        alert_type=AlertType.PERFORMANCE_DEGRADED,
+        level=AlertLevel.WARNING,
+        condition=lambda data: calls.append(name) or True,
+        message_template=name,
+        cooldown_seconds=cooldown_seconds,
+        watched_keys=watched_keys,
+    )
+
+
+class TestAlertManager:
+    """Test rule dispatch and cooldowns."""
+    
+    @pytest.fixture
+    def manager(self):
+        """Create an alert manager without the default rules."""
+        manager = AlertManager()
+        for rule in list(manager.rules):
+            manager.remove_rule(rule.name)
+        return manager
+    
+    @pytest.mark.asyncio
+    async def test_only_rules_watching_payload_keys_are_evaluated(self, manager):
+        """Test that keyed rules are skipped for payloads without their keys."""
+        calls = []
+        manager.add_rule(make_rule("latency", calls, watched_keys={"latency_ms"}))
+        manager.add_rule(make_rule("errors", calls, watched_keys={"error_rate"}))
+        manager.add_rule(make_rule("any", calls))
+        
+        alerts = await manager.evaluate_alerts({"error_rate": 0.9})
+        
+        assert calls == ["errors", "any"]
+        assert [alert.message for alert in alerts] == ["errors", "any"]
+    
+    @pytest.mark.asyncio
+    async def test_cooldown_skips_condition(self, manager):
+        """Test that a rule in cooldown does not re-run its condition."""
+        calls = []
+        manager.add_rule(make_rule("errors", calls, watched_keys={"error_rate"}))
+        
+        first = await manager.evaluate_alerts({"error_rate": 0.9})
+        second = await manager.evaluate_alerts({"error_rate": 0.9})
+        
+        assert len(first) == 1
+        assert second == []
+        assert calls == ["errors"]
+        assert manager.get_rules_status()[0]["last_triggered"] is not None
+    
+    @pytest.mark.asyncio
+    async def test_removed_rule_is_not_evaluated(self, manager):
+        """Test that removing a rule drops it from the key index."""
+        calls = []
+        manager.add_rule(make_rule("errors", calls, watched_keys={"error_rate"}))
+        manager.remove_rule("errors")
+        
+        assert await manager.evaluate_alerts({"error_rate": 0.9}) == []
+        assert calls == []
+    
+    @pytest.mark.asyncio
+    async def test_history_is_bounded_and_filterable(self, manager):
+        """Test that history evicts old alerts and filters by level."""
+        manager.alert_history = deque(maxlen=3)
+        for i in range(5):
+            manager.add_rule(make_rule(f"rule{i}", [], watched_keys={f"key{i}"}))
+            await manager.evaluate_alerts({f"key{i}": True})
+        
+        assert [alert.message for alert in manager.get_alert_history()] == ["rule2", "rule3", "rule4"]
+        assert [alert.message for alert in manager.get_alerts_by_level(AlertLevel.WARNING, limit=2)] == ["rule3", "rule4"]
+        assert manager.get_alerts_by_level(AlertLevel.ERROR) == []
+    
+    @pytest.mark.asyncio
+    async def test_alert_summary_counts(self, manager):
+        """Test summary counts by level and type."""
+        manager.add_rule(make_rule("errors", [], watched_keys={"error_rate"}))
+        manager.add_rule(make_rule("latency", [], watched_keys={"latency_ms"}))
+        await manager.evaluate_alerts({"error_rate": 0.9, "latency_ms": 900})
+        
+        summary = manager.get_alert_summary(hours=1)
+        
+        assert summary["total_alerts"] == 2
+        assert summary["level_counts"]["warning"] == 2
+        assert summary["type_counts"][AlertType.PERFORMANCE_DEGRADED.value] == 2
+        assert summary["most_common_level"] == "warning"
+        
+        manager.clear_history()
+        assert manager.get_alert_summary()["total_alerts"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_alerts_in_one_tick_share_timestamp(self, manager):
+        """Test that alerts triggered by one payload share its timestamp."""
+        manager.add_rule(make_rule("errors", [], watched_keys={"error_rate"}))
+        manager.add_rule(make_rule("latency", [], watched_keys={"latency_ms"}))
+        
+        first, second = await manager.evaluate_alerts({"error_rate": 0.9, "latency_ms": 900})
+        
+        assert first.timestamp is second.timestamp
+        assert first.id != second.id
+        assert manager.rules[0].last_triggered == first.timestamp
+    
+    @pytest.mark.asyncio
+    async def test_notifications_run_concurrently(self, manager):
+        """Test that a slow or failing callback does not hold up the others."""
+        received = []
+        
+        async def slow(alert):
+            await asyncio.sleep(0.05)
+            received.append(("slow", alert.message))
+        
+        def failing(alert):
+            raise RuntimeError("webhook down")
+        
+        manager.add_notification_callback(slow)
+        manager.add_notification_callback(failing)
+        manager.add_notification_callback(lambda alert: received.append(("sync", alert.message)))
+        manager.add_rule(make_rule("errors", [], watched_keys={"error_rate"}))
+        
+        await manager.evaluate_alerts({"error_rate": 0.9})
+        
+        assert received == [("sync", "errors"), ("slow", "errors")]
+    
+    def test_compile_condition(self):
+        """Test that expression conditions compile into functions without builtins."""
+        condition = compile_condition("data.get('data_age_hours', 0) > 1")
+        
+        assert condition({"data_age_hours": 2}) is True
+        assert condition({}) is False
+        with pytest.raises(NameError):
+            compile_condition("len(data) > 0")({})
+    
+    @pytest.mark.asyncio
+    async def test_default_expression_rules_trigger(self):
+        """Test that the default expression rules fire on their keys."""
+        manager = AlertManager()
+        
+        alerts = await manager.evaluate_alerts({"data_age_hours": 2.5, "running": True})
+        
+        assert [alert.message for alert in alerts] == ["Data is stale: 2.5 hours old"]
+    
+    @pytest.mark.asyncio
+    async def test_rule_becomes_eligible_after_cooldown(self, manager):
+        """Test that a cooling rule returns once its cooldown expires."""
+        calls = []
+        manager.add_rule(make_rule("errors", calls, watched_keys={"error_rate"}, cooldown_seconds=0))
+        manager.add_rule(make_rule("latency", calls, watched_keys={"latency_ms"}))
+        data = {"error_rate": 0.9, "latency_ms": 900}
+        
+        await manager.evaluate_alerts(data)
+        alerts = await manager.evaluate_alerts(data)
+        
+        assert [alert.message for alert in alerts] == ["errors"]
+        assert calls == ["errors", "latency", "errors"]
+    
+    def test_alert_to_json(self):
+        """Test alert serialization with datetimes and decimals."""
+        alert = Alert(
+            AlertType.ORDER_FAILED,
+            AlertLevel.ERROR,
+            "Order execution failed",
+            details={"price": Decimal("50000.5")},
+            timestamp=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        )
+        
+        payload = json.loads(alert.to_json())
+        
+        assert payload["timestamp"] == "2024-01-02T03:04:05Z"
+        assert payload["type"] == "order_failed"
+        assert payload["details"] == {"price": "50000.5"}
@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 
 from src.core.types import OHLCVData, TradingMode, OrderSide, OrderType
 from src.core.settings import get_settings
+from src.core.utils import generate_client_order_id
 from src.data.ingestion import DataIngestionService
 from src.data.features import TechnicalIndicatorCalculator, MarketSignalGenerator
 from src.strategy.technical_strategy import TechnicalStrategy
@@ -172,6 +173,14 @@ class TestBasicFunctionality:
         assert quality_metrics["total_points"] == 1
         assert quality_metrics["symbol"] == "BTCUSDT"
 
+    def test_client_order_id_generation(self):
+        """Test client order IDs are unique and within Binance limits."""
+        order_ids = {generate_client_order_id("BTCUSDT", "BUY") for _ in range(2000)}
+        
+        assert len(order_ids) == 2000
+        assert all(order_id.startswith("BTCUSDT_BUY_") for order_id in order_ids)
+        assert all(len(order_id) <= 36 for order_id in order_ids)
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,101 @@
+"""Tests for Binance client rate-limit handling."""
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.types import OrderRequest, OrderSide, OrderType, TradingMode
+from src.execution.binance_client import MAX_RETRY_WAIT, BinanceClient, BinanceRateLimitError, _rate_limit_wait
+from src.execution.binance_rest import BinanceRESTError
+
+
+class FakeRESTClient:
+    """REST client stub that fails a configurable number of times."""
+    
+    def __init__(self, failures: int, status_code: int, retry_after: float = 0.0):
+        self.failures = failures
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.calls = 0
+    
+    async def create_order(self, params):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise BinanceRESTError("throttled", status_code=self.status_code, retry_after=self.retry_after)
+        return {
+            "orderId": 1,
+            "clientOrderId": params["newClientOrderId"],
+            "symbol": params["symbol"],
+            "status": "FILLED",
+            "side": params["side"],
+            "origQty": params["quantity"],
+            "price": "0.00000000",
+            "executedQty": params["quantity"],
+            "cummulativeQuoteQty": "50000",
+            "transactTime": 1700000000000,
+        }
+
+
+class TestBinanceRateLimiting:
+    """Test backoff and circuit breaking around order placement."""
+    
+    @pytest.fixture
+    def order_request(self):
+        """Create a market order request."""
+        return OrderRequest(
+            symbol="BTCUSDT",
+            side=OrderSide.BUY,
+            order_type=OrderType.MARKET,
+            quantity=Decimal("1"),
+        )
+    
+    @pytest.fixture
+    def client(self):
+        """Create a client that talks to a stubbed REST API."""
+        client = BinanceClient(TradingMode.PAPER)
+        client.mode = TradingMode.LIVE
+        return client
+    
+    def test_retries_throttled_orders(self, client, order_request):
+        """Test that HTTP 429 responses are retried until the order goes through."""
+        client.rest_client = FakeRESTClient(failures=2, status_code=429)
+        
+        response = asyncio.run(client.place_order_async(order_request))
+        
+        assert response.executed_price == Decimal("50000")
+        assert client.rest_client.calls == 3
+        assert not client.circuit_breaker.is_open
+    
+    def test_ip_ban_opens_circuit(self, client, order_request):
+        """Test that an HTTP 418 ban is not retried and makes later orders fail fast."""
+        client.rest_client = FakeRESTClient(failures=10, status_code=418, retry_after=120)
+        
+        with pytest.raises(BinanceRateLimitError):
+            asyncio.run(client.place_order_async(order_request))
+        
+        assert client.rest_client.calls == 1
+        assert client.circuit_breaker.is_open
+        
+        with pytest.raises(BinanceRateLimitError):
+            asyncio.run(client.place_order_async(order_request))
+        
+        assert client.rest_client.calls == 1
+    
+    def test_long_retry_after_opens_circuit_instead_of_sleeping(self, client, order_request):
+        """Test that a 429 asking for more than the retry cap fails fast."""
+        client.rest_client = FakeRESTClient(failures=10, status_code=429, retry_after=MAX_RETRY_WAIT + 90)
+        
+        with pytest.raises(BinanceRateLimitError):
+            asyncio.run(client.place_order_async(order_request))
+        
+        assert client.rest_client.calls == 1
+        assert client.circuit_breaker.remaining_open_time > MAX_RETRY_WAIT
+    
+    def test_retry_wait_is_capped(self):
+        """Test that the Retry-After wait never exceeds the cap."""
+        error = BinanceRateLimitError("throttled", status_code=429, retry_after=MAX_RETRY_WAIT * 10)
+        retry_state = SimpleNamespace(outcome=SimpleNamespace(exception=lambda: error))
+        
+        assert _rate_limit_wait(retry_state) == MAX_RETRY_WAIT
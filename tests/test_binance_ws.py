@@ -0,0 +1,166 @@
+"""Tests for Binance WebSocket message handling."""
+
+import asyncio
+import time
+from decimal import Decimal
+
+import pytest
+
+from src.streaming.binance_ws import BinanceWebSocket, WebSocketManager
+
+KLINE_MESSAGE = (
+    '{"e":"kline","E":1700000060000,"s":"BTCUSDT","k":{"t":1700000000000,"T":1700000059999,'
+    '"s":"BTCUSDT","i":"1m","o":"37000.10","c":"37010.50","h":"37020.00","l":"36990.00",'
+    '"v":"12.345","x":true}}'
+)
+
+
+class TestBinanceWebSocket:
+    """Test kline parsing and dispatch."""
+    
+    @pytest.fixture
+    def candles(self):
+        """Collect candles passed to the callback."""
+        return []
+    
+    @pytest.fixture
+    def ws(self, candles):
+        """Create a WebSocket client without connecting."""
+        return BinanceWebSocket("btcusdt", on_new_candle=candles.append)
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("message", [KLINE_MESSAGE, KLINE_MESSAGE.encode()])
+    async def test_closed_kline_is_dispatched(self, ws, candles, message):
+        """Test that text and binary kline frames produce a candle."""
+        await ws._handle_message(message)
+        
+        assert len(candles) == 1
+        assert candles[0].close == Decimal("37010.50")
+        assert candles[0].volume == Decimal("12.345")
+        assert candles[0].symbol == "BTCUSDT"
+    
+    @pytest.mark.asyncio
+    async def test_callback_can_be_replaced_or_unset(self, ws, candles):
+        """Test that reassigning on_new_candle rebinds candle dispatch."""
+        ws.on_new_candle = None
+        await ws._handle_message(KLINE_MESSAGE)
+        
+        ws.on_new_candle = candles.append
+        await ws._handle_message(KLINE_MESSAGE)
+        
+        assert len(candles) == 1
+        assert ws.on_new_candle == candles.append
+    
+    @pytest.mark.asyncio
+    async def test_open_kline_and_bad_json_are_ignored(self, ws, candles):
+        """Test that unfinished candles and malformed frames are skipped."""
+        await ws._handle_message(KLINE_MESSAGE.replace('"x":true', '"x":false'))
+        await ws._handle_message("{not json")
+        await ws._handle_message('{"result":null,"id":1}')
+        
+        assert candles == []
+    
+    def test_parse_kline_accepts_numeric_fields(self, ws):
+        """Test that numeric fields convert like their decimal strings."""
+        kline = {"t": 1700000000000, "o": 37000.1, "h": "37020.00", "l": 36990, "c": "37010.50", "v": 0.1}
+        
+        candle = ws._parse_kline_data(kline)
+        
+        assert candle.open == Decimal("37000.1")
+        assert candle.low == Decimal("36990")
+        assert str(candle.volume) == "0.1"
+        assert candle.timestamp.timestamp() == 1700000000
+    
+    @pytest.mark.asyncio
+    async def test_reconnect_backoff_is_capped_and_jittered(self, ws, monkeypatch):
+        """Test that retry delays stay within the jittered, capped range."""
+        delays = []
+        
+        async def fake_sleep(delay):
+            delays.append(delay)
+        
+        monkeypatch.setattr("src.streaming.binance_ws.asyncio.sleep", fake_sleep)
+        ws.retry_delay = 100
+        ws.max_retries = 3
+        
+        for _ in range(3):
+            await ws._handle_connection_error(ConnectionError("dropped"))
+        
+        assert 50 <= delays[0] <= 100
+        assert 100 <= delays[1] <= 200
+        assert ws.MAX_BACKOFF / 2 <= delays[2] <= ws.MAX_BACKOFF
+    
+    def test_connection_info_reports_wall_clock_heartbeat(self, ws):
+        """Test that the monotonic heartbeat is reported as wall-clock time."""
+        assert abs(ws.get_connection_info()["last_heartbeat"] - time.time()) < 5
+    
+    @pytest.mark.asyncio
+    async def test_connection_state_follows_receive_loop(self, ws, candles, monkeypatch):
+        """Test that the client reports disconnected once the stream ends."""
+        class FakeSocket:
+            async def __aiter__(self):
+                assert ws.is_connected()
+                yield KLINE_MESSAGE
+                ws.running = False
+        
+        async def fake_connect(url, **kwargs):
+            return FakeSocket()
+        
+        monkeypatch.setattr("src.streaming.binance_ws.websockets.connect", fake_connect)
+        assert not ws.is_connected()
+        
+        await ws.connect()
+        await ws.start_streaming()
+        
+        assert len(candles) == 1
+        assert not ws._is_open
+        assert not ws.is_connected()
+    
+    def test_client_has_no_instance_dict(self, ws):
+        """Test that client state lives in slots."""
+        assert not hasattr(ws, "__dict__")
+    
+    def test_ws_url_for_symbol_and_timeframe(self):
+        """Test that the stream URL uses the lowercase symbol and timeframe."""
+        ws = BinanceWebSocket("ETHUSDT", timeframe="5m")
+        
+        assert ws.ws_url == "wss://stream.binance.com:9443/ws/ethusdt@kline_5m"
+    
+    @pytest.mark.asyncio
+    async def test_float_candles(self, candles):
+        """Test that float candles carry floats and convert back to Decimals."""
+        ws = BinanceWebSocket("btcusdt", on_new_candle=candles.append, float_candles=True)
+        
+        await ws._handle_message(KLINE_MESSAGE)
+        
+        candle = candles[0]
+        assert candle.close == 37010.5
+        assert candle.volume == 12.345
+        
+        ohlcv = candle.to_ohlcv()
+        assert ohlcv.close == Decimal("37010.5")
+        assert ohlcv.volume == Decimal("12.345")
+        assert ohlcv.timestamp == candle.timestamp
+
+
+class TestWebSocketManager:
+    """Test the shared frame consumer."""
+    
+    @pytest.mark.asyncio
+    async def test_consumer_dispatches_frames_to_their_connection(self):
+        """Test that queued frames reach the callback of the socket they came from."""
+        manager = WebSocketManager()
+        btc, eth = [], []
+        btc_ws = await manager.add_connection("BTCUSDT", on_new_candle=btc.append)
+        eth_ws = await manager.add_connection("ETHUSDT", on_new_candle=eth.append)
+        
+        assert btc_ws.message_queue is manager.messages
+        
+        await manager.messages.put((btc_ws, KLINE_MESSAGE))
+        await manager.messages.put((eth_ws, KLINE_MESSAGE))
+        consumer = asyncio.create_task(manager._consume())
+        await manager.messages.join()
+        consumer.cancel()
+        
+        assert [candle.symbol for candle in btc] == ["BTCUSDT"]
+        assert [candle.symbol for candle in eth] == ["ETHUSDT"]
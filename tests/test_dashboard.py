@@ -0,0 +1,215 @@
+"""Tests for dashboard metrics aggregation."""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.monitoring.dashboard import DashboardManager, DashboardMetrics
+
+
+def make_metrics(minutes_ago: float, analysis_count: int) -> DashboardMetrics:
+    """Create a metrics snapshot taken some minutes ago."""
+    metrics = DashboardMetrics()
+    metrics.timestamp = datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)
+    metrics.performance_metrics = {"analysis_count": analysis_count}
+    return metrics
+
+
+class FakeTradingLoop:
+    """Trading loop stand-in returning a scripted status."""
+    
+    def __init__(self):
+        self.analysis_count = 0
+        risk_manager = SimpleNamespace(get_risk_status=lambda: {"daily_trades": 1})
+        self.order_manager = SimpleNamespace(risk_manager=risk_manager)
+    
+    def get_status(self):
+        self.analysis_count += 1
+        return {"running": True, "symbol": "BTCUSDT", "analysis_count": self.analysis_count}
+
+
+class TestDashboardManager:
+    """Test metrics history and summaries."""
+    
+    def test_metrics_history_is_bounded(self):
+        """Test that history keeps only the newest snapshots."""
+        manager = DashboardManager()
+        for i in range(manager.max_history_size + 5):
+            manager._append_history(make_metrics(0, i))
+        
+        history = manager.get_metrics_history(limit=2)
+        
+        assert len(manager.metrics_history) == manager.max_history_size
+        assert [m.performance_metrics["analysis_count"] for m in history] == [1003, 1004]
+        assert manager.get_metrics_series()["analysis_count"][-2:].tolist() == [1003, 1004]
+    
+    def test_performance_summary_uses_window(self):
+        """Test that the summary only covers snapshots inside the window."""
+        manager = DashboardManager()
+        for minutes_ago, count in [(180, 1), (90, 2), (30, 3)]:
+            manager._append_history(make_metrics(minutes_ago, count))
+        
+        summary = manager.get_performance_summary(hours=2)
+        
+        assert summary["metrics_count"] == 2
+        assert summary["total_analyses"] == 3
+    
+    def test_performance_summary_window_spans_ring_wrap(self):
+        """Test the window lookup once the history ring has wrapped."""
+        manager = DashboardManager()
+        size = manager.max_history_size
+        for i in range(size + 10):
+            manager._append_history(make_metrics(size + 10 - i, i))
+        
+        summary = manager.get_performance_summary(hours=1)
+        
+        assert summary["metrics_count"] == 59
+        assert summary["total_analyses"] == size + 9
+    
+    @pytest.mark.asyncio
+    async def test_update_metrics_records_distinct_snapshots(self):
+        """Test that each tick adds its own snapshot to history."""
+        manager = DashboardManager(FakeTradingLoop())
+        
+        await manager._update_metrics()
+        await manager._update_metrics()
+        
+        first, second = manager.get_metrics_history()
+        assert first is not second
+        assert first.performance_metrics["analysis_count"] == 1
+        assert second.performance_metrics["analysis_count"] == 2
+        assert manager.get_current_metrics() is second
+    
+    @pytest.mark.asyncio
+    async def test_tick_shares_one_clock_reading(self):
+        """Test that a tick's timestamp is reused by the health check."""
+        manager = DashboardManager(FakeTradingLoop())
+        
+        await manager._update_metrics()
+        
+        metrics = manager.get_current_metrics()
+        assert manager.get_health_status()["last_check"] == metrics.timestamp.isoformat()
+        recorded = manager.get_metrics_series()["timestamp"][-1]
+        assert abs(recorded - np.datetime64(metrics.timestamp.replace(tzinfo=None), "ns")) <= np.timedelta64(1, "us")
+    
+    @pytest.mark.asyncio
+    async def test_unchanged_status_reuses_previous_sections(self):
+        """Test that an idle tick copies the last snapshot instead of rebuilding."""
+        trading_loop = FakeTradingLoop()
+        trading_loop.get_status = lambda: {"running": True, "analysis_count": 7}
+        manager = DashboardManager(trading_loop)
+        fills = []
+        fill_metrics = manager._fill_metrics
+        manager._fill_metrics = lambda *args: fills.append(1) or fill_metrics(*args)
+        
+        await manager._update_metrics()
+        await manager._update_metrics()
+        
+        first, second = manager.get_metrics_history()
+        assert len(fills) == 1
+        assert second.performance_metrics == first.performance_metrics
+        assert second.performance_metrics is not first.performance_metrics
+        assert second.timestamp >= first.timestamp
+    
+    @pytest.mark.asyncio
+    async def test_risk_change_alone_rebuilds_sections(self):
+        """Test that a new risk status is not served from the previous snapshot."""
+        trading_loop = FakeTradingLoop()
+        trading_loop.get_status = lambda: {"running": True, "analysis_count": 7}
+        risk_status = {"daily_trades": 1}
+        trading_loop.order_manager.risk_manager.get_risk_status = lambda: risk_status
+        manager = DashboardManager(trading_loop)
+        
+        await manager._update_metrics()
+        risk_status = {"daily_trades": 2}
+        await manager._update_metrics()
+        
+        first, second = manager.get_metrics_history()
+        assert first.risk_metrics["current_risk"]["daily_trades"] == 1
+        assert second.risk_metrics["current_risk"]["daily_trades"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_update_loop_keeps_cadence(self):
+        """Test that slow updates do not delay the following ticks."""
+        manager = DashboardManager(FakeTradingLoop())
+        manager.update_interval = 0.05
+        loop = asyncio.get_running_loop()
+        tick_times = []
+        
+        async def slow_update():
+            tick_times.append(loop.time())
+            await asyncio.sleep(0.03)
+        
+        manager._update_metrics = slow_update
+        await manager.start()
+        await asyncio.sleep(0.22)
+        await manager.stop()
+        
+        intervals = [b - a for a, b in zip(tick_times, tick_times[1:])]
+        assert len(tick_times) >= 4
+        assert max(intervals) < 0.07
+    
+    @pytest.mark.asyncio
+    async def test_status_calls_run_off_the_event_loop(self):
+        """Test that trading loop status is read in a worker thread and cached risk status directly."""
+        trading_loop = FakeTradingLoop()
+        threads = []
+        get_status = trading_loop.get_status
+        trading_loop.get_status = lambda: threads.append(threading.get_ident()) or get_status()
+        trading_loop.order_manager.risk_manager.get_risk_status = lambda: threads.append(threading.get_ident()) or {}
+        manager = DashboardManager(trading_loop)
+        
+        await manager._update_metrics()
+        
+        assert len(threads) == 2
+        assert threads[0] != threading.get_ident()
+        assert threads[1] == threading.get_ident()
+    
+    def test_uptime_reuses_parsed_start_time(self):
+        """Test that uptime is computed from a cached parse of the start time."""
+        manager = DashboardManager()
+        now = datetime(2024, 1, 2, 3, 0, tzinfo=timezone.utc)
+        
+        assert manager._calculate_uptime("2024-01-01T00:00:00Z", now) == "1d 3h 0m"
+        parsed = manager._parsed_start
+        assert manager._calculate_uptime("2024-01-01T00:00:00Z", now + timedelta(seconds=5)) == "1d 3h 0m"
+        assert manager._parsed_start is parsed
+        assert manager._calculate_uptime("2024-01-02T02:58:30+00:00", now) == "1m 30s"
+    
+    def test_metrics_history_arrow(self):
+        """Test the Arrow export of the numeric history."""
+        pa = pytest.importorskip("pyarrow")
+        manager = DashboardManager()
+        for minutes_ago, count in [(10, 1), (5, 2)]:
+            manager._append_history(make_metrics(minutes_ago, count))
+        
+        table = manager.get_metrics_history_arrow()
+        
+        assert table.num_rows == 2
+        assert table.column("analysis_count").to_pylist() == [1, 2]
+        assert table.schema.field("timestamp").type == pa.timestamp("ns", tz="UTC")
+    
+    def test_health_status_reuses_messages_while_checks_hold(self):
+        """Test that health messages are rebuilt only when a check flips."""
+        manager = DashboardManager(FakeTradingLoop())
+        manager.current_metrics.bot_status = {"running": True}
+        manager.current_metrics.buffer_metrics = {"utilization": 0.9, "total_dropped": 0}
+        manager.current_metrics.performance_metrics = {"success_rate": 0.2}
+        
+        first = manager.get_health_status()
+        second = manager.get_health_status()
+        
+        assert first["overall"] == "healthy"
+        assert first["warnings"] == ["Low success rate"]
+        assert second["warnings"] is first["warnings"]
+        
+        manager.current_metrics.bot_status = {"running": False}
+        third = manager.get_health_status()
+        
+        assert third["overall"] == "error"
+        assert third["issues"] == ["Bot is not running"]
+        assert third["warnings"] == ["Low success rate"]
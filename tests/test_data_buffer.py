@@ -0,0 +1,237 @@
+"""Tests for the streaming data buffer."""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from src.core.types import OHLCVData
+from src.streaming.data_buffer import BufferView, DataBuffer, MultiSymbolDataBuffer
+
+
+def make_candle(minute: int, close: str = "100", symbol: str = "BTCUSDT") -> OHLCVData:
+    """Create a one-minute candle starting ``minute`` minutes after midnight."""
+    price = Decimal(close)
+    return OHLCVData(
+        timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=minute),
+        open=price,
+        high=price + 1,
+        low=price - 1,
+        close=price,
+        volume=Decimal("1"),
+        symbol=symbol,
+    )
+
+
+class TestDataBuffer:
+    """Test buffer updates and queries."""
+    
+    def test_callback_receives_delta_and_live_view(self):
+        """Test that updates pass the new and evicted candles with a view."""
+        updates = []
+        buffer = DataBuffer(max_size=2, on_buffer_updated=lambda *args: updates.append(args))
+        candles = [make_candle(i) for i in range(3)]
+        
+        for candle in candles:
+            buffer.add_new_candle(candle)
+        
+        assert [(new, evicted) for new, evicted, _ in updates] == [
+            (candles[0], None),
+            (candles[1], None),
+            (candles[2], candles[0]),
+        ]
+        view = updates[-1][2]
+        assert isinstance(view, BufferView)
+        assert view is buffer.view
+        assert len(view) == 2
+        assert view[-1] is candles[2]
+        assert view[:1] == [candles[1]]
+        assert list(view) == buffer.get_full_history() == candles[1:]
+        assert buffer.total_dropped == 1
+    
+    def test_ring_keeps_newest_candles_in_order(self):
+        """Test that the ring wraps and queries stay chronological."""
+        buffer = DataBuffer(max_size=3)
+        candles = [make_candle(i, close=str(100 + i)) for i in range(5)]
+        
+        for candle in candles:
+            buffer.add_new_candle(candle)
+        
+        assert buffer.get_full_history() == candles[2:]
+        assert buffer.get_recent_data(2) == candles[3:]
+        assert buffer.get_recent_data(10) == candles[2:]
+        assert buffer.get_latest_candle() is candles[4]
+        assert buffer.view[1] is candles[3]
+        with pytest.raises(IndexError):
+            buffer.view[3]
+        info = buffer.get_buffer_info()
+        assert info["start_time"] == candles[2].timestamp.isoformat()
+        assert info["is_full"] is True
+    
+    def test_ohlcv_arrays(self):
+        """Test that columns mirror the buffered candles, oldest first."""
+        buffer = DataBuffer(max_size=2)
+        candles = [make_candle(i, close=str(100 + i)) for i in range(3)]
+        for candle in candles:
+            buffer.add_new_candle(candle)
+        
+        arrays = buffer.get_ohlcv_arrays()
+        
+        assert arrays["close"].tolist() == [101.0, 102.0]
+        assert arrays["high"].tolist() == [102.0, 103.0]
+        assert arrays["timestamp"].dtype == np.int64
+        assert arrays["timestamp"].tolist() == [int(c.timestamp.timestamp()) * 10**9 for c in candles[1:]]
+    
+    def test_resize_and_clear(self):
+        """Test that resizing keeps the newest candles and clear empties the ring."""
+        buffer = DataBuffer(initial_data=[make_candle(i) for i in reversed(range(4))], max_size=4)
+        
+        buffer.resize(2)
+        
+        assert [c.timestamp.minute for c in buffer.get_full_history()] == [2, 3]
+        buffer.add_new_candle(make_candle(4))
+        assert [c.timestamp.minute for c in buffer.get_full_history()] == [3, 4]
+        
+        buffer.clear()
+        assert buffer.get_full_history() == []
+        assert buffer.get_latest_candle() is None
+        assert buffer.get_ohlcv_arrays()["close"].size == 0
+    
+    def test_initial_data_is_sorted_and_trimmed(self):
+        """Test that unsorted history keeps its newest candles in time order."""
+        candles = [make_candle(i, close=str(100 + i)) for i in (3, 0, 5, 1, 4, 2)]
+        
+        buffer = DataBuffer(initial_data=candles, max_size=4)
+        
+        assert [c.timestamp.minute for c in buffer.get_full_history()] == [2, 3, 4, 5]
+        assert buffer.get_ohlcv_arrays()["close"].tolist() == [102.0, 103.0, 104.0, 105.0]
+        assert buffer.last_update == candles[2].timestamp
+        assert buffer.get_buffer_info()["start_time"] == candles[5].timestamp.isoformat()
+        
+        buffer.add_new_candle(make_candle(6))
+        in_range = buffer.get_data_in_range(candles[0].timestamp, candles[2].timestamp)
+        assert [c.timestamp.minute for c in in_range] == [3, 4, 5]
+        assert DataBuffer(initial_data=[], max_size=4).get_full_history() == []
+    
+    def test_data_in_range(self):
+        """Test range queries across the ring wrap, with and without late candles."""
+        buffer = DataBuffer(max_size=4)
+        for i in range(6):
+            buffer.add_new_candle(make_candle(i))
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        
+        def minutes(first, last):
+            found = buffer.get_data_in_range(start + timedelta(minutes=first), start + timedelta(minutes=last))
+            return [c.timestamp.minute for c in found]
+        
+        assert minutes(3, 4) == [3, 4]
+        assert minutes(0, 10) == [2, 3, 4, 5]
+        assert minutes(4.5, 4.9) == []
+        assert minutes(7, 9) == []
+        
+        # A candle one minute late is accepted out of order
+        buffer.add_new_candle(make_candle(7))
+        buffer.add_new_candle(make_candle(6))
+        assert minutes(6, 7) == [7, 6]
+        assert minutes(5, 5) == [5]
+        
+        for i in range(8, 12):
+            buffer.add_new_candle(make_candle(i))
+        assert minutes(9, 10) == [9, 10]
+    
+    def test_acquire_slot_reuses_evicted_candles(self):
+        """Test that pooled buffers hand evicted candles back out with new fields."""
+        buffer = DataBuffer(max_size=2, pool_size=1)
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        
+        def acquire(minute):
+            price = Decimal(100 + minute)
+            return buffer.acquire_slot(
+                start + timedelta(minutes=minute), price, price + 1, price - 1, price, Decimal("1"), "BTCUSDT"
+            )
+        
+        first = acquire(0)
+        for minute in range(3):
+            buffer.add_new_candle(first if minute == 0 else acquire(minute))
+        
+        recycled = acquire(3)
+        
+        assert recycled is first
+        assert recycled.timestamp == start + timedelta(minutes=3)
+        assert recycled.close == Decimal("103")
+        buffer.add_new_candle(recycled)
+        assert [c.close for c in buffer.get_full_history()] == [Decimal("102"), Decimal("103")]
+        assert acquire(4) is not first
+    
+    def test_callback_can_query_buffer(self):
+        """Test that callbacks run outside the (non-reentrant) buffer lock."""
+        seen = []
+        
+        def on_update(candle, evicted, view):
+            seen.append((len(buffer.get_full_history()), buffer.get_buffer_info()["current_size"], view[-1] is candle))
+        
+        buffer = DataBuffer(on_buffer_updated=on_update)
+        
+        buffer.add_new_candle(make_candle(0))
+        buffer.add_new_candle(make_candle(1))
+        
+        assert seen == [(1, 1, True), (2, 2, True)]
+    
+    def test_buffer_info_is_rebuilt_after_writes(self):
+        """Test that cached buffer info follows adds, clears and resizes."""
+        buffer = DataBuffer(max_size=4)
+        assert buffer.get_buffer_info()["start_time"] is None
+        
+        buffer.add_new_candle(make_candle(0))
+        first = buffer.get_buffer_info()
+        first["current_size"] = 99
+        assert buffer.get_buffer_info() == {**first, "current_size": 1}
+        
+        buffer.add_new_candle(make_candle(1))
+        info = buffer.get_buffer_info()
+        assert info["end_time"] == info["last_update"] == make_candle(1).timestamp.isoformat()
+        assert info["utilization"] == 0.5
+        
+        buffer.resize(1)
+        assert buffer.get_buffer_info()["start_time"] == info["end_time"]
+        buffer.clear()
+        assert buffer.get_buffer_info()["current_size"] == 0
+    
+    def test_duplicate_candle_is_skipped(self):
+        """Test that a repeated timestamp is not added or reported."""
+        updates = []
+        buffer = DataBuffer(on_buffer_updated=lambda *args: updates.append(args))
+        
+        buffer.add_new_candle(make_candle(0))
+        buffer.add_new_candle(make_candle(0, close="101"))
+        
+        assert len(updates) == 1
+        assert buffer.get_latest_candle().close == Decimal("100")
+    
+    def test_multi_symbol_callback_gets_symbol(self):
+        """Test that the manager prefixes callback arguments with the symbol."""
+        updates = []
+        manager = MultiSymbolDataBuffer(max_size=5)
+        manager.add_symbol("ETHUSDT", on_buffer_updated=lambda *args: updates.append(args))
+        candle = make_candle(0, symbol="ETHUSDT")
+        
+        manager.add_candle("ETHUSDT", candle)
+        
+        symbol, new, evicted, view = updates[0]
+        assert (symbol, new, evicted, len(view)) == ("ETHUSDT", candle, None, 1)
+        assert manager.get_symbol_data("ETHUSDT") == [candle]
+    
+    def test_multi_symbol_buffers_are_copy_on_write(self):
+        """Test that adding and removing symbols publishes new dictionaries."""
+        manager = MultiSymbolDataBuffer(max_size=5)
+        manager.add_symbol("BTCUSDT")
+        snapshot = manager.buffers
+        
+        manager.add_symbol("ETHUSDT")
+        manager.remove_symbol("BTCUSDT")
+        
+        assert list(snapshot) == ["BTCUSDT"]
+        assert manager.get_all_symbols() == ["ETHUSDT"]
+        assert manager.get_symbol_data("BTCUSDT") is None
+        assert set(manager.get_manager_info()) == {"ETHUSDT"}
@@ -0,0 +1,481 @@
+"""Tests for the base LLM client."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, Iterator, List
+
+import pytest
+from pydantic import BaseModel
+
+from src.core.settings import LLMSettings
+from src.core.types import LLMProvider
+from src.llm.anthropic_client import AnthropicClient
+from src.llm.openai_client import OpenAIClient
+from src.llm.base import BaseLLMClient, JSONFieldStream, LLMError, RateLimitError, parse_score
+from src.llm.cache import LLMResponseCache, MemoryResponseCache, make_cache_key
+from src.llm.rate_limiter import RateLimiter, TokenBucket
+
+
+class EchoClient(BaseLLMClient):
+    """LLM client that echoes prompts back after a short delay."""
+    
+    def __init__(self, delay: float = 0.0):
+        super().__init__(LLMProvider.OPENAI, "echo", "test-key")
+        self.response_cache = None
+        self.rate_limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=100000)
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    def _make_request(self, prompt: str, temperature: float = 0.1, max_tokens: int = 1000, **kwargs: Any) -> Dict[str, Any]:
+        return {"text": prompt, "tokens": len(prompt.split())}
+    
+    async def _amake_request(self, prompt: str, temperature: float = 0.1, max_tokens: int = 1000, **kwargs: Any) -> Dict[str, Any]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return self._make_request(prompt, temperature, max_tokens, **kwargs)
+    
+    def _extract_content(self, response_data: Dict[str, Any]) -> str:
+        return response_data["text"]
+    
+    def _extract_usage(self, response_data: Dict[str, Any]) -> Dict[str, int]:
+        tokens = response_data["tokens"]
+        return {"prompt_tokens": tokens, "completion_tokens": 0, "total_tokens": tokens}
+
+
+class APIError(Exception):
+    """Provider error carrying an HTTP status, like the SDK status errors."""
+    
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers={"retry-after": "0"})
+
+
+class StreamingClient(EchoClient):
+    """Echo client that streams a fixed JSON reply in small chunks."""
+    
+    supports_streaming = True
+    
+    def __init__(self, chunks: List[str]):
+        super().__init__()
+        self.chunks = chunks
+        self.consumed = 0
+    
+    def _make_request_stream(self, prompt: str, temperature: float = 0.1, max_tokens: int = 1000, **kwargs: Any) -> Iterator[str]:
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+    
+    async def _amake_request_stream(self, prompt: str, temperature: float = 0.1, max_tokens: int = 1000, **kwargs: Any) -> AsyncIterator[str]:
+        for chunk in self._make_request_stream(prompt, temperature, max_tokens, **kwargs):
+            yield chunk
+    
+    def _response_from_text(self, content: str) -> Dict[str, Any]:
+        return {"text": content, "tokens": 0}
+
+
+class Signal(BaseModel):
+    """Structured response used in tests."""
+    
+    action: str
+    confidence: float
+
+
+class TestBaseLLMClient:
+    """Test generation helpers shared by all providers."""
+    
+    def test_generate(self):
+        """Test synchronous generation."""
+        response = EchoClient().generate("hello world")
+        
+        assert response.content == "hello world"
+        assert response.usage["total_tokens"] == 2
+    
+    def test_generate_uses_response_cache(self, tmp_path):
+        """Test that repeated low-temperature prompts are served from the cache."""
+        client = EchoClient()
+        client.response_cache = LLMResponseCache(tmp_path / "responses.sqlite3", ttl_seconds=60)
+        calls = []
+        make_request = client._make_request
+        client._make_request = lambda *args, **kwargs: calls.append(args) or make_request(*args, **kwargs)
+        
+        first = client.generate("hello world", temperature=0.0)
+        second = client.generate("hello world", temperature=0.0)
+        client.generate("hello world", temperature=0.9)
+        
+        assert second.content == first.content
+        assert len(calls) == 2  # second call hit the cache, high temperature bypassed it
+        assert 60 - client.rate_limiter.requests.tokens == pytest.approx(2, abs=0.01)
+    
+    def test_generate_rejects_when_request_bucket_empty(self):
+        """Test that the request token bucket enforces the rate limit."""
+        client = EchoClient()
+        client.rate_limiter = RateLimiter(requests_per_minute=1, tokens_per_minute=100000)
+        client.generate("hello world")
+        
+        with pytest.raises(RateLimitError):
+            client.generate("hello world")
+    
+    def test_generate_rejects_over_budget_prompt_before_sending(self):
+        """Test that the token estimate is checked before the request is made."""
+        client = EchoClient()
+        calls = []
+        client._make_request = lambda *args, **kwargs: calls.append(args)
+        client.rate_limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=500)
+        
+        with pytest.raises(RateLimitError):
+            client.generate("hello world", max_tokens=1000)
+        
+        assert calls == []
+    
+    @pytest.mark.parametrize("status_code, expected_calls", [(400, 1), (429, None)])
+    def test_generate_retries_only_retryable_errors(self, status_code, expected_calls):
+        """Test that 4xx errors fail immediately while 429s are retried."""
+        client = EchoClient()
+        calls = []
+        
+        def failing_request(*args, **kwargs):
+            calls.append(args)
+            raise APIError(status_code)
+        
+        client._make_request = failing_request
+        with pytest.raises(LLMError):
+            client.generate("prompt")
+        
+        assert len(calls) == (expected_calls or client.settings.retry_attempts)
+    
+    def test_parse_score(self):
+        """Test score extraction from typical LLM replies."""
+        assert parse_score("0.85") == 0.85
+        assert parse_score("Score: 0.7.") == 0.7
+        assert parse_score(".5") == 0.5
+        assert parse_score("2") == 1.0  # clamped
+        assert parse_score("no idea") == 0.5
+    
+    def test_structured_stops_streaming_after_object(self):
+        """Test that structured output stops reading once the JSON object closes."""
+        chunks = ['{"action": "B', 'UY", "confi', 'dence": 0.8}', " Hope this helps!", " More text."]
+        client = StreamingClient(chunks)
+        
+        signal = client.structured("Decide", Signal)
+        
+        assert signal == Signal(action="BUY", confidence=0.8)
+        assert client.consumed == 3
+    
+    def test_json_field_stream_emits_fields_as_they_close(self):
+        """Test incremental parsing of top-level JSON fields across chunks."""
+        parser = JSONFieldStream()
+        
+        assert parser.feed('Sure: {"action": "BU') == []
+        assert parser.feed('Y", "levels": [1, {"a": "}"}], "note') == [("action", "BUY"), ("levels", [1, {"a": "}"}])]
+        assert parser.feed('": "x, y"} trailing') == [("note", "x, y")]
+        assert parser.done
+    
+    @pytest.mark.asyncio
+    async def test_stream_json_fields_stops_after_object(self):
+        """Test that field streaming closes the stream once the object ends."""
+        chunks = ['{"action": "B', 'UY", "confi', 'dence": 0.8}', " Hope this helps!", " More text."]
+        client = StreamingClient(chunks)
+        
+        fields = [field async for field in client.stream_json_fields("Decide")]
+        
+        assert fields == [("action", "BUY"), ("confidence", 0.8)]
+        assert client.consumed == 3
+    
+    @pytest.mark.asyncio
+    async def test_abatch_runs_concurrently_in_order(self):
+        """Test that batched prompts are issued together and keep their order."""
+        client = EchoClient(delay=0.01)
+        prompts = [f"prompt {i}" for i in range(5)]
+        
+        responses = await client.abatch(prompts)
+        
+        assert [response.content for response in responses] == prompts
+        assert client.max_in_flight == len(prompts)
+    
+    @pytest.mark.asyncio
+    async def test_agenerate_coalesces_identical_inflight_calls(self):
+        """Test that concurrent identical deterministic calls share one request."""
+        client = EchoClient(delay=0.01)
+        
+        responses = await asyncio.gather(*(client.agenerate("same", temperature=0.0) for _ in range(3)))
+        await client.agenerate("other", temperature=0.0)
+        
+        assert [response.content for response in responses] == ["same"] * 3
+        assert client.max_in_flight == 1
+        assert 60 - client.rate_limiter.requests.tokens == pytest.approx(2, abs=0.1)
+        assert client._inflight == {}
+    
+    @pytest.mark.asyncio
+    async def test_abatch_respects_provider_concurrency_cap(self):
+        """Test that a provider concurrency cap bounds in-flight requests."""
+        client = EchoClient(delay=0.01)
+        client.max_concurrency = 2
+        
+        responses = await client.abatch([f"prompt {i}" for i in range(5)])
+        
+        assert len(responses) == 5
+        assert client.max_in_flight == 2
+    
+    @pytest.mark.asyncio
+    async def test_offline_batch_falls_back_to_direct_requests(self):
+        """Test that clients without a batch API answer async batches through abatch."""
+        client = EchoClient()
+        
+        texts = await client.batch_generate(["a", "b"], batch_mode="async_batch")
+        
+        assert client.supports_offline_batch is False
+        assert texts == ["a", "b"]
+    
+    @pytest.mark.asyncio
+    async def test_default_stream_yields_whole_response(self):
+        """Test that the base stream hook falls back to one delta."""
+        client = EchoClient()
+        
+        chunks = [chunk async for chunk in client._amake_request_stream("hello world")]
+        
+        assert chunks == ["hello world"]
+        assert list(client._make_request_stream("hello world")) == ["hello world"]
+        assert client._response_from_text("hello world") is None
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_abatch_calls_share_concurrency_cap(self):
+        """Test that the cap bounds requests across concurrent abatch callers."""
+        client = EchoClient(delay=0.01)
+        client.max_concurrency = 2
+        
+        batches = await asyncio.gather(*(client.abatch([f"prompt {b}-{i}" for i in range(3)]) for b in range(3)))
+        
+        assert [len(responses) for responses in batches] == [3, 3, 3]
+        assert client.max_in_flight == 2
+
+
+class FakeBatches:
+    """Stand-in for the async Anthropic Message Batches resource."""
+    
+    def __init__(self, ends: bool = True):
+        self.requests: List[Dict[str, Any]] = []
+        self.ends = ends
+        self.cancelled: List[str] = []
+    
+    async def create(self, requests):
+        self.requests = requests
+        return SimpleNamespace(id="batch-1", processing_status="in_progress")
+    
+    async def retrieve(self, batch_id):
+        return SimpleNamespace(id=batch_id, processing_status="ended" if self.ends else "in_progress")
+    
+    async def cancel(self, batch_id):
+        self.cancelled.append(batch_id)
+    
+    async def results(self, batch_id):
+        return self._results()
+    
+    async def _results(self):
+        # Results come back out of order; the second request fails
+        for request in reversed(self.requests):
+            custom_id = request["custom_id"]
+            if custom_id == "1":
+                yield SimpleNamespace(custom_id=custom_id, result=SimpleNamespace(type="errored"))
+                continue
+            message = SimpleNamespace(model_dump=lambda i=custom_id: {"content": [{"text": f"0.{i}"}]})
+            yield SimpleNamespace(custom_id=custom_id, result=SimpleNamespace(type="succeeded", message=message))
+
+
+class TestAnthropicClient:
+    """Test Anthropic-specific batching."""
+    
+    @pytest.fixture
+    def batches(self):
+        """Create a fake batches resource."""
+        return FakeBatches()
+    
+    @pytest.fixture
+    def client(self, batches):
+        """Create an Anthropic client backed by the fake batches resource."""
+        client = AnthropicClient(api_key="test-key")
+        client.aclient = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+        return client
+    
+    @pytest.mark.asyncio
+    async def test_score_many_preserves_order(self, client):
+        """Test that batch scores map back to their texts."""
+        scores = await client.score_many(["a", "b", "c"], "relevance", poll_interval=0)
+        
+        assert scores == [0.0, 0.5, 0.2]
+    
+    @pytest.mark.asyncio
+    async def test_batch_generate_offline_preserves_order(self, client, batches):
+        """Test that Message Batches results map back to their prompts."""
+        texts = await client.batch_generate(["a", "b", "c"], batch_mode="async_batch", max_tokens=5, poll_interval=0)
+        
+        assert texts == ["0.0", "", "0.2"]
+        assert batches.requests[2]["params"]["messages"] == [{"role": "user", "content": "c"}]
+        assert batches.requests[2]["params"]["max_tokens"] == 5
+    
+    @pytest.mark.asyncio
+    async def test_batch_is_cancelled_after_timeout(self, client, batches):
+        """Test that a batch still running at the deadline is cancelled."""
+        batches.ends = False
+        
+        with pytest.raises(LLMError):
+            await client.score_many(["a"], "relevance", poll_interval=0.01, timeout=0.03)
+        
+        assert batches.cancelled == ["batch-1"]
+
+
+class FakeOpenAIBatchAPI:
+    """Stand-in for the OpenAI files and batches resources."""
+    
+    def __init__(self):
+        self.uploaded = b""
+        self.files = SimpleNamespace(create=self.create_file, content=self.file_content)
+        self.batches = SimpleNamespace(create=self.create_batch, retrieve=self.retrieve_batch)
+    
+    async def create_file(self, file, purpose):
+        self.uploaded = file[1]
+        return SimpleNamespace(id="file-in")
+    
+    async def create_batch(self, input_file_id, endpoint, completion_window):
+        return SimpleNamespace(id="batch-1", status="in_progress", output_file_id=None)
+    
+    async def retrieve_batch(self, batch_id):
+        return SimpleNamespace(id=batch_id, status="completed", output_file_id="file-out")
+    
+    async def file_content(self, file_id):
+        # Results come back out of order; the second request fails
+        lines = []
+        for request in reversed(self.uploaded.decode().splitlines()):
+            custom_id = json.loads(request)["custom_id"]
+            if custom_id == "1":
+                lines.append(json.dumps({"custom_id": custom_id, "response": None, "error": {"code": "server_error"}}))
+                continue
+            body = {"choices": [{"message": {"content": f"reply {custom_id}"}}]}
+            lines.append(json.dumps({"custom_id": custom_id, "response": {"status_code": 200, "body": body}}))
+        return SimpleNamespace(text="\n".join(lines))
+
+
+class TestOpenAIClient:
+    """Test OpenAI-specific batching."""
+    
+    @pytest.mark.asyncio
+    async def test_batch_generate_sends_prompt_list_in_one_request(self):
+        """Test that completions models answer all prompts with one request."""
+        client = OpenAIClient(model="gpt-3.5-turbo-instruct", api_key="test-key")
+        calls = []
+        
+        async def create(**kwargs):
+            calls.append(kwargs)
+            choices = [SimpleNamespace(index=i, text=f"reply {i}") for i in reversed(range(len(kwargs["prompt"])))]
+            usage = SimpleNamespace(prompt_tokens=3, completion_tokens=7, total_tokens=10)
+            return SimpleNamespace(choices=choices, usage=usage)
+        
+        client.aclient = SimpleNamespace(completions=SimpleNamespace(create=create))
+        
+        texts = await client.batch_generate(["a", "b", "c"], max_tokens=5)
+        
+        assert texts == ["reply 0", "reply 1", "reply 2"]
+        assert len(calls) == 1
+    
+    def test_generate_plucks_response_fields(self):
+        """Test that chat completions are reduced to the fields the client reads."""
+        client = OpenAIClient(api_key="test-key")
+        client.response_cache = None
+        message = SimpleNamespace(content="BUY")
+        usage = SimpleNamespace(prompt_tokens=5, completion_tokens=1, total_tokens=6)
+        completion = SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")], usage=usage)
+        client.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **kwargs: completion)))
+        
+        response = client.generate("Decide")
+        
+        assert response.content == "BUY"
+        assert response.usage == {"prompt_tokens": 5, "completion_tokens": 1, "total_tokens": 6}
+    
+    @pytest.mark.asyncio
+    async def test_batch_generate_offline_preserves_order(self):
+        """Test that Batch API results map back to their prompts."""
+        client = OpenAIClient(api_key="test-key")
+        client.aclient = FakeOpenAIBatchAPI()
+        
+        texts = await client.batch_generate(["a", "b", "c"], batch_mode="async_batch", poll_interval=0)
+        
+        assert texts == ["reply 0", "", "reply 2"]
+
+
+class TestResponseCache:
+    """Test LLM response caching."""
+    
+    def test_cache_key_ignores_whitespace_layout(self):
+        """Test that prompts differing only in whitespace share a key."""
+        key = make_cache_key("openai", "gpt-4", 0.1, 100, "Score this\n    text")
+        
+        assert key == make_cache_key("openai", "gpt-4", 0.1, 100, "  Score this text ")
+        assert key != make_cache_key("openai", "gpt-4", 0.1, 100, "Score that text")
+    
+    def test_memory_cache_evicts_least_recently_used(self):
+        """Test LRU eviction in the memory tier."""
+        cache = MemoryResponseCache(max_entries=2, ttl_seconds=60)
+        cache.put("a", {"text": "a"})
+        cache.put("b", {"text": "b"})
+        cache.get("a")
+        cache.put("c", {"text": "c"})
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == {"text": "a"}
+        assert cache.get("c") == {"text": "c"}
+    
+    def test_response_cache_is_opt_in(self):
+        """Test that responses are not cached unless enabled."""
+        assert LLMSettings().response_cache_enabled is False
+    
+    @pytest.mark.asyncio
+    async def test_agenerate_reads_and_writes_cache_off_the_loop(self, tmp_path):
+        """Test async cache hits from the memory tier and from the database."""
+        path = tmp_path / "responses.sqlite3"
+        client = EchoClient()
+        client.response_cache = LLMResponseCache(path, ttl_seconds=60)
+        calls = []
+        amake_request = client._amake_request
+        
+        async def counting_request(*args, **kwargs):
+            calls.append(args)
+            return await amake_request(*args, **kwargs)
+        
+        client._amake_request = counting_request
+        
+        first = await client.agenerate("hello world", temperature=0.0)
+        second = await client.agenerate("hello world", temperature=0.0)
+        client.response_cache = LLMResponseCache(path, ttl_seconds=60)  # empty memory tier
+        third = await client.agenerate("hello world", temperature=0.0)
+        
+        assert second.content == third.content == first.content
+        assert len(calls) == 1
+
+
+class TestTokenBucket:
+    """Test the client-side rate limiter."""
+    
+    def test_try_acquire_and_debt(self):
+        """Test taking tokens and charging usage beyond the balance."""
+        bucket = TokenBucket(rate=0.001, capacity=10)
+        
+        assert bucket.try_acquire(8) is True
+        assert bucket.try_acquire(8) is False
+        
+        bucket.consume(5)
+        assert bucket.tokens < 0
+    
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_refill(self):
+        """Test that acquire blocks until the bucket has refilled."""
+        bucket = TokenBucket(rate=100, capacity=1)
+        await bucket.acquire(1)
+        
+        start = asyncio.get_running_loop().time()
+        await bucket.acquire(1)
+        
+        assert asyncio.get_running_loop().time() - start >= 0.005
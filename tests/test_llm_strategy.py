@@ -0,0 +1,148 @@
+"""Tests for the LLM strategy response handling."""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from src.core.types import OHLCVData, StrategyConfig, TechnicalIndicators
+from src.strategy.llm_strategy import LLMStrategy
+
+
+def make_candles(count: int) -> list:
+    """Create one-minute candles closing at 100, 101, ..."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [
+        OHLCVData(
+            timestamp=start + timedelta(minutes=i),
+            open=Decimal("100"),
+            high=Decimal("101"),
+            low=Decimal("99"),
+            close=Decimal(100 + i),
+            volume=Decimal(i),
+            symbol="BTCUSDT",
+        )
+        for i in range(count)
+    ]
+
+
+class TestLLMStrategy:
+    """Test parsing of LLM decisions."""
+    
+    @pytest.fixture
+    def strategy(self):
+        """Create a strategy without an LLM client."""
+        return LLMStrategy(llm_client=None)
+    
+    def test_parse_json_embedded_in_text(self, strategy):
+        """Test that a JSON object is extracted from surrounding text."""
+        response = 'Decision:\n{"action": "BUY", "confidence": 0.8, "details": {"rsi": 25}}\nDone.'
+        
+        decision = strategy._parse_llm_response(response)
+        
+        assert decision == {"action": "BUY", "confidence": 0.8, "details": {"rsi": 25}}
+    
+    def test_parse_bare_json(self, strategy):
+        """Test that a response that is only JSON is parsed directly."""
+        decision = strategy._parse_llm_response('  {"action": "HOLD", "confidence": 0.4}\n')
+        
+        assert decision == {"action": "HOLD", "confidence": 0.4}
+    
+    def test_parse_free_text_fallback(self, strategy):
+        """Test keyword and confidence extraction when there is no JSON."""
+        decision = strategy._parse_llm_response("I would SELL here. Confidence: 85")
+        
+        assert decision["action"] == "SELL"
+        assert decision["confidence"] == 0.85
+        assert decision["risk_score"] == 0.5
+    
+    def test_parse_invalid_json_falls_back(self, strategy):
+        """Test that malformed JSON falls back to keyword parsing."""
+        decision = strategy._parse_llm_response("{action: BUY} conf: 0.9")
+        
+        assert decision["action"] == "BUY"
+        assert decision["confidence"] == 0.9
+    
+    def test_decision_prompt_renders_analysis_and_config(self, strategy):
+        """Test that the prompt template is filled from analysis and config."""
+        analysis = {
+            "symbol": "BTCUSDT",
+            "current_price": 50000.126,
+            "price_changes": {"5_period": 0.01},
+            "technical_indicators": {"rsi": 55.0, "sma_20": None, "ema_20": 49900.0, "atr": 120.0, "volatility": 0.02},
+            "market_signals": {"trend": "bullish"},
+        }
+        config = StrategyConfig(name="llm", description="test", stop_loss_pct=0.03)
+        
+        prompt = strategy._create_decision_prompt(analysis, config)
+        
+        assert "- Current Price: $50000.13" in prompt
+        assert "* Trend: bullish" in prompt
+        assert "* Momentum: unknown" in prompt
+        assert "- Stop Loss: 3.0%" in prompt
+        assert '"action": "BUY" | "SELL" | "HOLD",' in prompt
+    
+    def test_market_analysis_converts_prices_once_per_candle(self, strategy):
+        """Test that price conversions are reused until a new candle arrives."""
+        data = make_candles(20)
+        indicators = TechnicalIndicators()
+        
+        analysis = strategy._prepare_market_analysis(data, indicators, {})
+        
+        assert analysis["current_price"] == 119.0
+        assert analysis["price_changes"] == {"5_period": (119 - 115) / 115, "20_period": (119 - 100) / 100}
+        assert analysis["recent_volumes"] == [float(i) for i in range(10, 20)]
+        assert strategy._price_snapshot(data) is strategy._price_snapshot(list(data))
+        
+        data.append(data[-1].model_copy(update={"close": Decimal("130")}))
+        assert strategy._prepare_market_analysis(data, indicators, {})["current_price"] == 130.0
+    
+    def test_trading_decision_prices_are_decimals(self, strategy):
+        """Test that sizes and levels are converted to 8-decimal Decimals."""
+        data = make_candles(1)
+        config = StrategyConfig(name="llm", description="test")
+        
+        decision = strategy._create_trading_decision(
+            {"action": "BUY", "confidence": 0.9, "reasoning": "breakout"}, data, config
+        )
+        
+        assert decision.price is data[-1].close
+        assert decision.quantity == Decimal("50")
+        assert decision.stop_loss == Decimal("98")
+        assert decision.take_profit == Decimal("104")
+        assert decision.take_profit.as_tuple().exponent == -8
+    
+    def test_free_text_reasoning_is_summarized_when_used(self, strategy):
+        """Test that fallback responses become reasoning only for kept decisions."""
+        config = StrategyConfig(name="llm", description="test")
+        response = "HOLD for now, confidence: 0.9. " + "x" * 300
+        strategy._create_no_action_decision = lambda data, reasoning: reasoning
+        
+        decision_data = strategy._parse_llm_response(response)
+        
+        assert decision_data["response"] is response
+        assert strategy._create_trading_decision(decision_data, make_candles(1), config) == response[:200] + "..."
+        
+        low = strategy._parse_llm_response("HOLD, confidence: 0.3")
+        assert strategy._create_trading_decision(low, make_candles(1), config) == "Confidence too low: 30.0%"
+    
+    @pytest.mark.parametrize("field,value", [
+        ("confidence", float("nan")),
+        ("confidence", "high"),
+        ("risk_score", float("inf")),
+        ("quantity", float("inf")),
+        ("quantity", 1e300),
+    ])
+    def test_non_finite_or_huge_values_fall_back_to_no_action(self, strategy, field, value):
+        """Test that unusable numbers give a no-action decision instead of raising."""
+        config = StrategyConfig(name="llm", description="test")
+        decision_data = {"action": "BUY", "confidence": 0.9, "risk_score": 0.5, "reasoning": "breakout"}
+        if field == "quantity":
+            strategy.calculate_position_size = lambda *args: value
+        else:
+            decision_data[field] = value
+        
+        decision = strategy._create_trading_decision(decision_data, make_candles(1), config)
+        
+        assert decision.quantity == Decimal("0")
+        assert decision.reasoning == "Invalid LLM decision values"
@@ -0,0 +1,93 @@
+"""Tests for the order router in paper trading mode."""
+
+from decimal import Decimal
+
+import pytest
+
+from src.core.types import OrderSide, TradingDecision, TradingMode
+from src.execution.order_router import OrderRouter
+from src.execution.risk_manager import RiskManager
+
+
+class TestOrderRouter:
+    """Test order routing and session statistics."""
+    
+    @pytest.fixture
+    def router(self):
+        """Create a paper trading router with an active session."""
+        router = OrderRouter(TradingMode.PAPER)
+        router.start_session("technical", Decimal("10000"))
+        return router
+    
+    @pytest.fixture
+    def decision(self):
+        """Create a buy decision for testing."""
+        return TradingDecision(
+            action=OrderSide.BUY,
+            symbol="BTCUSDT",
+            quantity=Decimal("0.002"),
+            price=Decimal("50000"),
+            confidence=0.9,
+            reasoning="Test decision",
+            risk_score=0.1,
+        )
+    
+    def test_execute_decision_updates_session(self, router, decision):
+        """Test that executed orders are reflected in the session status."""
+        order_response = router.execute_decision(decision)
+        
+        assert order_response is not None
+        assert order_response.client_order_id.startswith("BTCUSDT_BUY_")
+        
+        status = router.get_session_status()
+        assert status["total_trades"] == 1
+        assert status["successful_trades"] == 1
+        assert status["current_balance"] == "9900"
+        assert status["pnl"] == "-100"
+        assert status["active_orders"] == 1
+    
+    def test_end_session_flushes_pending_stats(self, router, decision):
+        """Test that ending a session folds in deferred statistics."""
+        router.execute_decision(decision)
+        session = router.end_session()
+        
+        assert session.total_trades == 1
+        assert session.current_balance == Decimal("9900")
+        assert router.get_session_status() is None
+    
+    def test_buy_and_sell_round_order_value_symmetrically(self, router, monkeypatch):
+        """Test that fills worth half a fixed-point unit round the same way on both sides."""
+        monkeypatch.setattr(RiskManager, "validate_trading_decision", lambda self, decision, balance: True)
+        monkeypatch.setattr(RiskManager, "adjust_order_size", lambda self, order, balance: order)
+        
+        def trade(side):
+            router.execute_decision(TradingDecision(
+                action=side,
+                symbol="BTCUSDT",
+                quantity=Decimal("0.00000003"),
+                price=Decimal("0.5"),  # worth 0.000000015: 1.5 units
+                confidence=0.9,
+                reasoning="Test decision",
+                risk_score=0.1,
+            ))
+            return router.get_session_status()["current_balance"]
+        
+        assert trade(OrderSide.BUY) == "9999.99999998"
+        assert trade(OrderSide.SELL) == "10000"
+    
+    def test_risk_checks_see_fills_before_stats_flush(self, router, decision, monkeypatch):
+        """Test that fills update the checked balance while counters stay batched."""
+        balances = []
+        monkeypatch.setattr(
+            RiskManager, "validate_trading_decision", lambda self, decision, balance: balances.append(balance) or True
+        )
+        monkeypatch.setattr(RiskManager, "adjust_order_size", lambda self, order, balance: order)
+        
+        router.execute_decision(decision)
+        router.execute_decision(decision)
+        
+        assert balances == [Decimal("10000"), Decimal("9900")]
+        assert len(router._pending_stats) == 2
+        assert router.session.total_trades == 0
+        assert router.get_session_status()["total_trades"] == 2
+        assert router.session.current_balance == Decimal("9800")
@@ -0,0 +1,105 @@
+"""Tests for the columnar active order table."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from src.core.types import OrderResponse, OrderSide, OrderStatus
+from src.execution.order_table import ActiveOrderTable
+
+
+def make_order(order_id: str, quantity: str = "0.5", price: str = "50000.0") -> OrderResponse:
+    """Create a filled order response for testing."""
+    return OrderResponse(
+        order_id=order_id,
+        client_order_id=f"client_{order_id}",
+        symbol="BTCUSDT",
+        status=OrderStatus.FILLED,
+        side=OrderSide.BUY,
+        quantity=Decimal(quantity),
+        price=Decimal(price),
+        executed_quantity=Decimal(quantity),
+        executed_price=Decimal(price),
+        timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+class TestActiveOrderTable:
+    """Test the struct-of-arrays order table."""
+    
+    def test_add_and_get_round_trip(self):
+        """Test that stored orders are rebuilt unchanged."""
+        table = ActiveOrderTable()
+        order = make_order("1")
+        table.add(order)
+        
+        assert "1" in table
+        assert len(table) == 1
+        assert table.get("1") == order
+        assert table.get("missing") is None
+    
+    def test_get_keeps_exact_decimals_and_long_symbols(self):
+        """Test that values the float columns can't hold survive a round trip."""
+        table = ActiveOrderTable()
+        order = make_order("1", quantity="0.12345678").model_copy(
+            update={"symbol": "1000SHIBUSDT_PERPETUAL_QUARTER", "price": Decimal("0.1") + Decimal("0.2")}
+        )
+        table.add(order)
+        
+        stored = table.get("1")
+        
+        assert stored.price == Decimal("0.3")
+        assert stored.executed_quantity == Decimal("0.12345678")
+        assert stored.executed_quantity.as_tuple() == Decimal("0.12345678").as_tuple()
+        assert stored.symbol == "1000SHIBUSDT_PERPETUAL_QUARTER"
+        assert table.symbols[0] == stored.symbol
+    
+    def test_len_tracks_updates_and_cancellations(self):
+        """Test that the active count follows re-adds of live and cancelled orders."""
+        table = ActiveOrderTable()
+        table.add(make_order("1"))
+        table.add(make_order("1"))
+        table.add(make_order("2").model_copy(update={"status": OrderStatus.CANCELED}))
+        
+        assert len(table) == 1
+        
+        table.add(make_order("2"))
+        table.cancel("1")
+        
+        assert len(table) == 1
+        assert "2" in table
+    
+    def test_cancel_marks_order_inactive(self):
+        """Test that cancelled orders are no longer active."""
+        table = ActiveOrderTable()
+        table.add(make_order("1"))
+        table.add(make_order("2"))
+        
+        assert table.cancel("1") is True
+        assert table.cancel("1") is False
+        assert "1" not in table
+        assert table.get("1") is None
+        assert len(table) == 1
+    
+    def test_grows_and_compacts(self):
+        """Test capacity growth and reclamation of cancelled rows."""
+        table = ActiveOrderTable(initial_capacity=2)
+        for i in range(10):
+            table.add(make_order(str(i)))
+        
+        assert table.capacity >= 10
+        assert len(table) == 10
+        
+        for i in range(8):
+            table.cancel(str(i))
+        
+        assert len(table) == 2
+        assert len(table.ids) < 10
+        assert table.get("9") == make_order("9")
+    
+    def test_notional(self):
+        """Test aggregate notional of active orders."""
+        table = ActiveOrderTable()
+        table.add(make_order("1", quantity="0.5", price="100.0"))
+        table.add(make_order("2", quantity="2.0", price="10.0"))
+        
+        assert table.notional() == 70.0
@@ -0,0 +1,105 @@
+"""Tests for risk management checks."""
+
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from src.core.types import OrderRequest, OrderSide, OrderType, TradingMode
+from src.execution import risk_kernel, risk_manager as risk_manager_module
+from src.execution.risk_manager import RiskManager
+
+
+def make_order(quantity: str, price: str = "50000") -> OrderRequest:
+    """Create a limit order request for testing."""
+    return OrderRequest(
+        symbol="BTCUSDT",
+        side=OrderSide.BUY,
+        order_type=OrderType.LIMIT,
+        quantity=Decimal(quantity),
+        price=Decimal(price),
+    )
+
+
+class TestRiskManager:
+    """Test order validation and sizing against risk limits."""
+    
+    @pytest.fixture
+    def risk_manager(self):
+        """Create a paper trading risk manager."""
+        return RiskManager(TradingMode.PAPER)
+    
+    def test_validate_order_within_limits(self, risk_manager):
+        """Test that a small order passes validation."""
+        assert risk_manager.validate_order(make_order("0.002"), Decimal("10000")) is True
+    
+    def test_validate_order_rejects_limit_breaches(self, risk_manager):
+        """Test that orders outside size and position limits are rejected."""
+        balance = Decimal("10000")
+        
+        assert risk_manager.validate_order(make_order("0.0001"), balance) is False  # below min order size
+        assert risk_manager.validate_order(make_order("1"), balance) is False  # above max order size
+        assert risk_manager.validate_order(make_order("0.03"), balance) is False  # above max position size
+    
+    def test_validate_order_respects_daily_trade_limit(self, risk_manager):
+        """Test that orders are rejected once the daily trade limit is reached."""
+        risk_manager.daily_trades = risk_manager.max_daily_trades
+        
+        assert risk_manager.validate_order(make_order("0.002"), Decimal("10000")) is False
+    
+    def test_adjust_order_size_caps_risk(self, risk_manager):
+        """Test that oversized orders are scaled down to the risk budget."""
+        adjusted = risk_manager.adjust_order_size(make_order("0.01"), Decimal("10000"))
+        
+        assert adjusted.quantity == Decimal("0.002")
+    
+    def test_validate_orders_batch_matches_single_validation(self, risk_manager):
+        """Test that batch validation agrees with per-order validation."""
+        balance = Decimal("10000")
+        orders = [make_order(quantity) for quantity in ("0.0001", "0.002", "0.01", "0.03", "1")]
+        orders.append(OrderRequest(
+            symbol="BTCUSDT",
+            side=OrderSide.SELL,
+            order_type=OrderType.MARKET,
+            quantity=Decimal("1"),
+        ))
+        
+        expected = [risk_manager.validate_order(order, balance) for order in orders]
+        
+        assert risk_manager.validate_orders_batch(orders, balance).tolist() == expected
+    
+    @pytest.mark.parametrize("use_numba", [True, False])
+    def test_batch_kernel_with_and_without_numba(self, risk_manager, monkeypatch, use_numba):
+        """Test that the prange kernel and the NumPy fallback give the same flags."""
+        if use_numba:
+            # Compiled when numba is installed, otherwise the same loop as plain Python
+            kernel = risk_kernel._evaluate_risk_flags_batch_parallel
+            if risk_kernel.NUMBA_AVAILABLE:
+                kernel = risk_kernel.njit(parallel=True)(kernel)
+        else:
+            kernel = risk_kernel._evaluate_risk_flags_batch_numpy
+        monkeypatch.setattr(risk_manager_module, "evaluate_risk_flags_batch", kernel)
+        values = np.array([1.0, 100.0, 400.0, 1500.0, 50000.0, np.nan])
+        args = (10000.0, *risk_manager._risk_limits)
+        balance = Decimal("10000")
+        orders = [make_order(quantity) for quantity in ("0.0001", "0.002", "0.01", "0.03", "1")]
+        
+        assert kernel(values, *args).tolist() == risk_kernel._evaluate_risk_flags_batch_numpy(values, *args).tolist()
+        assert kernel(values, *args).tolist() == [
+            risk_kernel.evaluate_risk_flags(value, *args) if value == value else 0 for value in values
+        ]
+        assert risk_manager.validate_orders_batch(orders, balance).tolist() == [
+            risk_manager.validate_order(order, balance) for order in orders
+        ]
+    
+    def test_risk_status_refreshes_after_trade(self, risk_manager):
+        """Test that the cached risk status reflects recorded trades."""
+        before = risk_manager.get_risk_status()
+        assert risk_manager.get_risk_status() is before
+        
+        risk_manager.record_trade(Decimal("100"), Decimal("-25"))
+        status = risk_manager.get_risk_status()
+        
+        assert status["daily_trades"] == 1
+        assert status["daily_pnl"] == "-25"
+        assert status["trades_remaining"] == risk_manager.max_daily_trades - 1
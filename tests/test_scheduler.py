@@ -0,0 +1,41 @@
+"""Tests for the analysis scheduler."""
+
+import asyncio
+
+import pytest
+
+from src.streaming.scheduler import AnalysisScheduler
+
+
+class TestAnalysisScheduler:
+    """Test analysis timing."""
+    
+    @pytest.mark.asyncio
+    async def test_triggers_at_each_interval(self):
+        """Test that analyses fire on schedule without a polling delay."""
+        times = []
+        scheduler = AnalysisScheduler(interval_seconds=0.05, on_analysis_time=times.append)
+        
+        await scheduler.start()
+        await asyncio.sleep(0.18)
+        await scheduler.stop()
+        
+        assert 2 <= len(times) <= 4
+        assert scheduler.analysis_count == len(times)
+        assert times == sorted(times)
+    
+    @pytest.mark.asyncio
+    async def test_set_interval_wakes_sleeping_loop(self):
+        """Test that shortening the interval reschedules the pending sleep."""
+        fired = asyncio.Event()
+        scheduler = AnalysisScheduler(interval_seconds=3600, on_analysis_time=lambda t: fired.set())
+        
+        await scheduler.start()
+        await asyncio.sleep(0)
+        scheduler.set_interval(0.01)
+        try:
+            await asyncio.wait_for(fired.wait(), 0.5)
+        finally:
+            await scheduler.stop()
+        
+        assert scheduler.analysis_count >= 1
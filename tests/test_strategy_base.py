@@ -0,0 +1,37 @@
+"""Tests for shared strategy risk calculations."""
+
+import numpy as np
+import pytest
+
+from src.strategy.llm_strategy import LLMStrategy
+
+
+class TestBaseStrategy:
+    """Test stop loss and take profit levels."""
+    
+    @pytest.fixture
+    def strategy(self):
+        """Create a concrete strategy without an LLM client."""
+        return LLMStrategy(llm_client=None)
+    
+    def test_levels_by_side(self, strategy):
+        """Test that levels move against and with each side."""
+        assert strategy.calculate_stop_loss(100.0, "BUY", 0.02) == pytest.approx(98.0)
+        assert strategy.calculate_stop_loss(100.0, "SELL", 0.02) == pytest.approx(102.0)
+        assert strategy.calculate_take_profit(100.0, "BUY", 0.04) == pytest.approx(104.0)
+        assert strategy.calculate_take_profit(100.0, "SELL", 0.04) == pytest.approx(96.0)
+    
+    def test_vectorized_levels_match_scalar(self, strategy):
+        """Test that the array versions agree with the per-entry versions."""
+        prices = np.array([100.0, 250.0, 80.0])
+        sides = np.array(["BUY", "SELL", "BUY"])
+        
+        stop_losses = strategy.calculate_stop_loss_vec(prices, sides, 0.02)
+        take_profits = strategy.calculate_take_profit_vec(prices, sides, 0.04)
+        
+        assert stop_losses.tolist() == pytest.approx(
+            [strategy.calculate_stop_loss(p, s, 0.02) for p, s in zip(prices, sides)]
+        )
+        assert take_profits.tolist() == pytest.approx(
+            [strategy.calculate_take_profit(p, s, 0.04) for p, s in zip(prices, sides)]
+        )
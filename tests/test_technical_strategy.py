@@ -0,0 +1,195 @@
+"""Tests for technical signal scoring."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from src.core.types import OHLCVData, StrategyConfig, TechnicalIndicators
+from src.strategy.scoring_kernel import (
+    MOMENTUM_STRONG,
+    SIGNAL_BUY,
+    SIGNAL_SELL,
+    TREND_BEARISH,
+    TREND_BULLISH,
+    VOLATILITY_HIGH,
+    score_signals,
+)
+from src.strategy.technical_strategy import TechnicalStrategy
+
+
+class TestTechnicalStrategy:
+    """Test the scoring of indicators and market signals."""
+    
+    @pytest.fixture
+    def strategy(self):
+        """Create a technical strategy."""
+        return TechnicalStrategy()
+    
+    def test_strategy_has_no_instance_dict(self, strategy):
+        """Test that strategy state lives in slots."""
+        assert not hasattr(strategy, "__dict__")
+        assert strategy.name == "Technical Strategy"
+    
+    def test_bullish_setup_scores_buy(self, strategy):
+        """Test that oversold RSI with bullish signals gives a buy."""
+        indicators = TechnicalIndicators(rsi=25.0, sma_20=101.0, ema_20=100.0)
+        signals = {"trend": "bullish", "momentum": "strong", "volatility_regime": "low"}
+        
+        analysis = strategy._analyze_technical_signals(indicators, signals, 105.0)
+        
+        assert analysis["signal"] == "BUY"
+        assert analysis["score"] == pytest.approx((0.3 + 0.2 + 0.1 + 0.2 + 0.1) * 1.1)
+        assert analysis["signal_strength"] == pytest.approx(0.99)
+        assert analysis["reasoning"] == (
+            "RSI oversold (25.0); Price above moving averages; SMA above EMA (bullish); "
+            "Bullish trend; Strong momentum; Low volatility - increased confidence"
+        )
+    
+    def test_bearish_setup_scores_sell(self, strategy):
+        """Test that overbought RSI with bearish signals gives a sell."""
+        indicators = TechnicalIndicators(rsi=75.0, sma_20=99.0, ema_20=100.0)
+        signals = {"trend": "bearish", "momentum": "weak", "volatility_regime": "high"}
+        
+        analysis = strategy._analyze_technical_signals(indicators, signals, 95.0)
+        
+        assert analysis["signal"] == "SELL"
+        assert analysis["score"] == pytest.approx(-0.9 * 0.8)
+        assert analysis["signal_strength"] == pytest.approx(0.72)
+    
+    def test_unknown_signals_are_neutral(self, strategy):
+        """Test that missing indicators and unknown signals hold."""
+        analysis = strategy._analyze_technical_signals(TechnicalIndicators(), {"trend": "choppy"}, 100.0)
+        
+        assert analysis["signal"] == "HOLD"
+        assert analysis["score"] == 0.0
+        assert analysis["reasoning"] == "Sideways trend"
+    
+    def test_scoring_kernel_skips_missing_indicators(self):
+        """Test that NaN indicators contribute no score or reason flags."""
+        nan = float("nan")
+        
+        score, signal, flags = score_signals(75.0, nan, nan, 100.0, TREND_BEARISH, 0, 0)
+        
+        assert score == pytest.approx(-0.5)
+        assert signal == SIGNAL_SELL
+        assert flags == 2  # RSI_OVERBOUGHT only
+    
+    def test_decide_without_signal_returns_no_action(self, strategy):
+        """Test that a weak setup yields a zero-quantity hold decision."""
+        candle = OHLCVData(
+            timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            open=Decimal("100"),
+            high=Decimal("101"),
+            low=Decimal("99"),
+            close=Decimal("100"),
+            volume=Decimal("5"),
+            symbol="BTCUSDT",
+        )
+        
+        decision = strategy.decide([candle], TechnicalIndicators(rsi=50.0), {}, StrategyConfig(name="t", description="t"))
+        
+        assert decision.quantity == 0
+        assert decision.reasoning == "HOLD: RSI neutral (50.0); Sideways trend"
+    
+    def test_decide_recompiles_for_new_config(self, strategy):
+        """Test that decide specializes per config values and follows in-place edits."""
+        candle = OHLCVData(
+            timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            open=Decimal("100"),
+            high=Decimal("106"),
+            low=Decimal("99"),
+            close=Decimal("105"),
+            volume=Decimal("5"),
+            symbol="BTCUSDT",
+        )
+        indicators = TechnicalIndicators(rsi=25.0, sma_20=101.0, ema_20=100.0)
+        signals = {"trend": "bullish", "momentum": "strong", "volatility_regime": "low"}
+        config = StrategyConfig(name="t", description="t", min_confidence=1.0)
+        
+        assert strategy.decide([candle], indicators, signals, config).quantity == 0
+        compiled = strategy._decide_fast
+        assert strategy.decide([candle], indicators, signals, config).quantity == 0
+        assert strategy._decide_fast is compiled
+        
+        config.min_confidence = 0.5
+        assert strategy.decide([candle], indicators, signals, config).action == "BUY"
+        
+        other = StrategyConfig(name="t", description="t", min_confidence=1.0)
+        assert strategy.decide([candle], indicators, signals, other).quantity == 0
+    
+    def test_equal_configs_share_compiled_decide(self, strategy, monkeypatch):
+        """Test that a fresh but equal config per call does not recompile."""
+        compiles = []
+        compile_config = TechnicalStrategy.compile
+        monkeypatch.setattr(
+            TechnicalStrategy, "compile", lambda self, config: compiles.append(1) or compile_config(self, config)
+        )
+        candle = OHLCVData(
+            timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            open=Decimal("100"),
+            high=Decimal("101"),
+            low=Decimal("99"),
+            close=Decimal("100"),
+            volume=Decimal("1"),
+            symbol="BTCUSDT",
+        )
+        
+        for _ in range(2):
+            config = StrategyConfig(name="t", description="t", max_risk_per_trade=0.02)
+            strategy.decide([candle], TechnicalIndicators(rsi=50.0), {}, config)
+        
+        assert len(compiles) == 1
+    
+    @pytest.mark.parametrize("side", ["BUY", "SELL"])
+    def test_order_levels_match_base_helpers(self, strategy, side):
+        """Test that fused price levels and size match the BaseStrategy helpers."""
+        candle = OHLCVData(
+            timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            open=Decimal("100"),
+            high=Decimal("106"),
+            low=Decimal("94"),
+            close=Decimal("105") if side == "BUY" else Decimal("95"),
+            volume=Decimal("5"),
+            symbol="BTCUSDT",
+        )
+        if side == "BUY":
+            indicators = TechnicalIndicators(rsi=25.0, sma_20=101.0, ema_20=100.0)
+            signals = {"trend": "bullish", "momentum": "strong", "volatility_regime": "low"}
+        else:
+            indicators = TechnicalIndicators(rsi=75.0, sma_20=99.0, ema_20=100.0)
+            signals = {"trend": "bearish", "momentum": "weak"}
+        config = StrategyConfig(name="t", description="t", min_confidence=0.5, stop_loss_pct=0.03)
+        
+        decision = strategy.decide([candle], indicators, signals, config)
+        
+        price = float(candle.close)
+        stop_loss = strategy.calculate_stop_loss(price, side, config.stop_loss_pct)
+        assert decision.action == side
+        assert decision.stop_loss == Decimal(str(stop_loss))
+        assert decision.take_profit == Decimal(str(strategy.calculate_take_profit(price, side, config.take_profit_pct)))
+        assert decision.quantity == Decimal(
+            str(strategy.calculate_position_size(10000.0, price, stop_loss, config.max_risk_per_trade))
+        )
+        assert decision.reasoning.startswith(f"{side}: ")
+    
+    def test_decide_batch_matches_kernel(self, strategy):
+        """Test that the vectorized scoring agrees with the per-tick kernel."""
+        nan = float("nan")
+        close = np.array([105.0, 95.0, 100.0, 100.0])
+        rsi = np.array([25.0, 75.0, nan, 50.0])
+        sma_20 = np.array([101.0, 99.0, nan, 100.0])
+        ema_20 = np.array([100.0, 100.0, nan, 100.0])
+        trend = np.array([TREND_BULLISH, TREND_BEARISH, TREND_BULLISH, 0])
+        momentum = np.array([MOMENTUM_STRONG, 0, 0, 0])
+        volatility = np.array([0, VOLATILITY_HIGH, 0, 0])
+        
+        signals = strategy.decide_batch(close, rsi, sma_20, ema_20, trend, momentum, volatility)
+        
+        expected = []
+        for i in range(len(close)):
+            _, code, _ = score_signals(rsi[i], sma_20[i], ema_20[i], close[i], trend[i], momentum[i], volatility[i])
+            expected.append(1 if code == SIGNAL_BUY else -1 if code == SIGNAL_SELL else 0)
+        assert signals.dtype == np.int8
+        assert signals.tolist() == expected == [1, -1, 0, 0]